@@ -0,0 +1,227 @@
+#!/usr/bin/env python
+# coding: utf-8
+'''
+Created on 2026-10-16
+
+@author:
+'''
+
+import asyncio
+import collections
+import time
+
+from OPTCamera import *
+
+
+class StreamFrame:
+    """
+    AsyncOptCamera 送到事件循环中的一帧，image 来自相机的缓存池，用完后调用 release() 归还。
+    arrival 为工作线程转码完成的时刻，lag 为事件循环取到该帧时已经等待的时间（秒）。
+    """
+    __slots__ = ("camera", "image", "blockId", "timeStamp", "arrival", "lag")
+
+    def __init__(self, camera, image, blockId, timeStamp, arrival):
+        self.camera = camera
+        self.image = image
+        self.blockId = blockId
+        self.timeStamp = timeStamp
+        self.arrival = arrival
+        self.lag = 0.0
+
+    def release(self):
+        if self.image is not None:
+            self.camera.release_image(self.image)
+            self.image = None
+
+
+class AsyncOptCamera:
+    """
+    OptCamera 的 asyncio 封装。相机工作在回调模式，工作线程转码完成后通过 call_soon_threadsafe
+    把帧送入事件循环中的有界队列，事件循环中不会阻塞在 getFrame 上。
+    队列满时丢弃最旧的一帧，dropped 计数；lag 统计帧从转码完成到被消费者取走的延迟。只支持一个消费者。
+    start() 把相机缓存池加深到 queueSize + workers + 1，并在运行期间把 drop_oldest 改为 grow，队列中的帧不会被回收改写。
+
+        async with AsyncOptCamera(OptCamera(index, camera_info)) as cam:
+            async for frame in cam.frames():
+                process(frame.image)     # 进入下一次循环时自动归还
+
+            image = await cam.get_image()
+            cam.release_image(image)
+    """
+    def __init__(self, camera, queueSize=4, workers=1):
+        self.camera = camera
+        self.queueSize = queueSize
+        self.workers = workers
+        self._loop = None
+        self._queue = collections.deque()
+        self._waiter = None
+        self._running = False
+        self._poolPolicy = None
+
+        # 统计信息
+        # statistics
+        self.received = 0
+        self.dropped = 0
+        self.delivered = 0
+        self.lagLast = 0.0
+        self.lagMax = 0.0
+        self.lagSum = 0.0
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, excType, excValue, traceback):
+        await self.stop()
+        return False
+
+    # 在事件循环中调用，切换相机为回调模式
+    # call from inside the event loop, puts the camera into callback mode
+    async def start(self):
+        if self._running:
+            return 0
+        self._loop = asyncio.get_running_loop()
+        # 队列中的帧、消费者手中的一帧和每个工作线程正在转码的一帧各占一块缓存；
+        # drop_oldest 会回收仍在队列中的帧，运行期间改为 grow
+        # every queued frame, the one the consumer holds and one per worker thread take a pool buffer;
+        # drop_oldest would reclaim frames still in the queue, so it runs as grow meanwhile
+        pool = self.camera.framePool
+        pool.reserve(self.queueSize + self.workers + 1)
+        self._poolPolicy = pool.policy
+        if pool.policy == POOL_POLICY_DROP_OLDEST:
+            pool.policy = POOL_POLICY_GROW
+        self._running = True
+        nRet = self.camera.start_callback(self.workers, consumer=self._onImage)
+        if nRet != 0:
+            self._running = False
+            pool.policy = self._poolPolicy
+            return -1
+        return 0
+
+    async def stop(self):
+        if not self._running:
+            return 0
+        self._running = False
+        # stop_callback 需要等待工作线程退出，放到线程池中执行
+        # stop_callback joins the worker threads, run it off the loop
+        nRet = await self._loop.run_in_executor(None, self.camera.stop_callback)
+        while self._queue:
+            self._queue.popleft().release()
+        self.camera.framePool.policy = self._poolPolicy
+        self._wake()
+        return nRet
+
+    # 工作线程中执行：只把帧交给事件循环
+    # runs on a worker thread: hand the frame over to the loop and nothing else
+    def _onImage(self, image, blockId, timeStamp):
+        frame = StreamFrame(self.camera, image, blockId, timeStamp, time.perf_counter())
+        try:
+            self._loop.call_soon_threadsafe(self._enqueue, frame)
+        except RuntimeError:
+            # 事件循环已关闭
+            # the loop is closed already
+            frame.release()
+
+    def _enqueue(self, frame):
+        if not self._running:
+            frame.release()
+            return
+        self.received += 1
+        if len(self._queue) >= self.queueSize:
+            self._queue.popleft().release()
+            self.dropped += 1
+        self._queue.append(frame)
+        self._wake()
+
+    def _wake(self):
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    # 取队列中最早的一帧，超时返回 None
+    # oldest queued frame, None on timeout or once the camera stopped
+    async def get_frame(self, timeout=None):
+        deadline = None if timeout is None else self._loop.time() + timeout
+        while not self._queue:
+            if not self._running:
+                return None
+            self._waiter = self._loop.create_future()
+            try:
+                if deadline is None:
+                    await self._waiter
+                else:
+                    await asyncio.wait_for(self._waiter, max(0.0, deadline - self._loop.time()))
+            except asyncio.TimeoutError:
+                return None
+            finally:
+                self._waiter = None
+
+        frame = self._queue.popleft()
+        frame.lag = time.perf_counter() - frame.arrival
+        self.delivered += 1
+        self.lagLast = frame.lag
+        self.lagSum += frame.lag
+        if frame.lag > self.lagMax:
+            self.lagMax = frame.lag
+        return frame
+
+    # 与 OptCamera.get_image 对应，返回的图像用完后调用 release_image() 归还
+    # counterpart of OptCamera.get_image, give the image back with release_image()
+    async def get_image(self, timeout=None):
+        frame = await self.get_frame(timeout)
+        if frame is None:
+            return None
+        return frame.image
+
+    def release_image(self, image):
+        self.camera.release_image(image)
+
+    # 逐帧迭代，进入下一次迭代（或退出循环）时自动归还上一帧
+    # iterate frame by frame, each frame is released when the loop moves on or exits
+    async def frames(self, timeout=None):
+        while self._running:
+            frame = await self.get_frame(timeout)
+            if frame is None:
+                if timeout is not None:
+                    continue
+                return
+            try:
+                yield frame
+            finally:
+                frame.release()
+
+    # 消费侧统计：队列深度、丢帧数、延迟（秒）
+    # consumer side statistics: queue depth, drops and lag in seconds
+    def stats(self):
+        return {
+            "queued": len(self._queue),
+            "received": self.received,
+            "dropped": self.dropped,
+            "delivered": self.delivered,
+            "callbackDropped": self.camera.droppedFrames,
+            "lagLast": self.lagLast,
+            "lagMean": self.lagSum / self.delivered if self.delivered else 0.0,
+            "lagMax": self.lagMax,
+        }
+
+
+if __name__ == '__main__':
+
+    async def main():
+        cameraCnt, cameras_info = enumCameras()
+        if cameraCnt is None:
+            print("Can't find camera")
+            return
+
+        cam = AsyncOptCamera(OptCamera(0, cameras_info[0]))
+        async with cam:
+            count = 0
+            async for frame in cam.frames(timeout=1.0):
+                print("BlockId = [%d] lag: %.3f ms" % (frame.blockId, frame.lag * 1000))
+                count += 1
+                if count >= 100:
+                    break
+            print("stats: %s" % cam.stats())
+        cam.camera.stop_grabbing()
+        print("--------- Demo end ---------")
+
+    asyncio.run(main())
@@ -0,0 +1,410 @@
+#!/usr/bin/env python
+# coding: utf-8
+'''
+Created on 2026-10-17
+
+@author:
+'''
+
+import collections
+import sys
+import threading
+import time
+
+from OPTCamera import *
+from SDKUtil import createEventSubscribe
+from StreamMonitor import readStreamStats
+
+# 未指定链路速率且无法从系统读取时使用的值（bit/s）
+# link speed in bit/s used when none is given and the system does not report one
+DEFAULT_LINK_SPEED = 1e9
+
+# GevSCPSPacketSize 中 IP/UDP/GVSP 头的字节数；每个包在线路上另外占用的以太网头、FCS、前导码和帧间隙；
+# 每帧 leader/trailer 两个最小包在线路上的字节数
+# bytes of IP/UDP/GVSP headers inside GevSCPSPacketSize; Ethernet header, FCS, preamble and inter-frame gap
+# added on the wire to every packet; wire bytes of the leader and trailer packets of a frame
+_GVSP_HEADER = 36
+_ETHERNET_FRAMING = 38
+_LEADER_TRAILER = 2 * 84
+
+# 这些属性更新后需要重新分配带宽
+# updates of these properties trigger a rebalance
+_REBALANCE_PARAMS = frozenset((b"Width", b"Height", b"PixelFormat", b"BinningHorizontal", b"BinningVertical",
+                               b"PayloadSize", b"GevSCPSPacketSize"))
+
+
+# 相机所接的网卡 (getInterfaceName, 网卡 IP)；GigE 相机通过 GENICAM_GigEInterface 取得 IP，取不到时为 None
+# the NIC of a camera as (getInterfaceName, NIC address); the address comes from GENICAM_GigEInterface, None if unknown
+def cameraInterface(camera):
+    name = camera.getInterfaceName(camera)
+    name = name.decode() if isinstance(name, bytes) else str(name)
+    if camera.getType(camera) != GENICAM_EProtocolType.typeGigE:
+        return name, None
+
+    gigEInterface = pointer(GENICAM_GigEInterface())
+    gigEInterfaceInfo = GENICAM_GigEInterfaceInfo()
+    gigEInterfaceInfo.pCamera = pointer(camera)
+    nRet = GENICAM_createGigEInterface(byref(gigEInterfaceInfo), byref(gigEInterface))
+    if nRet != 0:
+        print("create GigEInterface fail!")
+        return name, None
+    address = gigEInterface.contents.getIpAddress(gigEInterface)
+    # 不再使用时，需释放相关资源
+    # release interface resource at the end of use
+    gigEInterface.contents.release(gigEInterface)
+    return name, address.decode() if address else None
+
+
+# 系统报告的网卡链路速率（bit/s），Linux 下读取 /sys/class/net/<网卡>/speed，读不到返回 None
+# link speed in bit/s reported by the system (/sys/class/net/<nic>/speed on Linux), None when unknown
+def systemLinkSpeed(name):
+    try:
+        with open("/sys/class/net/%s/speed" % name) as f:
+            speed = int(f.read().strip())
+    except (OSError, ValueError):
+        return None
+    return speed * 1e6 if speed > 0 else None
+
+
+class _Member:
+    """
+    一个被调度的相机：请求的帧率、一帧在线路上占用的位数以及分配结果。
+    """
+    def __init__(self, camera, nic, address, requestedFps, originalDelay):
+        self.camera = camera
+        self.nic = nic
+        self.address = address
+        self.requestedFps = requestedFps
+        self.originalDelay = originalDelay
+        self.payloadSize = None
+        self.packetSize = None
+        self.frameBits = None
+        self.allocated = 0.0
+        self.fps = None
+        self.delay = None
+        self.paramUpdateCallback = None
+
+    @property
+    def demand(self):
+        return self.frameBits * self.requestedFps if self.frameBits else 0.0
+
+
+class BandwidthScheduler:
+    """
+    共用网卡的 GigE 相机的带宽调度：按 getInterfaceName / GENICAM_GigEInterface 把相机按网卡分组，
+    由 PayloadSize、GevSCPSPacketSize 和请求的帧率算出每个相机在线路上的带宽，使每块网卡的总带宽
+    不超过 fraction × 链路速率。超出时按最大-最小公平分配（需求小的相机先满足，其余平分剩下的带宽）
+    并降低 AcquisitionFrameRate；GevSCPD（纳秒）按各相机分到的份额拉开包间隔，所有相机同时突发时总速率也不超过上限。
+
+    add()/remove()/setRequestedFps() 立即重新分配所在网卡；start() 之后 ROI、像素格式、包长等参数的更新
+    通过参数更新事件在后台线程中触发重新分配。链路速率依次取 linkSpeed（数值，或 {网卡名: bit/s}）、
+    /sys/class/net/<网卡>/speed 和 DEFAULT_LINK_SPEED。
+
+        scheduler = BandwidthScheduler(fraction=0.8, linkSpeed=10e9)
+        for camera in cameras:
+            scheduler.add(camera)          # OptCamera，请求的帧率默认为当前的 AcquisitionFrameRate
+        scheduler.start()
+        scheduler.plan()                   # {网卡: {"budget": ..., "demand": ..., "cameras": {...}}}
+    """
+    def __init__(self, fraction=0.9, linkSpeed=None):
+        self.fraction = fraction
+        self.linkSpeed = linkSpeed
+        self._lock = threading.RLock()
+        self._members = collections.OrderedDict()
+        # 参数更新回调只往 _dirty 中加入网卡名，由调度线程取出处理
+        # the parameter update callback only adds NIC names to _dirty, the scheduler thread takes them out
+        self._dirty = set()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _subscribe(self, member, subscribe):
+        eventSubscribe = createEventSubscribe(member.camera.camera)
+        if eventSubscribe is None:
+            return -1
+
+        if subscribe:
+            nRet = eventSubscribe.contents.subscribeParamUpdateEx(eventSubscribe, member.paramUpdateCallback, None)
+        else:
+            nRet = eventSubscribe.contents.unsubscribeParamUpdateEx(eventSubscribe, member.paramUpdateCallback, None)
+        # 不再使用时，需释放相关资源
+        # release subscribe resource at the end of use
+        eventSubscribe.contents.release(eventSubscribe)
+        if nRet != 0:
+            print("%s fail!" % ("subscribeParamUpdateEx" if subscribe else "unsubscribeParamUpdateEx"))
+            return -1
+        return 0
+
+    # 加入一个相机（OptCamera）并重新分配其网卡；fps 为请求的帧率，为空时取当前的 AcquisitionFrameRate
+    # add a camera (OptCamera) and rebalance its NIC; fps is the requested frame rate, the current
+    # AcquisitionFrameRate when not given
+    def add(self, camera, fps=None):
+        nic, address = cameraInterface(camera.camera)
+        if fps is None:
+            fps = camera.nodeCache.getValue(NODE_DOUBLE, b"AcquisitionFrameRate")
+            if fps is None:
+                return -1
+        member = _Member(camera, nic, address, fps, camera.nodeCache.getValue(NODE_INT, b"GevSCPD"))
+        member.paramUpdateCallback = paramUpdateCallBackEx(
+            lambda paramUpdateArg, userInfo: self._onParamUpdate(member, paramUpdateArg))
+        if self._subscribe(member, True) != 0:
+            print("camera [%d] ROI changes will not trigger a rebalance" % camera.index)
+            member.paramUpdateCallback = None
+
+        with self._lock:
+            previous = self._members.pop(camera.index, None)
+            if previous is not None and previous.paramUpdateCallback is not None:
+                self._subscribe(previous, False)
+            self._members[camera.index] = member
+            return self.rebalance(nic)
+
+    # 移除一个相机并重新分配其网卡；restore 为 True 时恢复请求的帧率和加入前的 GevSCPD
+    # remove a camera and rebalance its NIC; restore puts back the requested frame rate and the original GevSCPD
+    def remove(self, camera, restore=True):
+        with self._lock:
+            member = self._members.pop(camera.index, None)
+            if member is None:
+                return 0
+            if member.paramUpdateCallback is not None:
+                self._subscribe(member, False)
+            if restore:
+                self._apply(member, member.requestedFps, member.originalDelay)
+            return self.rebalance(member.nic)
+
+    def setRequestedFps(self, camera, fps):
+        with self._lock:
+            member = self._members.get(camera.index)
+            if member is None:
+                return -1
+            member.requestedFps = fps
+            return self.rebalance(member.nic)
+
+    # 参数更新回调，在 SDK 事件线程中执行，只做标记
+    # parameter update callback, runs on the SDK event thread and only flags the NIC
+    def _onParamUpdate(self, member, paramUpdateArg):
+        arg = paramUpdateArg.contents
+        count = min(arg.referenceParamCnt, MAX_PARAM_CNT)
+        for i in range(count):
+            if arg.paramNames[i].value in _REBALANCE_PARAMS:
+                self._dirty.add(member.nic)
+                self._wake.set()
+                return
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="BandwidthScheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._wake.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        while True:
+            self._wake.wait()
+            # 稍等片刻，把一次设置宽、高、偏移产生的多个更新合并为一次重新分配
+            # wait a little so that setting width, height and offsets in a row rebalances once
+            if self._stop.wait(0.05):
+                return
+            self._wake.clear()
+            while self._dirty:
+                self.rebalance(self._dirty.pop())
+
+    def nicLinkSpeed(self, nic):
+        linkSpeed = self.linkSpeed
+        if isinstance(linkSpeed, dict):
+            linkSpeed = linkSpeed.get(nic)
+        if linkSpeed is None:
+            linkSpeed = systemLinkSpeed(nic)
+        return float(linkSpeed) if linkSpeed is not None else DEFAULT_LINK_SPEED
+
+    # 重新分配指定网卡（为空时全部网卡）上的带宽，全部成功返回 0
+    # rebalance one NIC, or every NIC when not given; 0 when everything was applied
+    def rebalance(self, nic=None):
+        with self._lock:
+            groups = collections.OrderedDict()
+            for member in self._members.values():
+                if nic is None or member.nic == nic:
+                    groups.setdefault(member.nic, []).append(member)
+            nRet = 0
+            for name, members in groups.items():
+                if self._rebalanceNic(name, members) != 0:
+                    nRet = -1
+            return nRet
+
+    def _rebalanceNic(self, nic, members):
+        nRet = 0
+        linkSpeed = self.nicLinkSpeed(nic)
+        budget = self.fraction * linkSpeed
+        active = []
+        for member in members:
+            if self._measure(member) == 0:
+                active.append(member)
+            else:
+                nRet = -1
+
+        # 最大-最小公平：按需求从小到大，每个相机最多分到剩余带宽的平均值
+        # max-min fairness: smallest demand first, each camera gets at most an even split of what is left
+        remaining = budget
+        ordered = sorted(active, key=lambda member: member.demand)
+        for i, member in enumerate(ordered):
+            member.allocated = min(member.demand, remaining / (len(ordered) - i))
+            remaining -= member.allocated
+
+        total = sum(member.allocated for member in active)
+        for member in active:
+            fps = min(member.requestedFps, member.allocated / member.frameBits)
+            # 节点最小帧率仍超出分到的带宽时，_apply 只能设为最小帧率
+            # when even the node minimum exceeds the allocation, _apply can only go down to the minimum
+            minFps = self._fpsValue(member.camera, fps)
+            if minFps > fps and fps < member.requestedFps:
+                print("camera [%d] can't go below %.2f fps, %s budget exceeded by %.1f Mb/s"
+                      % (member.camera.index, minFps, nic, (minFps - fps) * member.frameBits / 1e6))
+            # 突发速率：budget 按分到的带宽比例分给各相机，不低于分到的平均带宽
+            # burst rate: the budget split in proportion to the allocations, never below the allocation itself
+            burst = budget * member.allocated / total if total > 0 else budget
+            # 没有分到带宽（请求 0 fps 或预算已用完）时不改 GevSCPD，帧率已经限制了带宽
+            # nothing allocated (0 fps requested or the budget is used up): leave GevSCPD, the frame rate limits it
+            delay = None
+            if burst > 0:
+                packetBits = (member.packetSize + _ETHERNET_FRAMING) * 8.0
+                delay = max(0.0, packetBits / burst - packetBits / linkSpeed) * 1e9
+            if self._apply(member, fps, delay) != 0:
+                nRet = -1
+        return nRet
+
+    # 读取一帧的大小和包长，算出一帧在线路上占用的位数
+    # read the payload and packet sizes and work out the wire bits of one frame
+    def _measure(self, member):
+        nodeCache = member.camera.nodeCache
+        payloadSize = nodeCache.getValue(NODE_INT, b"PayloadSize")
+        packetSize = nodeCache.getValue(NODE_INT, b"GevSCPSPacketSize")
+        if payloadSize is None or packetSize is None or packetSize <= _GVSP_HEADER:
+            return -1
+        packets = -(-payloadSize // (packetSize - _GVSP_HEADER))
+        member.payloadSize = payloadSize
+        member.packetSize = packetSize
+        member.frameBits = (packets * (packetSize + _ETHERNET_FRAMING) + _LEADER_TRAILER) * 8
+        return 0
+
+    # GevSCPD 按节点步长向上取整并限制在范围内
+    # round GevSCPD up to the node increment and clamp it to the node range
+    def _delayValue(self, camera, delay):
+        node = camera.nodeCache.get(NODE_INT, b"GevSCPD")
+        delay = int(-(-delay // 1))
+        if node is None:
+            return delay
+        minValue, maxValue, increment = c_longlong(), c_longlong(), c_longlong()
+        if node.contents.getMinVal(node, byref(minValue)) != 0 or \
+                node.contents.getMaxVal(node, byref(maxValue)) != 0 or \
+                node.contents.getIncrement(node, byref(increment)) != 0:
+            return delay
+        step = max(1, increment.value)
+        delay = minValue.value + -(-(max(delay, minValue.value) - minValue.value) // step) * step
+        return min(delay, maxValue.value)
+
+    # 帧率限制在 AcquisitionFrameRate 节点的范围内
+    # clamp the frame rate to the AcquisitionFrameRate node range
+    def _fpsValue(self, camera, fps):
+        node = camera.nodeCache.get(NODE_DOUBLE, b"AcquisitionFrameRate")
+        if node is None:
+            return fps
+        minValue, maxValue = c_double(), c_double()
+        if node.contents.getMinVal(node, byref(minValue)) != 0 or \
+                node.contents.getMaxVal(node, byref(maxValue)) != 0:
+            return fps
+        return min(max(fps, minValue.value), maxValue.value)
+
+    def _apply(self, member, fps, delay):
+        camera = member.camera
+        nRet = 0
+        if delay is not None:
+            delay = self._delayValue(camera, delay)
+            if delay != member.delay:
+                if camera.setIntValue(b"GevSCPD", delay) == 0:
+                    member.delay = delay
+                else:
+                    nRet = -1
+        fps = self._fpsValue(camera, fps)
+        if fps != member.fps:
+            if camera.setValue(NODE_BOOL, b"AcquisitionFrameRateEnable", True) == 0 and \
+                    camera.setValue(NODE_DOUBLE, b"AcquisitionFrameRate", fps) == 0:
+                member.fps = fps
+            else:
+                nRet = -1
+        return nRet
+
+    # 当前的分配结果 {网卡: {...}}，带宽单位为 bit/s
+    # the current plan as {nic: {...}}, bandwidths in bit/s
+    def plan(self):
+        with self._lock:
+            plan = collections.OrderedDict()
+            for member in self._members.values():
+                nic = plan.get(member.nic)
+                if nic is None:
+                    linkSpeed = self.nicLinkSpeed(member.nic)
+                    nic = plan[member.nic] = {"address": member.address, "linkSpeed": linkSpeed,
+                                              "budget": self.fraction * linkSpeed, "demand": 0.0,
+                                              "allocated": 0.0, "cameras": collections.OrderedDict()}
+                nic["demand"] += member.demand
+                nic["allocated"] += member.allocated
+                nic["cameras"][member.camera.index] = {
+                    "payloadSize": member.payloadSize,
+                    "packetSize": member.packetSize,
+                    "requestedFps": member.requestedFps,
+                    "fps": member.fps,
+                    "GevSCPD": member.delay,
+                    "demand": member.demand,
+                    "allocated": member.allocated,
+                }
+            return plan
+
+
+def printPlan(plan):
+    for nic, info in plan.items():
+        print("%s (%s): link %.2f Gb/s, budget %.2f Gb/s, demand %.2f Gb/s, allocated %.2f Gb/s" % (
+            nic, info["address"], info["linkSpeed"] / 1e9, info["budget"] / 1e9, info["demand"] / 1e9,
+            info["allocated"] / 1e9))
+        for index, camera in info["cameras"].items():
+            print("    camera [%d] payload %s, fps %.2f -> %.2f, GevSCPD %s, %.1f Mb/s" % (
+                index, camera["payloadSize"], camera["requestedFps"], camera["fps"] or 0.0, camera["GevSCPD"],
+                camera["allocated"] / 1e6))
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="share the link bandwidth of every NIC between its GigE cameras")
+    parser.add_argument("--fraction", type=float, default=0.9, help="fraction of the link capacity to use")
+    parser.add_argument("--link-speed", type=float, default=None, help="link speed of every NIC in Gb/s")
+    parser.add_argument("--fps", type=float, default=None, help="requested frame rate, current value by default")
+    parser.add_argument("--seconds", type=float, default=5.0, help="grab for this long and report the frame rates")
+    args = parser.parse_args()
+
+    cameraCnt, cameraList = enumCameras()
+    if cameraCnt is None:
+        print("Can't find camera")
+        sys.exit(1)
+
+    cameras = [OptCamera(index, cameraList[index], mode=ACQ_MODE_THREAD) for index in range(cameraCnt)]
+    scheduler = BandwidthScheduler(args.fraction, args.link_speed * 1e9 if args.link_speed else None)
+    for camera in cameras:
+        scheduler.add(camera, args.fps)
+    scheduler.start()
+    printPlan(scheduler.plan())
+
+    time.sleep(args.seconds)
+    for camera in cameras:
+        stats = readStreamStats(camera.streamSource)
+        if stats is not None:
+            print("camera [%d] fps %.2f, bandwidth %.2f" % (camera.index, stats["fps"], stats["bandwidth"]))
+    scheduler.stop()
+    for camera in cameras:
+        scheduler.remove(camera)
+        camera.stop_grabbing()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+# coding: utf-8
+'''
+Created on 2026-10-16
+
+@author:
+'''
+
+import time
+
+from NodeCache import *
+from ParamCache import ParamCache
+
+# 参数写入阶段，按顺序执行：像素格式/合并会改变 WidthMax，需先于几何尺寸；触发先于曝光
+# write stages in order: pixel format and binning change WidthMax so they precede geometry,
+# trigger setup precedes exposure
+CONFIG_STAGE_FORMAT = "format"
+CONFIG_STAGE_GEOMETRY = "geometry"
+CONFIG_STAGE_TRIGGER = "trigger"
+CONFIG_STAGE_EXPOSURE = "exposure"
+CONFIG_STAGE_OTHER = "other"
+
+CONFIG_STAGES = (CONFIG_STAGE_FORMAT, CONFIG_STAGE_GEOMETRY, CONFIG_STAGE_TRIGGER,
+                 CONFIG_STAGE_EXPOSURE, CONFIG_STAGE_OTHER)
+
+# 停止拉流后才能修改的阶段
+# stages that need grabbing stopped
+_STREAM_LOCKED_STAGES = (CONFIG_STAGE_FORMAT, CONFIG_STAGE_GEOMETRY)
+
+# 属性名 => (阶段, 节点类型)，同一阶段内按表中顺序写入；表中没有的属性按值的类型推断节点类型，最后写入
+# attribute => (stage, node kind), written in table order inside a stage; unknown attributes
+# get their node kind from the value type and are written last
+CONFIG_NODES = {
+    b"PixelFormat": (CONFIG_STAGE_FORMAT, NODE_ENUM),
+    b"BinningHorizontal": (CONFIG_STAGE_FORMAT, NODE_INT),
+    b"BinningVertical": (CONFIG_STAGE_FORMAT, NODE_INT),
+    b"ReverseX": (CONFIG_STAGE_FORMAT, NODE_BOOL),
+    b"ReverseY": (CONFIG_STAGE_FORMAT, NODE_BOOL),
+    b"Width": (CONFIG_STAGE_GEOMETRY, NODE_INT),
+    b"OffsetX": (CONFIG_STAGE_GEOMETRY, NODE_INT),
+    b"Height": (CONFIG_STAGE_GEOMETRY, NODE_INT),
+    b"OffsetY": (CONFIG_STAGE_GEOMETRY, NODE_INT),
+    b"TriggerSelector": (CONFIG_STAGE_TRIGGER, NODE_ENUM),
+    b"TriggerMode": (CONFIG_STAGE_TRIGGER, NODE_ENUM),
+    b"TriggerSource": (CONFIG_STAGE_TRIGGER, NODE_ENUM),
+    b"TriggerActivation": (CONFIG_STAGE_TRIGGER, NODE_ENUM),
+    b"TriggerDelay": (CONFIG_STAGE_TRIGGER, NODE_DOUBLE),
+    b"ExposureAuto": (CONFIG_STAGE_EXPOSURE, NODE_ENUM),
+    b"ExposureTime": (CONFIG_STAGE_EXPOSURE, NODE_DOUBLE),
+    b"GainAuto": (CONFIG_STAGE_EXPOSURE, NODE_ENUM),
+    b"GainRaw": (CONFIG_STAGE_EXPOSURE, NODE_DOUBLE),
+    b"AcquisitionFrameRate": (CONFIG_STAGE_EXPOSURE, NODE_DOUBLE),
+}
+
+# 尺寸与偏移：尺寸缩小时先写尺寸再写偏移，否则先写偏移，避免 Offset + Width 超过最大值
+# size and offset pairs: a shrinking size goes before its offset, otherwise the offset goes first,
+# so Offset + Width never exceeds the maximum in between
+_GEOMETRY_PAIRS = ((b"Width", b"OffsetX"), (b"Height", b"OffsetY"))
+
+# 写入结果
+# write results
+CONFIG_SET = "set"
+CONFIG_SKIP = "skip"
+CONFIG_FAIL = "fail"
+
+
+def _toBytes(value):
+    return value.encode() if isinstance(value, str) else value
+
+
+# 表中没有的属性按值的类型推断节点类型
+# node kind of an attribute missing from the table, from the type of its value
+def _guessKind(value):
+    if isinstance(value, bool):
+        return NODE_BOOL
+    if isinstance(value, int):
+        return NODE_INT
+    if isinstance(value, float):
+        return NODE_DOUBLE
+    return NODE_ENUM
+
+
+def _sameValue(kind, current, value):
+    if current is None:
+        return False
+    if kind == NODE_DOUBLE:
+        return abs(current - value) <= 1e-6 * max(1.0, abs(value))
+    if kind == NODE_BOOL:
+        return bool(current) == bool(value)
+    return current == value
+
+
+# 按阶段整理参数：返回 [(阶段, [(属性名, 节点类型, 值), ...]), ...]
+# group the config by stage: [(stage, [(attribute, kind, value), ...]), ...]
+def planConfig(config):
+    stages = dict((stage, []) for stage in CONFIG_STAGES)
+    order = dict((attrName, i) for i, attrName in enumerate(CONFIG_NODES))
+    for attrName, value in config.items():
+        attrName = _toBytes(attrName)
+        value = _toBytes(value)
+        if attrName in CONFIG_NODES:
+            stage, kind = CONFIG_NODES[attrName]
+        else:
+            stage, kind = CONFIG_STAGE_OTHER, _guessKind(value)
+        stages[stage].append((attrName, kind, value))
+    for stage in CONFIG_STAGES:
+        stages[stage].sort(key=lambda item: order.get(item[0], len(order)))
+    return [(stage, stages[stage]) for stage in CONFIG_STAGES if stages[stage]]
+
+
+# 直接从设备读取：合并/像素格式的写入不会让 ParamCache 中的 Width/Height 失效
+# read from the device: binning/format writes do not invalidate Width/Height cached by a ParamCache
+def _readDevice(nodeCache, kind, attrName):
+    if isinstance(nodeCache, ParamCache):
+        nodeCache.invalidate([attrName])
+        nodeCache = nodeCache.nodeCache
+    return nodeCache.getValue(kind, attrName)
+
+
+def _orderGeometry(items, current):
+    values = dict((attrName, value) for attrName, kind, value in items)
+    ordered = []
+    for size, offset in _GEOMETRY_PAIRS:
+        pair = [size, offset]
+        if size in values and current.get(size) is not None and values[size] >= current[size]:
+            pair = [offset, size]
+        ordered.extend(attrName for attrName in pair if attrName in values)
+    return [(attrName, NODE_INT, values[attrName]) for attrName in ordered]
+
+
+# 依次写入配置，值未变化的属性跳过；像素格式/几何尺寸有变化时由 stopGrabbing/startGrabbing 包住，
+# 返回 (nRet, timings)，timings 为 [(属性名, set/skip/fail, 耗时秒), ...]
+# apply a config stage by stage, skipping attributes already at their value; format/geometry writes run
+# with grabbing stopped. Returns (nRet, timings) with timings as [(attribute, set/skip/fail, seconds), ...]
+def applyConfig(nodeCache, config, stopGrabbing=None, startGrabbing=None):
+    timings = []
+
+    # 先读当前值，确定需要写入的属性；像素格式/合并有写入时几何尺寸的范围和当前值都会变化，
+    # 几何尺寸是否跳过要等这些写入之后再判断
+    # read the current values first to find what actually needs a write; format/binning writes change
+    # the geometry limits and current values, so the geometry skips are decided after those writes
+    current = {}
+    pending = []
+    formatPending = False
+    for stage, items in planConfig(config):
+        deferred = stage == CONFIG_STAGE_GEOMETRY and formatPending
+        writes = []
+        for attrName, kind, value in items:
+            if deferred:
+                writes.append((attrName, kind, value))
+                continue
+            start = time.perf_counter()
+            current[attrName] = nodeCache.getValue(kind, attrName)
+            if _sameValue(kind, current[attrName], value):
+                timings.append((attrName.decode(), CONFIG_SKIP, time.perf_counter() - start))
+            else:
+                writes.append((attrName, kind, value))
+        if writes:
+            pending.append((stage, writes))
+            formatPending = formatPending or stage == CONFIG_STAGE_FORMAT
+    streamLocked = any(stage in _STREAM_LOCKED_STAGES for stage, items in pending)
+
+    if streamLocked and stopGrabbing is not None and stopGrabbing() != 0:
+        return -1, timings
+
+    nRet = 0
+    for stage, items in pending:
+        if stage == CONFIG_STAGE_GEOMETRY:
+            if formatPending:
+                # 像素格式/合并写入后从设备重新读取几何尺寸，再判断是否跳过
+                # geometry is read again from the device after the format/binning writes, then skips are decided
+                writes = []
+                for attrName, kind, value in items:
+                    start = time.perf_counter()
+                    current[attrName] = _readDevice(nodeCache, kind, attrName)
+                    if _sameValue(kind, current[attrName], value):
+                        timings.append((attrName.decode(), CONFIG_SKIP, time.perf_counter() - start))
+                    else:
+                        writes.append((attrName, kind, value))
+                items = writes
+            items = _orderGeometry(items, current)
+        for attrName, kind, value in items:
+            start = time.perf_counter()
+            if nodeCache.setValue(kind, attrName, value) != 0:
+                timings.append((attrName.decode(), CONFIG_FAIL, time.perf_counter() - start))
+                nRet = -1
+                break
+            timings.append((attrName.decode(), CONFIG_SET, time.perf_counter() - start))
+        if nRet != 0:
+            break
+
+    if streamLocked and startGrabbing is not None and startGrabbing() != 0:
+        nRet = -1
+    return nRet, timings
@@ -0,0 +1,286 @@
+#!/usr/bin/env python
+# coding: utf-8
+'''
+Created on 2026-10-16
+
+@author:
+'''
+
+import collections
+import threading
+import time
+
+from OPTCamera import *
+
+
+class GroupFrameSet:
+    """
+    一次同步触发得到的一组图像，images 与相机组中的相机一一对应。
+    fireSkew 为主机侧各相机 triggerSoftware 执行完成时刻的最大差值（ns），
+    timeStampSkew 为各相机图像时间戳的最大差值，仅在相机时钟同步（如 PTP）时有意义。
+    """
+    def __init__(self, group, seq, images, blockIds, timeStamps, fireTimes):
+        self.group = group
+        self.seq = seq
+        self.images = tuple(images)
+        self.blockIds = tuple(blockIds)
+        self.timeStamps = tuple(timeStamps)
+        self.fireSkew = max(fireTimes) - min(fireTimes)
+        self.timeStampSkew = max(timeStamps) - min(timeStamps)
+
+    # 图像缓存归还各相机的缓存池
+    # give every image back to its camera's frame pool
+    def release(self):
+        for camera, image in zip(self.group.cameras, self.images):
+            camera.release_image(image)
+
+
+class CameraGroup:
+    """
+    同步取图的相机组。arm() 把所有相机切换为软触发，capture() 尽量同时对所有相机执行 triggerSoftware，
+    再按触发序号取回每台相机对应的一帧，组成 GroupFrameSet 返回。
+
+        group = CameraGroup(camera_list)
+        group.arm()
+        frameSet = group.capture()
+        ...
+        frameSet.release()
+        group.disarm()
+
+    parallel=True 时每台相机一个触发线程，通过 Barrier 同时放行，适合相机较多、单次 execute 较慢的情况。
+    """
+    def __init__(self, cameras, timeout=1000, parallel=False):
+        self.cameras = list(cameras)
+        self.timeout = timeout
+        self.parallel = parallel
+        self.triggerSeq = 0
+        self.armed = False
+        # 最近若干组的触发偏差（ns）
+        # fire skew of the most recent sets in ns
+        self.skews = collections.deque(maxlen=1024)
+
+        self._acqCtrls = []
+        self._trigCmdNodes = []
+        # 已切换为软触发的相机（包括切换中途失败的），disarm 时恢复 TriggerMode Off
+        # cameras switched to software trigger (including a failed switch), put back to TriggerMode Off by disarm
+        self._triggered = []
+        self._blockBase = []
+        self._fireTimes = [0] * len(self.cameras)
+        self._fireThreads = []
+        self._startBarrier = None
+        self._doneBarrier = None
+
+    # 所有相机切换为软触发，并预先创建 triggerSoftware 节点
+    # switch every camera to software trigger and keep its triggerSoftware node ready
+    def arm(self):
+        if self.armed:
+            return 0
+        for camera in self.cameras:
+            if camera.mode != ACQ_MODE_POLL:
+                print("camera [%d] is in %s mode, stop it before arm!" % (camera.index, camera.mode))
+                self.disarm()
+                return -1
+
+            self._triggered.append(camera)
+            nRet = camera.setSoftTriggerConf()
+            if nRet != 0:
+                print("camera [%d] setSoftTriggerConf fail!" % camera.index)
+                self.disarm()
+                return -1
+
+            # 创建AcquisitionControl节点，触发时只调用 execute
+            # create AcquisitionControl node once, triggering only calls execute
+            acqCtrlInfo = GENICAM_AcquisitionControlInfo()
+            acqCtrlInfo.pCamera = pointer(camera.camera)
+            acqCtrl = pointer(GENICAM_AcquisitionControl())
+            nRet = GENICAM_createAcquisitionControl(pointer(acqCtrlInfo), byref(acqCtrl))
+            if nRet != 0:
+                print("create AcquisitionControl fail!")
+                self.disarm()
+                return -1
+            self._acqCtrls.append(acqCtrl)
+            self._trigCmdNodes.append(acqCtrl.contents.triggerSoftware(acqCtrl))
+
+            # 丢弃切换触发模式前残留的帧
+            # drop frames left over from free running
+            self._flush(camera)
+
+        self._blockBase = [None] * len(self.cameras)
+        self.triggerSeq = 0
+        if self.parallel:
+            self._startFireThreads()
+        self.armed = True
+        return 0
+
+    # 释放触发节点，相机恢复自由拉流
+    # release the trigger nodes and put every camera back to free running
+    def disarm(self):
+        self._stopFireThreads()
+        for trigSoftwareCmdNode in self._trigCmdNodes:
+            trigSoftwareCmdNode.release(byref(trigSoftwareCmdNode))
+        for acqCtrl in self._acqCtrls:
+            acqCtrl.contents.release(acqCtrl)
+        self._trigCmdNodes = []
+        self._acqCtrls = []
+
+        for camera in self._triggered:
+            self._setTriggerModeOff(camera)
+        self._triggered = []
+        self.armed = False
+        return 0
+
+    def _setTriggerModeOff(self, camera):
+        trigModeEnumNode = pointer(GENICAM_EnumNode())
+        trigModeEnumNodeInfo = GENICAM_EnumNodeInfo()
+        trigModeEnumNodeInfo.pCamera = pointer(camera.camera)
+        trigModeEnumNodeInfo.attrName = b"TriggerMode"
+        nRet = GENICAM_createEnumNode(byref(trigModeEnumNodeInfo), byref(trigModeEnumNode))
+        if nRet != 0:
+            print("create TriggerMode Node fail!")
+            return -1
+
+        nRet = trigModeEnumNode.contents.setValueBySymbol(trigModeEnumNode, b"Off")
+        trigModeEnumNode.contents.release(trigModeEnumNode)
+        if nRet != 0:
+            print("set TriggerMode value [Off] fail!")
+            return -1
+        return 0
+
+    def _flush(self, camera):
+        frame = pointer(GENICAM_Frame())
+        while camera.streamSource.contents.getFrame(camera.streamSource, byref(frame), c_uint(0)) == 0:
+            frame.contents.release(frame)
+
+    def _startFireThreads(self):
+        count = len(self.cameras)
+        self._startBarrier = threading.Barrier(count + 1)
+        self._doneBarrier = threading.Barrier(count + 1)
+        self._fireThreads = [threading.Thread(target=self._fireLoop, args=(i,), daemon=True,
+                                              name="CameraGroup-fire-%d" % i) for i in range(count)]
+        for thread in self._fireThreads:
+            thread.start()
+
+    def _stopFireThreads(self):
+        if not self._fireThreads:
+            return
+        self._startBarrier.abort()
+        for thread in self._fireThreads:
+            thread.join()
+        self._fireThreads = []
+
+    def _fireLoop(self, i):
+        trigSoftwareCmdNode = self._trigCmdNodes[i]
+        while True:
+            try:
+                self._startBarrier.wait()
+            except threading.BrokenBarrierError:
+                return
+            trigSoftwareCmdNode.execute(byref(trigSoftwareCmdNode))
+            self._fireTimes[i] = time.perf_counter_ns()
+            try:
+                self._doneBarrier.wait()
+            except threading.BrokenBarrierError:
+                return
+
+    # 对所有相机执行一次软触发，返回各相机触发完成的时刻（ns）
+    # execute triggerSoftware on every camera, returns the per-camera completion times in ns
+    def fire(self):
+        if self.parallel:
+            self._startBarrier.wait()
+            self._doneBarrier.wait()
+            return list(self._fireTimes)
+
+        fireTimes = []
+        for trigSoftwareCmdNode in self._trigCmdNodes:
+            nRet = trigSoftwareCmdNode.execute(byref(trigSoftwareCmdNode))
+            fireTimes.append(time.perf_counter_ns())
+            if nRet != 0:
+                print("Execute triggerSoftware fail!")
+        return fireTimes
+
+    # 同步触发并取回一组图像，失败返回 None
+    # trigger every camera and collect one matched set of images, None on failure
+    def capture(self, timeout=None):
+        if not self.armed:
+            print("camera group is not armed!")
+            return None
+        if timeout is None:
+            timeout = self.timeout
+
+        self.triggerSeq += 1
+        fireTimes = self.fire()
+
+        images = []
+        blockIds = []
+        timeStamps = []
+        for i, camera in enumerate(self.cameras):
+            optFrame = self._grabMatched(i, camera, timeout)
+            image = None
+            if optFrame is not None:
+                with optFrame:
+                    image = camera.framePool.acquire(optFrame.params.pixelForamt,
+                                                     optFrame.params.width, optFrame.params.height)
+                    if image is None:
+                        print("camera [%d] framePool exhausted!" % camera.index)
+                    elif optFrame.copy_to(image) is None:
+                        print("camera [%d] copy frame fail!" % camera.index)
+                        camera.framePool.release(image)
+                        image = None
+            # 取帧超时、缓存池耗尽或拷贝失败：这一路缺帧，归还已取到的图像
+            # timeout, exhausted pool or failed copy: this camera's slot is missing, give back what was taken
+            if image is None:
+                for image, owner in zip(images, self.cameras):
+                    owner.release_image(image)
+                return None
+            images.append(image)
+            blockIds.append(optFrame.blockId)
+            timeStamps.append(optFrame.timeStamp)
+
+        frameSet = GroupFrameSet(self, self.triggerSeq, images, blockIds, timeStamps, fireTimes)
+        self.skews.append(frameSet.fireSkew)
+        return frameSet
+
+    # 按 blockId 取回本次触发对应的帧：旧触发残留的帧丢弃，丢帧时以新的 blockId 重新对齐
+    # fetch the frame of this trigger by blockId: stale frames are dropped, a lost frame re-bases the camera
+    def _grabMatched(self, i, camera, timeout):
+        while True:
+            optFrame = camera.grab_frame(timeout)
+            if optFrame is None:
+                return None
+            if self._blockBase[i] is None:
+                self._blockBase[i] = optFrame.blockId - self.triggerSeq
+                return optFrame
+            expected = self._blockBase[i] + self.triggerSeq
+            if optFrame.blockId < expected:
+                optFrame.release()
+                continue
+            if optFrame.blockId > expected:
+                print("camera [%d] lost %d triggered frame(s)" % (camera.index, optFrame.blockId - expected))
+                self._blockBase[i] = optFrame.blockId - self.triggerSeq
+            return optFrame
+
+
+if __name__ == '__main__':
+
+    cameraCnt, cameras_info = enumCameras()
+    if cameraCnt is None:
+        print("Can't find camera")
+
+    camera_list = [OptCamera(index, cameras_info[index]) for index in range(0, cameraCnt)]
+    group = CameraGroup(camera_list)
+    if group.arm() == 0:
+        for i in range(0, 100):
+            frameSet = group.capture()
+            if frameSet is None:
+                break
+            print("set [%d] blockIds %s fire skew: %.3f ms" % (frameSet.seq, frameSet.blockIds, frameSet.fireSkew / 1e6))
+            for index, cvImage in enumerate(frameSet.images):
+                cv2.imshow(f'myWindow{index}', cvImage)
+            frameSet.release()
+            if cv2.waitKey(1) >= 0:
+                break
+        group.disarm()
+
+    for camera in camera_list:
+        camera.stop_grabbing()
+    print("--------- Demo end ---------")
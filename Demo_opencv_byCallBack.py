@@ -6,7 +6,9 @@ Created on 2017-10-25
 @author: 
 '''
 
+from FramePool import *
 from ImageConvert import *
+from OPTFrame import *
 from OPTSDK import *
 import struct
 import time
@@ -18,6 +20,7 @@ import gc
 g_cameraStatusUserInfo = b"statusInfo"
 g_Image_Grabbing_Timer=60  # unit : second
 g_isStop=0
+g_framePool = FramePool()  # 回调取图复用的图像缓存池 / frame buffer pool reused by the callback
 
 # 取流回调函数Ex
 # grabbing callback function with userInfo parameter
@@ -36,48 +39,21 @@ def onGetFrameEx(frame, userInfo):
  
     print("BlockId = %d userInfo = %s"  %(frame.contents.getBlockId(frame), c_char_p(userInfo).value))
 
-    # 给转码所需的参数赋值
-    # fill conversion parameter
-    imageParams = IMGCNV_SOpenParam()
-    imageParams.dataSize    = frame.contents.getImageSize(frame)
-    imageParams.height      = frame.contents.getImageHeight(frame)
-    imageParams.width       = frame.contents.getImageWidth(frame)
-    imageParams.paddingX    = frame.contents.getImagePaddingX(frame)
-    imageParams.paddingY    = frame.contents.getImagePaddingY(frame)
-    imageParams.pixelForamt = frame.contents.getImagePixelFormat(frame)
-
-    # 将裸数据图像拷出
-    # copy image data out from frame
-    imageBuff = frame.contents.getImage(frame)
-    userBuff = c_buffer(b'\0', imageParams.dataSize)
-    memmove(userBuff, c_char_p(imageBuff), imageParams.dataSize)
-
-    # 释放驱动图像缓存资源
-    # release frame resource at the end of use
-    frame.contents.release(frame)
-
-    # 如果图像格式是 Mono8 直接使用
-    # no format conversion required for Mono8
-    if imageParams.pixelForamt == EPixelType.gvspPixelMono8:
-        grayByteArray = bytearray(userBuff)
-        cvImage = numpy.array(grayByteArray).reshape(imageParams.height, imageParams.width)
-    else:
-        # 转码 => BGR24
-        # convert to BGR24
-        rgbSize = c_int()
-        rgbBuff = c_buffer(b'\0', imageParams.height * imageParams.width * 3)
-
-        nRet = IMGCNV_ConvertToBGR24(cast(userBuff, c_void_p), \
-                                     byref(imageParams), \
-                                     cast(rgbBuff, c_void_p), \
-                                     byref(rgbSize))
-
-        colorByteArray = bytearray(rgbBuff)
-        cvImage = numpy.array(colorByteArray).reshape(imageParams.height, imageParams.width, 3)
-   # --- end if ---
+    # 从缓存池借出图像缓存，拷贝/转码直接写入该缓存，完成后释放驱动图像缓存
+    # copy/convert straight into a pooled buffer, then release the frame resource
+    with OptFrame(frame) as optFrame:
+        cvImage = g_framePool.acquire(optFrame.params.pixelForamt,
+                                      optFrame.params.width, optFrame.params.height)
+        if cvImage is None:
+            print("framePool exhausted, skip frame!")
+            return
+        if optFrame.copy_to(cvImage) is None:
+            print("copy frame fail, skip frame!")
+            g_framePool.release(cvImage)
+            return
 
     cv2.imshow('myWindow', cvImage)
-    gc.collect()
+    g_framePool.release(cvImage)
     cv2.waitKey(1)
 
 
@@ -671,6 +647,11 @@ def demo():
         streamSource.contents.release(streamSource)   
         return -1
       
+    # 启动完成后冻结已有对象，回调中不再主动调用 gc.collect()
+    # freeze startup objects, the callback no longer calls gc.collect()
+    gc.collect()
+    gc.freeze()
+
     # 自由拉流 x 秒
     # grabbing x seconds
     time.sleep(g_Image_Grabbing_Timer)
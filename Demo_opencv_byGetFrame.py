@@ -595,6 +595,11 @@ def demo():
         streamSource.contents.release(streamSource)   
         return -1
 
+    # 启动完成后冻结已有对象，取图循环中不再主动调用 gc.collect()
+    # freeze startup objects, the grabbing loop no longer calls gc.collect()
+    gc.collect()
+    gc.freeze()
+
     isGrab = True
 
     while isGrab :
@@ -663,7 +668,6 @@ def demo():
        # --- end if ---
 
         cv2.imshow('myWindow', cvImage)
-        gc.collect()
 
         if (cv2.waitKey(1) >= 0):
             isGrab = False
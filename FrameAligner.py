@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+# coding: utf-8
+'''
+Created on 2026-10-16
+
+@author:
+'''
+
+import collections
+import threading
+
+# 某一路相机暂时没有帧时，其余相机已到达帧的处理策略
+# what happens to frames of the other streams while one stream has nothing queued
+ALIGN_POLICY_DROP = "drop"  # 每路只保留最新一帧 / keep only the newest frame per stream
+ALIGN_POLICY_HOLD = "hold"  # 每路最多保留 holdFrames 帧 / keep up to holdFrames frames per stream
+
+ALIGN_POLICIES = (ALIGN_POLICY_DROP, ALIGN_POLICY_HOLD)
+
+
+class AlignedSet:
+    """
+    对齐后的一组帧，payloads 与相机顺序一一对应，skew 为组内时间戳的最大差值
+    """
+    def __init__(self, seq, payloads, timeStamps, blockIds, skew, releases):
+        self.seq = seq
+        self.payloads = payloads
+        self.timeStamps = timeStamps
+        self.blockIds = blockIds
+        self.skew = skew
+        self._releases = releases
+
+    # 调用每一帧 push 时给出的 release 回调
+    # call the release callback given with every frame
+    def release(self):
+        for release, payload in zip(self._releases, self.payloads):
+            if release is not None:
+                release(payload)
+
+
+class FrameAligner:
+    """
+    按时间戳（或 blockId）把 N 路相机的帧对齐成同步组。
+    每路相机一个 deque，只比较各路队首，一组的对齐开销为 O(N)：
+    队首时间戳最大值与最小值之差不超过 tolerance 即组成一组；
+    否则比最大值早 tolerance 以上的队首不可能再匹配，直接丢弃。
+
+        aligner = FrameAligner(cameraCnt, tolerance=2000000)
+        # 各相机线程
+        aligner.push(index, timeStamp, blockId, image, framePool.release)
+        # 消费线程
+        alignedSet = aligner.get(timeout=1.0)
+
+    offsets 为各路时间戳的修正量，相机时钟不同步时用于对齐不同相机的时间基准。
+    """
+    def __init__(self, streamCount, tolerance, policy=ALIGN_POLICY_DROP, holdFrames=4,
+                 offsets=None, key="timeStamp", readyDepth=16):
+        if policy not in ALIGN_POLICIES:
+            raise ValueError("unknown align policy [%s], expected one of %s" % (policy, ALIGN_POLICIES))
+        if key not in ("timeStamp", "blockId"):
+            raise ValueError("align key must be 'timeStamp' or 'blockId'")
+        self.streamCount = streamCount
+        self.tolerance = tolerance
+        self.policy = policy
+        self.holdFrames = 1 if policy == ALIGN_POLICY_DROP else holdFrames
+        self.offsets = list(offsets) if offsets is not None else [0] * streamCount
+        self.key = key
+
+        self._cond = threading.Condition()
+        self._queues = [collections.deque() for _ in range(streamCount)]
+        self._emptyCount = streamCount
+        self._ready = collections.deque()
+        self._readyDepth = readyDepth
+        self.seq = 0
+
+        # 统计信息
+        # statistics
+        self.pushed = [0] * streamCount
+        self.dropped = [0] * streamCount
+        self.matchedSets = 0
+        self.droppedSets = 0
+        self.skewSum = 0
+        self.skewMax = 0
+        self.skewLast = 0
+
+    # 放入一帧，返回本次对齐出的组数；release 在该帧被丢弃或对齐组 release 时调用
+    # queue one frame, returns how many sets were aligned; release(payload) runs when the frame is dropped
+    def push(self, stream, timeStamp, blockId, payload, release=None):
+        value = (timeStamp if self.key == "timeStamp" else blockId) + self.offsets[stream]
+        entry = (value, timeStamp, blockId, payload, release)
+        dropped = []
+        with self._cond:
+            self.pushed[stream] += 1
+            queue = self._queues[stream]
+            if not queue:
+                self._emptyCount -= 1
+            elif len(queue) >= self.holdFrames:
+                dropped.append(queue.popleft())
+                self.dropped[stream] += 1
+            queue.append(entry)
+
+            aligned = 0
+            while self._emptyCount == 0:
+                if self._alignHeads(dropped):
+                    aligned += 1
+            if aligned:
+                self._cond.notify_all()
+        for entry in dropped:
+            self._release(entry)
+        return aligned
+
+    def _alignHeads(self, dropped):
+        heads = [queue[0][0] for queue in self._queues]
+        newest = max(heads)
+        oldest = min(heads)
+        if newest - oldest <= self.tolerance:
+            entries = [queue.popleft() for queue in self._queues]
+            self._emptyCount = sum(1 for queue in self._queues if not queue)
+            skew = newest - oldest
+            self.seq += 1
+            self.matchedSets += 1
+            self.skewSum += skew
+            self.skewLast = skew
+            if skew > self.skewMax:
+                self.skewMax = skew
+            alignedSet = AlignedSet(self.seq,
+                                    tuple(entry[3] for entry in entries),
+                                    tuple(entry[1] for entry in entries),
+                                    tuple(entry[2] for entry in entries),
+                                    skew,
+                                    tuple(entry[4] for entry in entries))
+            if len(self._ready) >= self._readyDepth:
+                self.droppedSets += 1
+                dropped.extend(self._entriesOf(self._ready.popleft()))
+            self._ready.append(alignedSet)
+            return True
+
+        # 比最新队首早 tolerance 以上的帧不会再有匹配，丢弃
+        # heads older than newest - tolerance can never be matched, drop them
+        for stream, queue in enumerate(self._queues):
+            if queue[0][0] < newest - self.tolerance:
+                dropped.append(queue.popleft())
+                self.dropped[stream] += 1
+                if not queue:
+                    self._emptyCount += 1
+        return False
+
+    def _entriesOf(self, alignedSet):
+        return [(None, None, None, payload, release)
+                for payload, release in zip(alignedSet.payloads, alignedSet._releases)]
+
+    def _release(self, entry):
+        release = entry[4]
+        if release is not None:
+            release(entry[3])
+
+    # 取一组对齐好的帧，超时返回 None
+    # next aligned set, None on timeout
+    def get(self, timeout=None):
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._ready, timeout):
+                return None
+            return self._ready.popleft()
+
+    # 清空所有未对齐和未取走的帧
+    # drop every queued frame and every set that has not been taken
+    def clear(self):
+        dropped = []
+        with self._cond:
+            for queue in self._queues:
+                dropped.extend(queue)
+                queue.clear()
+            for alignedSet in self._ready:
+                dropped.extend(self._entriesOf(alignedSet))
+            self._ready.clear()
+            self._emptyCount = self.streamCount
+        for entry in dropped:
+            self._release(entry)
+
+    # 匹配率和偏差统计，matchRate 为进入对齐组的帧占全部帧的比例
+    # match rate and skew statistics, matchRate is the share of pushed frames that ended up in a set
+    def stats(self):
+        with self._cond:
+            pushed = sum(self.pushed)
+            matchedFrames = self.matchedSets * self.streamCount
+            return {
+                "matchedSets": self.matchedSets,
+                "droppedSets": self.droppedSets,
+                "pushed": list(self.pushed),
+                "dropped": list(self.dropped),
+                "matchRate": matchedFrames / pushed if pushed else 0.0,
+                "skewLast": self.skewLast,
+                "skewMean": self.skewSum / self.matchedSets if self.matchedSets else 0.0,
+                "skewMax": self.skewMax,
+            }
@@ -0,0 +1,238 @@
+#!/usr/bin/env python
+# coding: utf-8
+'''
+Created on 2026-10-16
+
+@author:
+'''
+
+import collections
+import threading
+import weakref
+
+import numpy
+
+from OPTFrame import frameShape
+
+# 缓存池耗尽时的处理策略
+# what acquire() does when every buffer of the pool is in use
+POOL_POLICY_BLOCK = "block"              # 等待使用者归还缓存 / wait until a buffer is released
+POOL_POLICY_DROP_OLDEST = "drop_oldest"  # 回收最早借出的缓存 / reclaim the oldest outstanding buffer
+POOL_POLICY_GROW = "grow"                # 分配一块不归缓存池管理的新缓存 / allocate a fresh buffer the caller owns
+
+POOL_POLICIES = (POOL_POLICY_BLOCK, POOL_POLICY_DROP_OLDEST, POOL_POLICY_GROW)
+
+
+class FramePool:
+    """
+    图像缓存池，按 (width, height, pixelFormat) 复用预分配的 numpy 数组，
+    避免每帧重新分配原始图像和 BGR24 转码缓存。
+    几何尺寸或像素格式变化时（如 setROI 之后）自动按新的 key 重建缓存。
+    默认的 grow 策略下缓存池只管理 depth 块缓存，耗尽时分配的新缓存归调用者所有，不会被回收改写，
+    不调用 release() 的使用者与不使用缓存池时一样；drop_oldest 会回收仍被借出的缓存，只用于保证归还缓存的使用者。
+
+        image = pool.acquire(pixelFormat, width, height)
+        ...
+        pool.release(image)
+    """
+    def __init__(self, depth=3, policy=POOL_POLICY_GROW, timeout=1.0):
+        if depth < 1:
+            raise ValueError("pool depth must be at least 1")
+        if policy not in POOL_POLICIES:
+            raise ValueError("unknown pool policy [%s], expected one of %s" % (policy, POOL_POLICIES))
+        self.depth = depth
+        self.policy = policy
+        self.timeout = timeout
+
+        self._cond = threading.Condition()
+        self._key = None
+        self._free = []
+        # 借出的缓存，按借出顺序排列，drop_oldest 时回收最早的一块
+        # outstanding buffers in lend order, drop_oldest reclaims the first one
+        self._busy = collections.OrderedDict()
+        self._count = 0
+
+        # 统计信息
+        # statistics
+        self.allocated = 0
+        self.reused = 0
+        self.reclaimed = 0
+        self.exhausted = 0
+        self.untracked = 0
+
+    @property
+    def key(self):
+        return self._key
+
+    def _rekey(self, key):
+        # 丢弃旧尺寸的缓存，已借出的旧缓存归还时直接忽略
+        # drop buffers of the old geometry, outstanding ones are ignored when released
+        self._key = key
+        self._free = []
+        self._busy.clear()
+        self._count = 0
+        self._cond.notify_all()
+
+    # 借出一块缓存，block 策略下超时返回 None
+    # lend a buffer, returns None when the block policy times out
+    def acquire(self, pixelFormat, width, height):
+        key = (width, height, pixelFormat)
+        with self._cond:
+            if key != self._key:
+                self._rekey(key)
+
+            while True:
+                if self._free:
+                    image = self._free.pop()
+                    self.reused += 1
+                    break
+                if self._count < self.depth:
+                    image = numpy.empty(frameShape(pixelFormat, width, height), dtype=numpy.uint8)
+                    self._count += 1
+                    self.allocated += 1
+                    break
+                self.exhausted += 1
+                # 超出深度的缓存不记入 _busy：调用者不归还时随引用释放，缓存池不会无限增长
+                # buffers beyond the depth are not tracked: freed with the caller's reference when never
+                # released, so the pool cannot grow without bound
+                if self.policy == POOL_POLICY_GROW:
+                    self.untracked += 1
+                    return numpy.empty(frameShape(pixelFormat, width, height), dtype=numpy.uint8)
+                if self.policy == POOL_POLICY_DROP_OLDEST:
+                    _, image = self._busy.popitem(last=False)
+                    self.reclaimed += 1
+                    break
+                if not self._cond.wait(self.timeout):
+                    return None
+                if key != self._key:
+                    self._rekey(key)
+
+            self._busy[id(image)] = image
+            return image
+
+    # 归还缓存，重复归还或归还已失效的缓存不做处理
+    # give a buffer back, releasing twice or releasing a stale buffer is a no-op
+    def release(self, image):
+        with self._cond:
+            if self._busy.pop(id(image), None) is None:
+                return
+            self._free.append(image)
+            self._cond.notify()
+
+    # 把缓存池深度加大到至少 depth，已有的缓存保留
+    # raise the pool depth to at least `depth`, keeping the buffers it has
+    def reserve(self, depth):
+        with self._cond:
+            if depth > self.depth:
+                self.depth = depth
+                self._cond.notify_all()
+
+    # 清空缓存池，下次 acquire 时按新的尺寸重新分配
+    # forget every buffer, the next acquire allocates for the new geometry
+    def invalidate(self):
+        with self._cond:
+            self._rekey(None)
+
+
+class LatestFrameSlot:
+    """
+    最新帧槽，采集线程把填好的缓存发布为 front，使用者随时取到最新一帧和它的序号，不需要等待 getFrame。
+    采集线程每次从缓存池借出新的 back 缓存填充，发布后旧的 front 归还缓存池；
+    已交给使用者的 front 由使用者通过 release() 归还：每次 get() 借出计数加一，release() 减一，
+    离开槽时仍被借出的缓存等最后一个使用者归还后才回到缓存池。缓存池深度至少为 3。
+    """
+    def __init__(self, pool):
+        if pool.depth < 3:
+            raise ValueError("LatestFrameSlot needs a pool depth of at least 3")
+        self._pool = pool
+        self._cond = threading.Condition()
+        self._front = None
+        # front 被借出的次数；离开槽时仍被借出的缓存：id => [弱引用, 借出次数]，
+        # 使用者不归还就丢弃的缓存随弱引用一起移除
+        # times the front is lent out; buffers that left the slot while lent: id => [weak reference, count],
+        # a buffer its users drop without releasing leaves with its weak reference
+        self._lent = 0
+        self._retired = {}
+        self.seq = 0
+        self.blockId = 0
+        self.timeStamp = 0
+
+    # 采集线程发布一帧，返回新的序号；比当前帧更旧的帧（多个转码线程乱序完成时）直接归还缓存池，返回 0
+    # publish a filled buffer as the newest frame and return its sequence number.
+    # A frame older than the current one (workers finishing out of order) goes back to the pool, returns 0
+    def publish(self, image, blockId, timeStamp):
+        with self._cond:
+            if self._front is not None and blockId < self.blockId:
+                self._pool.release(image)
+                return 0
+            old = self._front
+            oldLent = self._retire(old)
+            self._front = image
+            self.seq += 1
+            self.blockId = blockId
+            self.timeStamp = timeStamp
+            seq = self.seq
+            self._cond.notify_all()
+        if old is not None and not oldLent:
+            self._pool.release(old)
+        return seq
+
+    # front 离开槽：仍被借出时记入 _retired，返回是否仍被借出；调用时持有 _cond
+    # the front leaves the slot: kept in _retired while still lent, returns whether it is; called with _cond held
+    def _retire(self, old):
+        lent = self._lent
+        self._lent = 0
+        if old is not None and lent:
+            key = id(old)
+            self._retired[key] = [weakref.ref(old, lambda ref: self._forget(key, ref)), lent]
+        return lent > 0
+
+    # 取最新一帧，返回 (image, seq)；lastSeq 不为空时等待比 lastSeq 更新的帧，超时返回 (None, seq)
+    # newest frame as (image, seq); with lastSeq waits for a newer frame, (None, seq) on timeout
+    def get(self, lastSeq=None, timeout=None):
+        image, seq, blockId, timeStamp = self.getInfo(lastSeq, timeout)
+        return image, seq
+
+    # 同 get()，同时返回该帧的 blockId 和时间戳：(image, seq, blockId, timeStamp)
+    # like get(), also returns the blockId and timestamp of that frame as (image, seq, blockId, timeStamp)
+    def getInfo(self, lastSeq=None, timeout=None):
+        with self._cond:
+            if lastSeq is None:
+                lastSeq = 0 if self._front is None else self.seq - 1
+            if not self._cond.wait_for(lambda: self._front is not None and self.seq > lastSeq, timeout):
+                return None, self.seq, 0, 0
+            self._lent += 1
+            return self._front, self.seq, self.blockId, self.timeStamp
+
+    # 使用者归还取到的帧；返回 False 表示该缓存已不在槽中且没有其他使用者，需由调用者归还缓存池
+    # give back a frame taken with get(); False when the buffer has left the slot and this was its last
+    # user, the caller then returns it to the pool
+    def release(self, image):
+        with self._cond:
+            if image is self._front:
+                if self._lent > 0:
+                    self._lent -= 1
+                return True
+            retired = self._retired.get(id(image))
+            if retired is None or retired[0]() is not image:
+                return False
+            retired[1] -= 1
+            if retired[1] > 0:
+                return True
+            del self._retired[id(image)]
+            return False
+
+    def _forget(self, key, ref):
+        with self._cond:
+            retired = self._retired.get(key)
+            if retired is not None and retired[0] is ref:
+                del self._retired[key]
+
+    def clear(self):
+        with self._cond:
+            old = self._front
+            oldLent = self._retire(old)
+            self._front = None
+            self.blockId = 0
+        if old is not None and not oldLent:
+            self._pool.release(old)
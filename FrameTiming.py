@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+# coding: utf-8
+'''
+Created on 2026-10-17
+
+@author:
+'''
+
+import threading
+import time
+
+# 每帧经过的阶段：
+#     device    相机时间戳 -> SDK 交付（getFrame 返回 / 回调进入）
+#     queue     SDK 交付 -> 开始拷贝（回调模式下在队列中等待工作线程的时间，主动取图时接近 0）
+#     copy      Mono8 拷贝耗时（memmove）
+#     convert   其他格式转码耗时（IMGCNV_ConvertToBGR24 或 OpenCV/NumPy 后端）
+#     consumer  拷贝/转码完成 -> 使用者取走（get_image/get_latest 返回或 consumer 被调用）
+#     total     相机时间戳 -> 使用者取走
+# stages of a frame, each the time between two consecutive stamps
+STAGE_DEVICE = "device"
+STAGE_QUEUE = "queue"
+STAGE_COPY = "copy"
+STAGE_CONVERT = "convert"
+STAGE_CONSUMER = "consumer"
+STAGE_TOTAL = "total"
+STAGES = (STAGE_DEVICE, STAGE_QUEUE, STAGE_COPY, STAGE_CONVERT, STAGE_CONSUMER, STAGE_TOTAL)
+
+
+class LatencyHistogram:
+    """
+    HDR 风格的对数-线性直方图，记录纳秒值：每个 2 的幂区间再等分为 2^subBucketBits 个桶，
+    相对误差不超过 1/2^subBucketBits，记录为 O(1)，占用内存固定，可随时查询百分位。
+    """
+    def __init__(self, subBucketBits=6, maxValue=1 << 40):
+        self.subBucketBits = subBucketBits
+        self.subBucketCount = 1 << subBucketBits
+        self.maxValue = maxValue
+        self.counts = [0] * self._index(maxValue) + [0]
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    # 值 => 桶序号：小于 subBucketCount 的值一个值一个桶，之后每个 2 的幂区间 subBucketCount 个桶
+    # value => bucket: exact below subBucketCount, then subBucketCount buckets per power of two
+    def _index(self, value):
+        shift = value.bit_length() - self.subBucketBits - 1
+        if shift <= 0:
+            return value
+        return self.subBucketCount * shift + (value >> shift)
+
+    # 桶中最大的值
+    # highest value that falls into a bucket
+    def _highest(self, index):
+        if index < 2 * self.subBucketCount:
+            return index
+        shift = index // self.subBucketCount - 1
+        return ((index - self.subBucketCount * shift + 1) << shift) - 1
+
+    def record(self, value):
+        if value < 0:
+            value = 0
+        elif value > self.maxValue:
+            value = self.maxValue
+        self.counts[self._index(value)] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    # 第 percent 百分位的值（纳秒），没有记录时返回 None
+    # value at the given percentile in ns, None when empty
+    def percentile(self, percent):
+        if self.count == 0:
+            return None
+        target = max(1, int(self.count * percent / 100.0 + 0.5))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self._highest(index), self.max)
+        return self.max
+
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+    def merge(self, other):
+        if other.subBucketBits != self.subBucketBits or other.maxValue != self.maxValue:
+            raise ValueError("histograms with different layouts can not be merged")
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        self.max = max(self.max, other.max)
+        return self
+
+    def copy(self):
+        histogram = LatencyHistogram(self.subBucketBits, self.maxValue)
+        return histogram.merge(self)
+
+    def reset(self):
+        self.counts = [0] * len(self.counts)
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    # 统计摘要，时间单位为毫秒
+    # summary in milliseconds
+    def summary(self):
+        if self.count == 0:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "min": self.min / 1e6,
+            "mean": self.mean() / 1e6,
+            "p50": self.percentile(50.0) / 1e6,
+            "p90": self.percentile(90.0) / 1e6,
+            "p99": self.percentile(99.0) / 1e6,
+            "p999": self.percentile(99.9) / 1e6,
+            "max": self.max / 1e6,
+        }
+
+
+class FrameTiming:
+    """
+    一个相机的逐帧阶段耗时统计，每个阶段一个 LatencyHistogram。
+    hostClock=True 表示相机时间戳与主机 time.perf_counter_ns() 同一时钟（如 SimSDK），device 阶段取绝对值；
+    否则相机时钟与主机时钟的差未知，device/total 阶段相对于目前观察到的最小差值（最快一帧为 0）。
+    拷贝/转码完成到使用者取走之间，按图像缓存记录完成时刻，缓存池中的缓存会被复用，所以记录数不超过缓存池深度。
+    """
+    def __init__(self, hostClock=False):
+        self.hostClock = hostClock
+        self._lock = threading.Lock()
+        self.histograms = dict((stage, LatencyHistogram()) for stage in STAGES)
+        self._offset = None
+        self._pending = {}
+
+    # 拷贝/转码完成时调用：timeStamp 为相机时间戳，其余为 time.perf_counter_ns() 时刻，
+    # image 不为空时等待 consumed(image) 记录使用者阶段
+    # called once copy/convert is done: timeStamp is the camera stamp, the rest are perf_counter_ns() instants;
+    # when image is given the consumer stage is recorded by consumed(image)
+    def frameDone(self, image, timeStamp, delivered, started, done, converted):
+        histograms = self.histograms
+        with self._lock:
+            offset = self._deviceOffset(delivered - timeStamp)
+            histograms[STAGE_DEVICE].record(delivered - timeStamp - offset)
+            histograms[STAGE_QUEUE].record(started - delivered)
+            histograms[STAGE_CONVERT if converted else STAGE_COPY].record(done - started)
+            if image is not None:
+                self._pending[id(image)] = (timeStamp + offset, done)
+
+    # 使用者取走图像时调用
+    # called when the consumer takes the image
+    def consumed(self, image, now=None):
+        if now is None:
+            now = time.perf_counter_ns()
+        with self._lock:
+            stamps = self._pending.pop(id(image), None)
+            if stamps is None:
+                return
+            cameraTime, done = stamps
+            self.histograms[STAGE_CONSUMER].record(now - done)
+            self.histograms[STAGE_TOTAL].record(now - cameraTime)
+
+    def _deviceOffset(self, difference):
+        if self.hostClock:
+            return 0
+        if self._offset is None or difference < self._offset:
+            self._offset = difference
+        return self._offset
+
+    # 某个阶段直方图的副本，可在运行中查询
+    # a copy of one stage histogram, safe to query while frames keep coming
+    def histogram(self, stage):
+        with self._lock:
+            return self.histograms[stage].copy()
+
+    # 各阶段统计摘要（毫秒）
+    # summary per stage in milliseconds
+    def stats(self):
+        with self._lock:
+            histograms = dict((stage, histogram.copy()) for stage, histogram in self.histograms.items())
+        return dict((stage, histogram.summary()) for stage, histogram in histograms.items())
+
+    def reset(self):
+        with self._lock:
+            for histogram in self.histograms.values():
+                histogram.reset()
+            self._pending.clear()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# coding: utf-8
+'''
+Created on 2026-10-16
+
+@author:
+'''
+
+import gc
+import threading
+import time
+
+
+class GcMonitor:
+    """
+    垃圾回收统计，通过 gc.callbacks 记录每一代回收的次数和耗时。
+    取图路径上不再调用 gc.collect()，用它确认热路径上没有发生回收。
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._start = None
+        self.counts = [0, 0, 0]
+        self.totalTime = [0.0, 0.0, 0.0]
+        self.maxTime = 0.0
+        self.collected = 0
+
+    def start(self):
+        if self._callback not in gc.callbacks:
+            gc.callbacks.append(self._callback)
+
+    def stop(self):
+        if self._callback in gc.callbacks:
+            gc.callbacks.remove(self._callback)
+
+    def _callback(self, phase, info):
+        if phase == "start":
+            self._start = time.perf_counter()
+            return
+        if self._start is None:
+            return
+        elapsed = time.perf_counter() - self._start
+        self._start = None
+        generation = info["generation"]
+        with self._lock:
+            self.counts[generation] += 1
+            self.totalTime[generation] += elapsed
+            self.collected += info["collected"]
+            if elapsed > self.maxTime:
+                self.maxTime = elapsed
+
+    def reset(self):
+        with self._lock:
+            self.counts = [0, 0, 0]
+            self.totalTime = [0.0, 0.0, 0.0]
+            self.maxTime = 0.0
+            self.collected = 0
+
+    # 回收次数和耗时（秒），按代统计
+    # collection counts and durations in seconds, per generation
+    def stats(self):
+        with self._lock:
+            return {
+                "counts": list(self.counts),
+                "totalTime": list(self.totalTime),
+                "maxTime": self.maxTime,
+                "collected": self.collected,
+            }
+
+
+# 启动完成后调用：先做一次完整回收，再把启动阶段创建的对象移入永久代，
+# 之后的回收不再扫描这些对象（SDK 结构体、ctypes 原型、相机对象等）
+# call once startup is done: collect, then move every surviving object to the permanent
+# generation so later collections no longer traverse SDK structures and camera objects
+def freezeAfterStartup():
+    gc.collect()
+    gc.freeze()
+    return gc.get_freeze_count()
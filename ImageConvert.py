@@ -7,12 +7,13 @@ Created on 2017-10-26
 '''
 from ctypes import *
 
-# 加载ImageConvert库
-# load ImageConvert library
-# 32bit
-#ImageConvertdll = OleDLL("./dll/x86/ImageConvert.dll")
-# 64bit
-ImageConvertdll = OleDLL("./dll/x64/ImageConvert.dll")
+from SDKLoader import SDKLibrary
+
+# 加载ImageConvert动态库：第一次调用其中的函数时才加载，按解释器位数选择 dll/x64 或 dll/x86，
+# 可用环境变量 OPTSDK_DLL_DIR 指定目录；未安装 SDK 时 import 仍然成功
+# load ImageConvert library on first call, dll/x64 or dll/x86 by interpreter bitness,
+# OPTSDK_DLL_DIR overrides the directory; importing works without the SDK installed
+ImageConvertdll = SDKLibrary("ImageConvert")
 
 #定义枚举类型
 #define enum type
@@ -6,15 +6,22 @@ Created on 2023-03-08
 @author: Miao H.Q.
 '''
 
+from FrameAligner import *
+from FramePool import *
+from GcMonitor import *
 from ImageConvert import *
+from OPTFrame import *
 from OPTSDK import *
+from SharedFrameRing import *
+from StreamMonitor import *
 import struct
 import time
 import datetime
 import numpy
 import cv2
-import gc
 import threading
+import argparse
+import multiprocessing
 import ctypes, sys
 
 g_cameraStatusUserInfo = b"statusInfo"
@@ -532,13 +539,50 @@ def setROI(camera, OffsetX, OffsetY, nWidth, nHeight):
     return 0
 
 
-def run(index, camera):
+# 多相机对齐结果的消费线程：打印每组的偏差后归还图像缓存
+# consumer of aligned multi-camera sets: print the skew of every set, then give the buffers back
+def alignConsumer(aligner, stopEvent):
+    while not stopEvent.is_set():
+        alignedSet = aligner.get(timeout=0.5)
+        if alignedSet is None:
+            continue
+        print("aligned set [%d] blockIds %s skew: %d" % (alignedSet.seq, alignedSet.blockIds, alignedSet.skew))
+        alignedSet.release()
+    print("align stats: %s" % aligner.stats())
+
+
+# 读取整型属性，失败返回 None
+# read an integer property, None on failure
+def getIntValue(camera, attrName):
+    intNode = pointer(GENICAM_IntNode())
+    intNodeInfo = GENICAM_IntNodeInfo()
+    intNodeInfo.pCamera = pointer(camera)
+    intNodeInfo.attrName = attrName
+    nRet = GENICAM_createIntNode(byref(intNodeInfo), byref(intNode))
+    if nRet != 0:
+        print("create %s Node fail!" % attrName.decode())
+        return None
+
+    value = c_longlong()
+    nRet = intNode.contents.getValue(intNode, byref(value))
+    # 释放相关资源
+    # release node resource at the end of use
+    intNode.contents.release(intNode)
+    if nRet != 0:
+        print("%s getValue fail!" % attrName.decode())
+        return None
+    return value.value
+
+
+# 打开相机，创建流对象，设置自由拉流并开始拉流，失败返回 None
+# open the camera, create its stream source and start free-running grabbing, None on failure
+def startStream(index, camera):
     # 打开相机
     # open camera
     nRet = openCamera(camera)
     if nRet != 0:
         print(f"openCamera {index} fail.")
-        return -1
+        return None
 
     # 创建流对象
     # create stream source object
@@ -547,11 +591,10 @@ def run(index, camera):
     streamSourceInfo.pCamera = pointer(camera)
 
     streamSource = pointer(GENICAM_StreamSource())
-    streamSourceList.append(streamSource)
     nRet = GENICAM_createStreamSource(pointer(streamSourceInfo), byref(streamSource))
     if nRet != 0:
         print("create StreamSource fail!")
-        return -1
+        return None
 
     # 通用属性设置:设置触发模式为off --根据属性类型，直接构造属性节点。如触发模式是 enumNode，构造enumNode节点
     # create corresponding property node according to the value type of property, here is enumNode
@@ -568,7 +611,7 @@ def run(index, camera):
         # 释放相关资源
         # release node resource before return
         streamSource.contents.release(streamSource)
-        return -1
+        return None
 
     nRet = trigModeEnumNode.contents.setValueBySymbol(trigModeEnumNode, b"Off")
     if nRet != 0:
@@ -577,7 +620,7 @@ def run(index, camera):
         # release node resource before return
         trigModeEnumNode.contents.release(trigModeEnumNode)
         streamSource.contents.release(streamSource)
-        return -1
+        return None
 
     # 需要释放Node资源
     # release node resource at the end of use
@@ -592,10 +635,61 @@ def run(index, camera):
         # 释放相关资源
         # release stream source object before return
         streamSource.contents.release(streamSource)
+        return None
+
+    return streamSource
+
+
+# 停止拉流并关闭相机
+# stop grabbing and close the camera
+def stopStream(camera, streamSource):
+    # 停止拉流
+    # stop grabbing
+    nRet = streamSource.contents.stopGrabbing(streamSource)
+    if nRet != 0:
+        print("stopGrabbing fail!")
+        # 释放相关资源
+        streamSource.contents.release(streamSource)
         return -1
 
+    # 关闭相机
+    # close camera
+    nRet = closeCamera(camera)
+    if nRet != 0:
+        print("closeCamera fail")
+        # 释放相关资源
+        streamSource.contents.release(streamSource)
+        return -1
+
+    # 释放相关资源
+    # release stream source object at the end of use
+    streamSource.contents.release(streamSource)
+
+    return 0
+
+
+def run(index, camera, aligner=None, monitor=None):
+    streamSource = startStream(index, camera)
+    if streamSource is None:
+        return -1
+    streamSourceList.append(streamSource)
+    # 流统计监视器在释放流对象之前移除该流
+    # the stream statistics monitor drops the stream before it is released
+    if monitor is not None:
+        monitor.add(index, streamSource)
+
+    # 每个相机线程独立的图像缓存池，对齐时图像缓存会被对齐器暂存，缓存池按需增长
+    # frame buffer pool owned by this camera thread, grows on demand while the aligner holds frames
+    if aligner is None:
+        framePool = FramePool()
+    else:
+        framePool = FramePool(aligner.holdFrames + 2, POOL_POLICY_GROW)
+
     isGrab = True
 
+    # 帧对象的函数指针在第一帧时取得，之后每帧直接使用
+    # frame function pointers are taken from the first frame and reused for every later one
+    accessors = None
     while isGrab:
         # 主动取图
         # get one frame
@@ -605,66 +699,48 @@ def run(index, camera):
             print("getFrame fail! Timeout:[1000]ms")
             # 释放相关资源
             # release stream source object before return
+            if monitor is not None:
+                monitor.remove(index)
             streamSource.contents.release(streamSource)
             return -1
-        else:
-            print("Camera [" + str(index) + "] getFrame success BlockId = [" + str(
-                frame.contents.getBlockId(frame)) + "], get frame time: " + str(
-                datetime.datetime.now()))
 
-        nRet = frame.contents.valid(frame)
+        if accessors is None:
+            accessors = FrameAccessors(frame)
+        print("Camera [" + str(index) + "] getFrame success BlockId = [" + str(
+            accessors.getBlockId(frame)) + "], get frame time: " + str(
+            datetime.datetime.now()))
+
+        nRet = accessors.valid(frame)
         if nRet != 0:
             print("frame is invalid!")
             # 释放驱动图像缓存资源
             # release frame resource before return
-            frame.contents.release(frame)
+            accessors.release(frame)
             # 释放相关资源
             # release stream source object before return
+            if monitor is not None:
+                monitor.remove(index)
             streamSource.contents.release(streamSource)
             return -1
 
-            # 给转码所需的参数赋值
-        # fill conversion parameter
-        imageParams = IMGCNV_SOpenParam()
-        imageParams.dataSize = frame.contents.getImageSize(frame)
-        imageParams.height = frame.contents.getImageHeight(frame)
-        imageParams.width = frame.contents.getImageWidth(frame)
-        imageParams.paddingX = frame.contents.getImagePaddingX(frame)
-        imageParams.paddingY = frame.contents.getImagePaddingY(frame)
-        imageParams.pixelForamt = frame.contents.getImagePixelFormat(frame)
-
-        # 将裸数据图像拷出
-        # copy image data out from frame
-        imageBuff = frame.contents.getImage(frame)
-        userBuff = c_buffer(b'\0', imageParams.dataSize)
-        memmove(userBuff, c_char_p(imageBuff), imageParams.dataSize)
-
-        # 释放驱动图像缓存
-        # release frame resource at the end of use
-        frame.contents.release(frame)
-
-        # 如果图像格式是 Mono8 直接使用
-        # no format conversion required for Mono8
-        if imageParams.pixelForamt == EPixelType.gvspPixelMono8:
-            grayByteArray = bytearray(userBuff)
-            cvImage = numpy.array(grayByteArray).reshape(imageParams.height, imageParams.width)
-        else:
-            # 转码 => BGR24
-            # convert to BGR24
-            rgbSize = c_int()
-            rgbBuff = c_buffer(b'\0', imageParams.height * imageParams.width * 3)
-
-            nRet = IMGCNV_ConvertToBGR24(cast(userBuff, c_void_p),
-                                         byref(imageParams),
-                                         cast(rgbBuff, c_void_p),
-                                         byref(rgbSize))
-
-            colorByteArray = bytearray(rgbBuff)
-            cvImage = numpy.array(colorByteArray).reshape(imageParams.height, imageParams.width, 3)
-        # --- end if ---
+        # 从缓存池借出图像缓存，拷贝/转码直接写入该缓存，完成后释放驱动图像缓存
+        # copy/convert straight into a pooled buffer, then release the frame resource
+        with OptFrame(frame, accessors) as optFrame:
+            cvImage = framePool.acquire(optFrame.params.pixelForamt,
+                                        optFrame.params.width, optFrame.params.height)
+            if cvImage is None:
+                print("framePool exhausted, skip frame!")
+                continue
+            if optFrame.copy_to(cvImage) is None:
+                print("copy frame fail, skip frame!")
+                framePool.release(cvImage)
+                continue
 
         cv2.imshow(f'myWindow{index}', cvImage)
-        gc.collect()
+        if aligner is None:
+            framePool.release(cvImage)
+        else:
+            aligner.push(index, optFrame.timeStamp, optFrame.blockId, cvImage, framePool.release)
 
         if cv2.waitKey(1) >= 0:
             isGrab = False
@@ -673,28 +749,109 @@ def run(index, camera):
 
     # cv2.destroyAllWindows()
 
-    # 停止拉流
-    # stop grabbing
-    nRet = streamSource.contents.stopGrabbing(streamSource)
-    if nRet != 0:
-        print("stopGrabbing fail!")
-        # 释放相关资源
-        streamSource.contents.release(streamSource)
+    if monitor is not None:
+        monitor.remove(index)
+    return stopStream(camera, streamSource)
+
+
+# 相机进程：独立枚举并打开第 index 个相机，每一帧直接拷贝/转码到共享内存环形缓存中，
+# 环形缓存名称通过 readyQueue 通知主进程，stopEvent 置位后退出
+# camera process: enumerates and opens camera `index` on its own and copies every frame straight
+# into a shared memory ring; the ring name goes to the coordinator through readyQueue
+def runProcess(index, ringSlots, readyQueue, stopEvent):
+    cameraCnt, cameraList = enumCameras()
+    if cameraCnt is None or index >= cameraCnt:
+        print(f"camera {index} not found.")
+        readyQueue.put((index, None))
         return -1
+    camera = cameraList[index]
 
-    # 关闭相机
-    # close camera
-    nRet = closeCamera(camera)
-    if nRet != 0:
-        print("closeCamera fail")
-        # 释放相关资源
-        streamSource.contents.release(streamSource)
+    streamSource = startStream(index, camera)
+    if streamSource is None:
+        readyQueue.put((index, None))
         return -1
 
-    # 释放相关资源
-    # release stream source object at the end of use
-    streamSource.contents.release(streamSource)
+    # 按最大分辨率分配槽，ROI 变化后不需要重建环形缓存
+    # slots are sized for the full sensor so ROI changes never outgrow them
+    widthMax = getIntValue(camera, b"WidthMax")
+    heightMax = getIntValue(camera, b"HeightMax")
+    if widthMax is None or heightMax is None:
+        stopStream(camera, streamSource)
+        readyQueue.put((index, None))
+        return -1
+    ring = SharedFrameRing(slots=ringSlots, slotBytes=widthMax * heightMax * 3)
+    readyQueue.put((index, ring.name))
+    freezeAfterStartup()
 
+    # 帧对象的函数指针在第一帧时取得，之后每帧直接使用
+    # frame function pointers are taken from the first frame and reused for every later one
+    accessors = None
+    while not stopEvent.is_set():
+        frame = pointer(GENICAM_Frame())
+        nRet = streamSource.contents.getFrame(streamSource, byref(frame), c_uint(1000))
+        if nRet != 0:
+            print("getFrame fail! Timeout:[1000]ms")
+            continue
+
+        if accessors is None:
+            accessors = FrameAccessors(frame)
+        nRet = accessors.valid(frame)
+        if nRet != 0:
+            print("frame is invalid!")
+            # 释放驱动图像缓存资源
+            # release frame resource before return
+            accessors.release(frame)
+            continue
+
+        with OptFrame(frame, accessors) as optFrame:
+            ring.write(optFrame)
+
+    nRet = stopStream(camera, streamSource)
+    print("camera [%d] wrote %d frames" % (index, ring.written))
+    ring.close()
+    return nRet
+
+
+# 主进程：启动每个相机的进程，直接显示共享内存中的最新帧，不做拷贝
+# coordinator: start one process per camera and show the newest frame of every ring without copying
+def runProcesses(cameraCnt, ringSlots):
+    readyQueue = multiprocessing.Queue()
+    stopEvent = multiprocessing.Event()
+    processes = [multiprocessing.Process(target=runProcess, args=(index, ringSlots, readyQueue, stopEvent))
+                 for index in range(0, cameraCnt)]
+    for process in processes:
+        process.start()
+
+    rings = {}
+    for _ in range(0, cameraCnt):
+        index, name = readyQueue.get()
+        if name is not None:
+            rings[index] = SharedFrameRing(name)
+    lastSeqs = dict.fromkeys(rings, 0)
+
+    while rings:
+        for index, ring in rings.items():
+            frame = ring.latest(lastSeqs[index])
+            if frame is None:
+                continue
+            lastSeqs[index] = frame.seq
+            print("Camera [" + str(index) + "] ring seq = [" + str(frame.seq) + "] BlockId = [" + str(
+                frame.blockId) + "]")
+            cv2.imshow(f'myWindow{index}', frame.image)
+            # 显示期间该槽被相机进程改写
+            # the camera process rewrote the slot while it was shown
+            if not frame.valid():
+                ring.torn += 1
+            del frame
+        if cv2.waitKey(1) >= 0:
+            break
+
+    stopEvent.set()
+    for index, ring in rings.items():
+        print("camera [%d] torn reads: %d" % (index, ring.torn))
+        ring.close()
+    for process in processes:
+        process.join()
     return 0
 
 
@@ -703,6 +860,22 @@ if __name__ == "__main__":
     # Re-run the program with admin rights
     # ctypes.windll.shell32.ShellExecuteW(None, "runas", sys.executable, __file__, None, 1)
 
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--align-tolerance", type=int, default=None,
+                        help="align frames of all cameras by timestamp within this tolerance")
+    parser.add_argument("--align-hold", type=int, default=0,
+                        help="hold up to this many unmatched frames per camera, 0 keeps only the newest")
+    parser.add_argument("--processes", action="store_true",
+                        help="grab every camera in its own process through shared memory frame rings")
+    parser.add_argument("--ring-slots", type=int, default=4,
+                        help="slots of every shared memory frame ring")
+    parser.add_argument("--monitor-port", type=int, default=None,
+                        help="poll the stream statistics and serve them in Prometheus format on localhost:PORT "
+                             "(not with --processes)")
+    parser.add_argument("--monitor-interval", type=float, default=1.0,
+                        help="stream statistics poll interval in seconds")
+    args = parser.parse_args()
+
     # 发现相机
     # enumerate camera
     streamSourceList = []
@@ -721,11 +894,52 @@ if __name__ == "__main__":
         print("Model  name   = " + str(camera.getModelName(camera)))
         print("Serial number = " + str(camera.getSerialNumber(camera)))
         print("-------------------------------")
-        threads.append(threading.Thread(target=run, args=(index, camera)))
+
+    if args.processes:
+        runProcesses(cameraCnt, args.ring_slots)
+        print("--------- Demo end ---------")
+        sys.exit(0)
+
+    aligner = None
+    if args.align_tolerance is not None:
+        if args.align_hold > 0:
+            aligner = FrameAligner(cameraCnt, args.align_tolerance, ALIGN_POLICY_HOLD, args.align_hold)
+        else:
+            aligner = FrameAligner(cameraCnt, args.align_tolerance)
+
+    # 流统计监视器：定时读取每个相机的 getStatisticsInfo，在本机以 Prometheus 文本格式提供
+    # stream statistics monitor: polls getStatisticsInfo of every camera and serves it on localhost
+    monitor = None
+    if args.monitor_port is not None:
+        monitor = StreamMonitor(args.monitor_interval)
+        monitor.start()
+        port = monitor.serve(args.monitor_port)
+        print("stream statistics on http://127.0.0.1:%d/metrics" % port)
+
+    for index in range(0, cameraCnt):
+        threads.append(threading.Thread(target=run, args=(index, cameraList[index], aligner, monitor)))
+
+    # 启动完成后冻结已有对象，取图线程中不再主动调用 gc.collect()
+    # freeze startup objects, the grabbing threads no longer call gc.collect()
+    gcMonitor = GcMonitor()
+    gcMonitor.start()
+    freezeAfterStartup()
+
     for thread in threads:
         thread.start()
-    # for thread in threads:
-    #     thread.join()
+    stopEvent = threading.Event()
+    if aligner is not None:
+        consumer = threading.Thread(target=alignConsumer, args=(aligner, stopEvent))
+        consumer.start()
+    for thread in threads:
+        thread.join()
+    stopEvent.set()
+    if aligner is not None:
+        consumer.join()
+        aligner.clear()
+    if monitor is not None:
+        monitor.stop()
+    print("gc stats: %s" % gcMonitor.stats())
     # nRet = run()
     # if nRet != 0:
     #     print("Some Error happend")
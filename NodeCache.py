@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+# coding: utf-8
+'''
+Created on 2026-10-16
+
+@author:
+'''
+
+import threading
+
+from OPTSDK import *
+
+# 属性节点类型
+# property node kinds
+NODE_INT = "int"
+NODE_DOUBLE = "double"
+NODE_ENUM = "enum"
+NODE_BOOL = "bool"
+NODE_CMD = "cmd"
+
+# 节点类型 => (节点结构体, 节点信息结构体, 创建函数)
+# node kind => (node struct, node info struct, create function)
+_NODE_TYPES = {
+    NODE_INT: (GENICAM_IntNode, GENICAM_IntNodeInfo, GENICAM_createIntNode),
+    NODE_DOUBLE: (GENICAM_DoubleNode, GENICAM_DoubleNodeInfo, GENICAM_createDoubleNode),
+    NODE_ENUM: (GENICAM_EnumNode, GENICAM_EnumNodeInfo, GENICAM_createEnumNode),
+    NODE_BOOL: (GENICAM_BoolNode, GENICAM_BoolNodeInfo, GENICAM_createBoolNode),
+    NODE_CMD: (GENICAM_CmdNode, GENICAM_CmdNodeInfo, GENICAM_createCmdNode),
+}
+
+# 数值节点 getValue/setValue 使用的 ctypes 类型
+# ctypes value type of getValue/setValue of the numeric nodes
+_VALUE_TYPES = {
+    NODE_INT: c_longlong,
+    NODE_DOUBLE: c_double,
+    NODE_BOOL: c_uint,
+}
+
+
+class NodeCache:
+    """
+    每个相机一个的属性节点缓存，按 (节点类型, 属性名) 保存 create 出来的节点，连接期间重复使用，
+    不再每次读写属性都 create/release。断开连接时 invalidate() 释放所有节点；
+    掉线回调中只调用 markStale()，节点在下一次使用时于调用者线程中释放并重新创建。
+
+        node = camera.nodeCache.get(NODE_DOUBLE, b"ExposureTime")
+        node.contents.setValue(node, c_double(10000))
+    """
+    def __init__(self, camera):
+        self.camera = camera
+        self._lock = threading.Lock()
+        self._nodes = {}
+        self._stale = False
+
+        # 统计信息
+        # statistics
+        self.hits = 0
+        self.misses = 0
+
+    # 取节点，不存在时创建并缓存，创建失败返回 None；返回的节点由缓存持有，使用者不要 release
+    # cached node of the given kind and name, created on first use, None on failure.
+    # The cache owns the node, callers must not release it
+    def get(self, kind, attrName):
+        key = (kind, attrName)
+        with self._lock:
+            if self._stale:
+                self._releaseAll()
+            node = self._nodes.get(key)
+            if node is not None:
+                self.hits += 1
+                return node
+            self.misses += 1
+
+            nodeType, nodeInfoType, createNode = _NODE_TYPES[kind]
+            node = pointer(nodeType())
+            nodeInfo = nodeInfoType()
+            nodeInfo.pCamera = pointer(self.camera)
+            nodeInfo.attrName = attrName
+            nRet = createNode(byref(nodeInfo), byref(node))
+            if nRet != 0:
+                print("create %s Node fail!" % attrName.decode())
+                return None
+            self._nodes[key] = node
+            return node
+
+    # 读取属性值：int/double/bool 返回数值，enum 返回符号（bytes），失败返回 None
+    # read a property: numbers for int/double/bool, the symbol (bytes) for enum, None on failure
+    def getValue(self, kind, attrName):
+        node = self.get(kind, attrName)
+        if node is None:
+            return None
+
+        if kind == NODE_ENUM:
+            symbol = create_string_buffer(256)
+            symbolSize = c_uint(256)
+            nRet = node.contents.getValueSymbol(node, symbol, byref(symbolSize))
+            value = symbol.value
+        else:
+            value = _VALUE_TYPES[kind]()
+            nRet = node.contents.getValue(node, byref(value))
+            value = value.value
+        if nRet != 0:
+            print("%s getValue fail!" % attrName.decode())
+            return None
+        return value
+
+    # 设置属性值，enum 传入符号（bytes），cmd 忽略 value 执行一次
+    # write a property, enum takes its symbol (bytes), cmd ignores value and executes once
+    def setValue(self, kind, attrName, value=None):
+        node = self.get(kind, attrName)
+        if node is None:
+            return -1
+
+        if kind == NODE_ENUM:
+            nRet = node.contents.setValueBySymbol(node, value)
+        elif kind == NODE_CMD:
+            nRet = node.contents.execute(node)
+        else:
+            nRet = node.contents.setValue(node, _VALUE_TYPES[kind](value))
+        if nRet != 0:
+            print("%s setValue [%s] fail!" % (attrName.decode(), value))
+            return -1
+        return 0
+
+    # 掉线回调中调用：只做标记，不在 SDK 线程中释放节点
+    # called from the offline callback: only flag the cache, nodes are not released on the SDK thread
+    def markStale(self):
+        self._stale = True
+
+    # 释放所有缓存的节点，断开连接前调用
+    # release every cached node, call before disconnecting
+    def invalidate(self):
+        with self._lock:
+            self._releaseAll()
+
+    def _releaseAll(self):
+        for node in self._nodes.values():
+            node.contents.release(node)
+        self._nodes.clear()
+        self._stale = False
+
+    @property
+    def hitRate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "nodes": len(self._nodes),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hitRate": self.hitRate,
+            }
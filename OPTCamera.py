@@ -7,14 +7,68 @@ Created on 2023-03-14
 """
 
 import datetime
-import gc
+import queue
+import threading
 import time
 
 import cv2
 import numpy
 
+from FramePool import *
+from GcMonitor import *
+from CameraConfig import *
+from FrameTiming import *
 from ImageConvert import *
+from NodeCache import *
+from OPTFrame import *
 from OPTSDK import *
+from ParamCache import *
+from SDKLoader import SDK_BACKEND_SIM, sdkBackend
+from StreamEvents import *
+
+# 取图方式
+# acquisition modes
+ACQ_MODE_POLL = "poll"          # 调用者线程上 getFrame / getFrame on the caller's thread
+ACQ_MODE_THREAD = "thread"      # 每个相机一个采集线程 / one acquisition thread per camera
+ACQ_MODE_CALLBACK = "callback"  # attachGrabbingEx 回调 + 转码线程 / attachGrabbingEx callback plus worker threads
+
+# SDK 取流策略
+# SDK grab strategies
+GRAB_SEQUENTIAL = "sequential"  # 按到达顺序交付，缓存占满后丢新帧 / in arrival order, new frames are dropped when full
+GRAB_LATEST = "latest"          # 只交付最新一帧，旧帧被覆盖 / only the newest frame, older ones are overwritten
+GRAB_UPCOMING = "upcoming"      # 交付取图调用之后到达的下一帧 / the next frame arriving after the grab call
+_GRAB_STRATEGIES = {
+    GRAB_SEQUENTIAL: GENICAM_EGrabStrategy.grabStrartegySequential,
+    GRAB_LATEST: GENICAM_EGrabStrategy.grabStrartegyLatestImage,
+    GRAB_UPCOMING: GENICAM_EGrabStrategy.grabStrartegyUpcomingImage,
+}
+
+# 缓存个数与取流策略的预设：(缓存个数, 取流策略)
+# presets of buffer count and grab strategy as (bufferCount, strategy)
+GRAB_PRESET_LOWEST_LATENCY = "lowest_latency"  # 消费者总是拿到最新一帧，来不及处理的帧被丢弃 / always the newest frame
+GRAB_PRESET_NEVER_DROP = "never_drop"          # 大量缓存吸收消费者的停顿，帧会变旧 / deep buffering, frames age
+GRAB_PRESETS = {
+    GRAB_PRESET_LOWEST_LATENCY: (2, GRAB_LATEST),
+    GRAB_PRESET_NEVER_DROP: (64, GRAB_SEQUENTIAL),
+}
+
+
+class FrameBatch:
+    """
+    连续 N 帧组成的一批图像，images 形状为 (N, H, W[, C])，blockIds/timeStamps 为对应的 uint64 数组。
+    取图超时或图像尺寸变化时提前结束，count 为实际取到的帧数，各数组只包含前 count 帧。
+    skipped 为相邻两帧 blockId 之间缺少的帧数之和，为 0 时这一批是真正连续的帧。
+    """
+    def __init__(self, images, blockIds, timeStamps, count):
+        self.images = images[:count]
+        self.blockIds = blockIds[:count]
+        self.timeStamps = timeStamps[:count]
+        self.count = count
+        gaps = numpy.diff(self.blockIds.astype(numpy.int64)) - 1
+        self.skipped = int(gaps[gaps > 0].sum())
+
+    def __len__(self):
+        return self.count
 
 
 class OptCamera:
@@ -22,10 +76,57 @@ class OptCamera:
     此类提供了两个比较重要的函数，
     get_image(),此函数通过调用可以返回一帧图片
     stop_grabbing(),停止相机对象拉流
+
+    get_image() 返回的图像来自相机的缓存池 framePool，用完后调用 release_image() 归还；
+    poolDepth/poolPolicy 设置缓存池深度和耗尽时的策略（block/drop_oldest/grow）；默认 grow，不归还的图像不会被改写，
+    drop_oldest 只在每张图像都调用 release_image() 时使用
+
+    mode=ACQ_MODE_THREAD 时相机启动自己的采集线程，不断把最新一帧写入 latestSlot，
+    get_image()/get_latest() 立即返回最新一帧，不在调用者线程上阻塞 getFrame
+    mode=ACQ_MODE_CALLBACK 时由 SDK 回调送帧，回调中只把帧放入有界队列，转码在工作线程中完成
+
+    bufferCount 为 SDK 流缓存个数（为空时使用 SDK 默认值），grabStrategy 为取流策略（GRAB_SEQUENTIAL/LATEST/UPCOMING），
+    grabPreset 给出时按 GRAB_PRESETS 同时设置二者；运行中可用 set_grab_strategy()/set_grab_preset() 切换
     """
-    def __init__(self, index, camera):
+    def __init__(self, index, camera, poolDepth=3, poolPolicy=POOL_POLICY_GROW, mode=ACQ_MODE_POLL,
+                 bufferCount=None, grabStrategy=GRAB_SEQUENTIAL, grabPreset=None):
         self.index = index
         self.camera = camera
+        self.mode = ACQ_MODE_POLL
+        if grabPreset is not None:
+            if grabPreset in GRAB_PRESETS:
+                bufferCount, grabStrategy = GRAB_PRESETS[grabPreset]
+            else:
+                print("unknown grab preset [%s]!" % grabPreset)
+        if grabStrategy not in _GRAB_STRATEGIES:
+            print("unknown grab strategy [%s], using %s" % (grabStrategy, GRAB_SEQUENTIAL))
+            grabStrategy = GRAB_SEQUENTIAL
+        self.grabStrategy = grabStrategy
+        self.bufferCount = None
+        self.framePool = FramePool(poolDepth, poolPolicy)
+        self.latestSlot = None
+        self._acqThread = None
+        self._acqRunning = False
+        self._frameQueue = None
+        self._frameCallback = None
+        self._workers = []
+        self._consumer = None
+        self.droppedFrames = 0
+        # 本流帧对象的函数指针，第一帧时取得
+        # frame function pointers of this stream, taken from the first frame
+        self.frameAccessors = None
+        # 逐帧阶段耗时统计，enable_timing() 之前为 None，取图路径上只多一次判断
+        # per-frame stage timing, None until enable_timing(); the grabbing path only tests for it
+        self.frameTiming = None
+        self.nodeCache = NodeCache(camera)
+        self.paramCache = ParamCache(self.nodeCache)
+        # 流事件（丢帧、丢包、图像错误）计数、最近事件和告警钩子
+        # stream event (lost frame, lost packet, image error) counters, recent events and alert hooks
+        self.streamEvents = StreamEvents()
+        # 每个相机使用独立的连接状态 userInfo
+        # a connection status userInfo of its own for every camera
+        self.g_cameraStatusUserInfo = b"statusInfo%d" % index
+        OptCamera._statusUserInfos[self.g_cameraStatusUserInfo] = self
 
         nRet = self.openCamera()
         if nRet != 0:
@@ -70,93 +171,384 @@ class OptCamera:
         # release node resource at the end of use
         self.trigModeEnumNode.contents.release(self.trigModeEnumNode)
 
+        # 设置流缓存个数，需在开始拉流之前
+        # set the stream buffer count, before grabbing starts
+        if bufferCount is not None:
+            self._setBufferCount(bufferCount)
+
         # 开始拉流
         # start grabbing
-        nRet = self.streamSource.contents.startGrabbing(self.streamSource, c_ulonglong(0),
-                                                        c_int(GENICAM_EGrabStrategy.grabStrartegySequential))
+        nRet = self._startGrabbing()
         if nRet != 0:
-            print("startGrabbing fail!")
             # 释放相关资源
             # release stream source object before return
             self.streamSource.contents.release(self.streamSource)
+            return
+
+        if mode == ACQ_MODE_THREAD:
+            self.start_acquisition()
+        elif mode == ACQ_MODE_CALLBACK:
+            self.start_callback()
+
+    # 启动后台采集线程，线程不断取图并发布到 latestSlot
+    # start the acquisition thread that keeps publishing the newest frame into latestSlot
+    def start_acquisition(self, timeout=1000):
+        if self.mode == ACQ_MODE_THREAD:
+            return 0
+        if self.mode != ACQ_MODE_POLL:
+            print("camera [%d] is in %s mode!" % (self.index, self.mode))
+            return -1
+        if self.latestSlot is None:
+            self.latestSlot = LatestFrameSlot(self.framePool)
+        self._acqRunning = True
+        self._acqThread = threading.Thread(target=self._acquisitionLoop, args=(timeout,),
+                                           name="OptCamera-%d" % self.index, daemon=True)
+        self._acqThread.start()
+        self.mode = ACQ_MODE_THREAD
+        return 0
 
-    def get_image(self):
-        # 主动取图
-        # get one frame
-        frame = pointer(GENICAM_Frame())
-        nRet = self.streamSource.contents.getFrame(self.streamSource, byref(frame), c_uint(1000))
+    # 停止后台采集线程
+    # stop the acquisition thread
+    def stop_acquisition(self):
+        if self.mode != ACQ_MODE_THREAD:
+            return 0
+        self._acqRunning = False
+        self._acqThread.join()
+        self._acqThread = None
+        self.latestSlot.clear()
+        self.mode = ACQ_MODE_POLL
+        return 0
+
+    def _acquisitionLoop(self, timeout):
+        while self._acqRunning:
+            optFrame = self.grab_frame(timeout)
+            if optFrame is None:
+                continue
+
+            # 借出 back 缓存，拷贝/转码完成后释放驱动图像缓存，再发布为最新帧
+            # fill a back buffer from the pool, release the frame, then publish it as the newest frame
+            with optFrame:
+                image = self._convertToPool(optFrame)
+            if image is not None:
+                self.latestSlot.publish(image, optFrame.blockId, optFrame.timeStamp)
+
+    # 从缓存池借出缓存并拷贝/转码，失败时归还缓存并返回 None
+    # convert a frame into a buffer lent by the frame pool, None (and the buffer returned) on failure
+    def _convertToPool(self, optFrame):
+        image = self.framePool.acquire(optFrame.params.pixelForamt,
+                                       optFrame.params.width, optFrame.params.height)
+        if image is None:
+            print("framePool exhausted! Timeout:[%s]s" % self.framePool.timeout)
+            return None
+        timing = self.frameTiming
+        if timing is not None:
+            started = time.perf_counter_ns()
+        if optFrame.copy_to(image) is None:
+            self.framePool.release(image)
+            return None
+        if timing is not None:
+            self._frameDone(timing, image, optFrame, started)
+        return image
+
+    def _frameDone(self, timing, image, optFrame, started):
+        if optFrame.delivered:
+            timing.frameDone(image, optFrame.timeStamp, optFrame.delivered, started, time.perf_counter_ns(),
+                             optFrame.params.pixelForamt != EPixelType.gvspPixelMono8)
+
+    # 开启逐帧阶段耗时统计（见 FrameTiming），hostClock 为空时仿真后端按同一时钟处理
+    # enable per-frame stage timing (see FrameTiming); hostClock defaults to True on the simulated backend
+    def enable_timing(self, hostClock=None):
+        if hostClock is None:
+            hostClock = sdkBackend() == SDK_BACKEND_SIM
+        if self.frameTiming is None:
+            self.frameTiming = FrameTiming(hostClock)
+        return self.frameTiming
+
+    def disable_timing(self):
+        self.frameTiming = None
+
+    # 各阶段耗时统计摘要（毫秒），未开启时返回 None
+    # stage timing summary in milliseconds, None while timing is disabled
+    def timing_stats(self):
+        timing = self.frameTiming
+        if timing is None:
+            return None
+        return timing.stats()
+
+    # 启动回调取图：SDK 回调线程只把帧放入有界队列，workers 个工作线程负责转码；
+    # consumer 为空时结果发布到 latestSlot，否则调用 consumer(image, blockId, timeStamp)，
+    # 由 consumer 负责调用 release_image(image) 归还缓存
+    # start callback acquisition: the SDK thread only queues the frame, `workers` threads convert it.
+    # Results go to latestSlot, or to consumer(image, blockId, timeStamp) which then owns the image
+    def start_callback(self, workers=1, queueSize=8, consumer=None):
+        if self.mode == ACQ_MODE_CALLBACK:
+            return 0
+        if self.mode != ACQ_MODE_POLL:
+            print("camera [%d] is in %s mode!" % (self.index, self.mode))
+            return -1
+        if self.latestSlot is None:
+            self.latestSlot = LatestFrameSlot(self.framePool)
+        self._consumer = consumer
+        self._frameQueue = queue.Queue(queueSize)
+        self._frameCallback = callbackFuncEx(self._onFrame)
+
+        # 先停止拉流，注册拉流回调后重新开始拉流
+        # stop grabbing, subscribe the grabbing callback, then start grabbing again
+        nRet = self.streamSource.contents.stopGrabbing(self.streamSource)
         if nRet != 0:
-            print("getFrame fail! Timeout:[1000]ms")
-            # 释放相关资源
-            # release stream source object before return
-            self.streamSource.contents.release(self.streamSource)
+            print("stopGrabbing fail!")
             return -1
-        else:
-            print("Camera [" + str(self.index) + "] getFrame success BlockId = [" + str(
-                frame.contents.getBlockId(frame)) + "], get frame time: " + str(
-                datetime.datetime.now()))
 
-        nRet = frame.contents.valid(frame)
+        nRet = self.streamSource.contents.attachGrabbingEx(self.streamSource, self._frameCallback, None)
+        if nRet != 0:
+            print("attachGrabbingEx fail!")
+            # 恢复 poll 模式的拉流
+            # resume grabbing in poll mode
+            self._startGrabbing()
+            self._frameQueue = None
+            self._frameCallback = None
+            self._consumer = None
+            return -1
+
+        self._acqRunning = True
+        self._workers = [threading.Thread(target=self._workerLoop, name="OptCamera-%d-worker-%d" % (self.index, i),
+                                          daemon=True) for i in range(workers)]
+        for worker in self._workers:
+            worker.start()
+        self.mode = ACQ_MODE_CALLBACK
+
+        nRet = self._startGrabbing()
+        if nRet != 0:
+            self.stop_callback()
+            return -1
+        return 0
+
+    # 停止回调取图，队列中未处理的帧全部释放
+    # stop callback acquisition, frames still queued are released
+    def stop_callback(self):
+        if self.mode != ACQ_MODE_CALLBACK:
+            return 0
+        nRet = self.streamSource.contents.detachGrabbingEx(self.streamSource, self._frameCallback, None)
+        if nRet != 0:
+            print("detachGrabbingEx fail!")
+
+        self._acqRunning = False
+        for worker in self._workers:
+            worker.join()
+        self._workers = []
+        while True:
+            try:
+                frame, delivered = self._frameQueue.get_nowait()
+            except queue.Empty:
+                break
+            self._frameAccessors(frame).release(frame)
+        self.latestSlot.clear()
+        self.mode = ACQ_MODE_POLL
+        return 0
+
+    # SDK 回调线程中只做入队，队列满时直接归还该帧
+    # runs on the SDK delivery thread: only queue the frame, give it back when the queue is full
+    def _onFrame(self, frame, userInfo):
+        delivered = time.perf_counter_ns() if self.frameTiming is not None else 0
+        try:
+            self._frameQueue.put_nowait((frame, delivered))
+        except queue.Full:
+            self.droppedFrames += 1
+            self._frameAccessors(frame).release(frame)
+
+    def _workerLoop(self):
+        while self._acqRunning:
+            try:
+                frame, delivered = self._frameQueue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            accessors = self._frameAccessors(frame)
+            nRet = accessors.valid(frame)
+            if nRet != 0:
+                print("frame is invalid!")
+                # 释放驱动图像缓存资源
+                # release frame resource before return
+                accessors.release(frame)
+                continue
+
+            with OptFrame(frame, accessors) as optFrame:
+                optFrame.delivered = delivered
+                image = self._convertToPool(optFrame)
+            if image is None:
+                continue
+            if self._consumer is not None:
+                timing = self.frameTiming
+                if timing is not None:
+                    timing.consumed(image)
+                self._consumer(image, optFrame.blockId, optFrame.timeStamp)
+            else:
+                self.latestSlot.publish(image, optFrame.blockId, optFrame.timeStamp)
+
+    # 取采集线程发布的最新一帧，返回 (image, seq)；lastSeq 不为空时等待比它更新的一帧
+    # newest frame published by the acquisition thread as (image, seq), waits for one newer than lastSeq if given
+    def get_latest(self, lastSeq=None, timeout=1.0):
+        if self.latestSlot is None or self.mode == ACQ_MODE_POLL:
+            print("acquisition thread is not running!")
+            return None, 0
+        image, seq = self.latestSlot.get(lastSeq, timeout)
+        timing = self.frameTiming
+        if timing is not None and image is not None:
+            timing.consumed(image)
+        return image, seq
+
+    # 主动取图，返回封装后的 OptFrame，图像视图直接指向SDK缓存，用完需 release（或使用 with 语句）
+    # get one frame as an OptFrame whose views point at the SDK buffer; release it (or use `with`) when done
+    def grab_frame(self, timeout=1000):
+        frame = pointer(GENICAM_Frame())
+        nRet = self.streamSource.contents.getFrame(self.streamSource, byref(frame), c_uint(timeout))
+        if nRet != 0:
+            print("getFrame fail! Timeout:[%d]ms" % timeout)
+            return None
+        delivered = time.perf_counter_ns() if self.frameTiming is not None else 0
+
+        accessors = self._frameAccessors(frame)
+        nRet = accessors.valid(frame)
         if nRet != 0:
             print("frame is invalid!")
             # 释放驱动图像缓存资源
             # release frame resource before return
-            frame.contents.release(frame)
+            accessors.release(frame)
+            return None
+
+        optFrame = OptFrame(frame, accessors)
+        optFrame.delivered = delivered
+        return optFrame
+
+    # 帧对象的函数指针每个流只取一次
+    # the frame function pointers are looked up once per stream
+    def _frameAccessors(self, frame):
+        accessors = self.frameAccessors
+        if accessors is None:
+            accessors = self.frameAccessors = FrameAccessors(frame)
+        return accessors
+
+    # 主动取图，返回一帧图像；传入 out 时直接写入该数组，否则写入缓存池中的数组，只做一次拷贝/转码
+    # get one frame as an image, copied/converted once into `out` or into a buffer lent by the frame pool
+    def get_image(self, out=None):
+        # 后台采集/回调模式下直接返回最新一帧
+        # the acquisition thread or the callback workers already hold the newest frame
+        if self.mode != ACQ_MODE_POLL:
+            cvImage, seq = self.get_latest()
+            if cvImage is None:
+                return -1
+            if out is not None:
+                numpy.copyto(out, cvImage)
+                self.release_image(cvImage)
+                return out
+            return cvImage
+
+        optFrame = self.grab_frame()
+        if optFrame is None:
             # 释放相关资源
             # release stream source object before return
             self.streamSource.contents.release(self.streamSource)
             return -1
-
-            # 给转码所需的参数赋值
-        # fill conversion parameter
-        imageParams = IMGCNV_SOpenParam()
-        imageParams.dataSize = frame.contents.getImageSize(frame)
-        imageParams.height = frame.contents.getImageHeight(frame)
-        imageParams.width = frame.contents.getImageWidth(frame)
-        imageParams.paddingX = frame.contents.getImagePaddingX(frame)
-        imageParams.paddingY = frame.contents.getImagePaddingY(frame)
-        imageParams.pixelForamt = frame.contents.getImagePixelFormat(frame)
-
-        # 将裸数据图像拷出
-        # copy image data out from frame
-        imageBuff = frame.contents.getImage(frame)
-        userBuff = c_buffer(b'\0', imageParams.dataSize)
-        memmove(userBuff, c_char_p(imageBuff), imageParams.dataSize)
-
-        # 释放驱动图像缓存
-        # release frame resource at the end of use
-        frame.contents.release(frame)
-
-        # 如果图像格式是 Mono8 直接使用
-        # no format conversion required for Mono8
-        if imageParams.pixelForamt == EPixelType.gvspPixelMono8:
-            grayByteArray = bytearray(userBuff)
-            cvImage = numpy.array(grayByteArray).reshape(imageParams.height, imageParams.width)
         else:
-            # 转码 => BGR24
-            # convert to BGR24
-            rgbSize = c_int()
-            rgbBuff = c_buffer(b'\0', imageParams.height * imageParams.width * 3)
-
-            nRet = IMGCNV_ConvertToBGR24(cast(userBuff, c_void_p),
-                                         byref(imageParams),
-                                         cast(rgbBuff, c_void_p),
-                                         byref(rgbSize))
-
-            colorByteArray = bytearray(rgbBuff)
-            cvImage = numpy.array(colorByteArray).reshape(imageParams.height, imageParams.width, 3)
-        # --- end if ---
-        gc.collect()
-        return cvImage
-
-        # --- end while ---
+            print("Camera [" + str(self.index) + "] getFrame success BlockId = [" + str(
+                optFrame.blockId) + "], get frame time: " + str(
+                datetime.datetime.now()))
 
-        # cv2.destroyAllWindows()
+        # 拷贝/转码完成后释放驱动图像缓存
+        # release frame resource once the image has been copied out
+        pooled = out is None
+        with optFrame:
+            if pooled:
+                out = self.framePool.acquire(optFrame.params.pixelForamt,
+                                             optFrame.params.width, optFrame.params.height)
+                if out is None:
+                    print("framePool exhausted! Timeout:[%s]s" % self.framePool.timeout)
+                    return -1
+            timing = self.frameTiming
+            if timing is not None:
+                started = time.perf_counter_ns()
+            cvImage = optFrame.copy_to(out)
+        # 拷贝/转码失败时把取自缓存池的缓存还回去
+        # give the pool buffer back when the copy/convert failed
+        if cvImage is None and pooled:
+            self.framePool.release(out)
+        if timing is not None and cvImage is not None:
+            self._frameDone(timing, cvImage, optFrame, started)
+            timing.consumed(cvImage)
+        return cvImage
 
-        # 停止拉流
-        # stop grabbing
+    # 连续取 n 帧，直接拷贝/转码到一个 (n, H, W[, C]) 数组中，不再逐帧 get_image() 后 numpy.stack；
+    # out 为预分配的数组，为空时按第一帧的尺寸分配；timeout 为每一帧的超时时间（ms）
+    # 只有 poll 模式是连续 n 帧且只拷贝一次；thread/callback 模式下是依次取到的 n 个最新帧，从缓存池再拷贝一次，
+    # 其间发布的帧被跳过，跳过的帧数见 FrameBatch.skipped
+    # grab n consecutive frames straight into one (n, H, W[, C]) array instead of stacking get_image() results;
+    # `out` is a preallocated array, allocated from the first frame when not given; timeout is per frame in ms.
+    # Only poll mode gives n consecutive frames with a single copy; thread/callback modes give the latest frame
+    # n times with a second copy out of the pool, frames published in between are skipped and counted in
+    # FrameBatch.skipped
+    def get_images(self, n, timeout=1000, out=None):
+        blockIds = numpy.zeros(n, dtype=numpy.uint64)
+        timeStamps = numpy.zeros(n, dtype=numpy.uint64)
+        count = 0
+        lastSeq = None
+        while count < n:
+            if self.mode == ACQ_MODE_POLL:
+                optFrame = self.grab_frame(timeout)
+                if optFrame is None:
+                    break
+                timing = self.frameTiming
+                if timing is not None:
+                    started = time.perf_counter_ns()
+                with optFrame:
+                    if out is None:
+                        out = numpy.empty((n,) + optFrame.shape, dtype=numpy.uint8)
+                    if out.shape[1:] != optFrame.shape:
+                        print("frame shape changed to %s, batch stops at [%d]" % (optFrame.shape, count))
+                        break
+                    if optFrame.copy_to(out[count]) is None:
+                        break
+                if timing is not None:
+                    self._frameDone(timing, None, optFrame, started)
+                blockId = optFrame.blockId
+                timeStamp = optFrame.timeStamp
+            else:
+                # 采集线程/回调模式下依次取比上一帧更新的最新帧，中间的帧被跳过
+                # thread/callback modes: take the latest frame newer than the previous one, skipping any in between
+                cvImage, lastSeq, blockId, timeStamp = self.latestSlot.getInfo(lastSeq, timeout / 1000.0)
+                if cvImage is None:
+                    print("get frame fail! Timeout:[%d]ms" % timeout)
+                    break
+                timing = self.frameTiming
+                if timing is not None:
+                    timing.consumed(cvImage)
+                if out is None:
+                    out = numpy.empty((n,) + cvImage.shape, dtype=numpy.uint8)
+                if out.shape[1:] != cvImage.shape:
+                    print("frame shape changed to %s, batch stops at [%d]" % (cvImage.shape, count))
+                    self.release_image(cvImage)
+                    break
+                numpy.copyto(out[count], cvImage)
+                self.release_image(cvImage)
+
+            blockIds[count] = blockId
+            timeStamps[count] = timeStamp
+            count += 1
+
+        if out is None:
+            return None
+        return FrameBatch(out, blockIds, timeStamps, count)
+
+    # 归还 get_image() 返回的图像缓存
+    # give an image returned by get_image() back to the frame pool
+    def release_image(self, image):
+        if self.latestSlot is not None and self.latestSlot.release(image):
+            return
+        self.framePool.release(image)
 
     def stop_grabbing(self):
+        self.stop_acquisition()
+        self.stop_callback()
+
         nRet = self.streamSource.contents.stopGrabbing(self.streamSource)
         if nRet != 0:
             print("stopGrabbing fail!")
@@ -177,11 +569,23 @@ class OptCamera:
 
     g_cameraStatusUserInfo = b"statusInfo"
 
+    # 连接状态回调的 userInfo => 相机对象，回调中据此找到掉线的相机
+    # status callback userInfo => camera, lets the callback find the camera that went offline
+    _statusUserInfos = {}
+
     # 相机连接状态回调函数
     # camera connection status change callback
     def deviceLinkNotify(connectArg, linkInfo):
         if EVType.offLine == connectArg.contents.m_event:
             print("camera has off line, userInfo [%s]" % c_char_p(linkInfo).value)
+            # 掉线后节点失效，下次使用时重新创建
+            # nodes die with the connection, they are recreated on next use
+            camera = OptCamera._statusUserInfos.get(c_char_p(linkInfo).value)
+            if camera is not None:
+                camera.nodeCache.markStale()
+                # 掉线期间可能收不到参数更新事件，缓存的属性值全部作废
+                # parameter update events may be missed while offline, drop every cached value
+                camera.paramCache.invalidate()
         elif EVType.onLine == connectArg.contents.m_event:
             print("camera has on line, userInfo [%s]" % c_char_p(linkInfo).value)
 
@@ -403,11 +807,31 @@ class OptCamera:
             print("subscribeCameraStatus fail!")
             return -1
 
+        # 注册参数更新回调，属性值读缓存据此失效；注册失败时不缓存，不影响使用
+        # subscribe parameter updates for the value cache; without them nothing is cached
+        self.paramCache.subscribe(self.camera)
+
+        # 注册流事件回调，丢帧/丢包等不需要轮询即可计数和告警
+        # subscribe stream events, losses are counted and reported without polling
+        self.streamEvents.subscribe(self.camera)
+
         return 0
 
     # 关闭相机
     # close camera
     def closeCamera(self):
+        # 断开连接前释放缓存的属性节点
+        # release the cached property nodes before disconnecting
+        self.nodeCache.invalidate()
+
+        # 反注册参数更新回调
+        # unsubscribe parameter update notify
+        self.paramCache.unsubscribe(self.camera)
+
+        # 反注册流事件回调
+        # unsubscribe stream events
+        self.streamEvents.unsubscribe(self.camera)
+
         # 反注册相机连接状态回调
         # unsubscribe camera connection status change
         nRet = self.unsubscribeCameraStatus()
@@ -428,14 +852,11 @@ class OptCamera:
     # set camera ExposureTime
     def setExposureTime(self, dVal):
         # 通用属性设置:设置曝光 --根据属性类型，直接构造属性节点。如曝光是 double类型，构造doubleNode节点
-        # create corresponding property node according to the value type of property, here is doubleNode
-        exposureTimeNode = pointer(GENICAM_DoubleNode())
-        exposureTimeNodeInfo = GENICAM_DoubleNodeInfo()
-        exposureTimeNodeInfo.pCamera = pointer(self.camera)
-        exposureTimeNodeInfo.attrName = b"ExposureTime"
-        nRet = GENICAM_createDoubleNode(byref(exposureTimeNodeInfo), byref(exposureTimeNode))
-        if nRet != 0:
-            print("create ExposureTime Node fail!")
+        # 节点由 nodeCache 缓存，连接期间只创建一次
+        # create corresponding property node according to the value type of property, here is doubleNode;
+        # nodeCache keeps it for the whole connection
+        exposureTimeNode = self.nodeCache.get(NODE_DOUBLE, b"ExposureTime")
+        if exposureTimeNode is None:
             return -1
 
         # 设置曝光时间
@@ -443,18 +864,100 @@ class OptCamera:
         nRet = exposureTimeNode.contents.setValue(exposureTimeNode, c_double(dVal))
         if nRet != 0:
             print("set ExposureTime value [%f]us fail!" % dVal)
-            # 释放相关资源
-            # release node resource before return
-            exposureTimeNode.contents.release(exposureTimeNode)
             return -1
         else:
             print("set ExposureTime value [%f]us success." % dVal)
+        self.paramCache.invalidate([b"ExposureTime"])
+        return 0
 
-        # 释放节点资源
-        # release node resource at the end of use
-        exposureTimeNode.contents.release(exposureTimeNode)
+    # 批量写入参数，按 像素格式 -> 几何尺寸 -> 触发 -> 曝光 的顺序写入，值未变化的属性跳过，
+    # 像素格式/几何尺寸有变化时先停止拉流、写完后重新开始拉流；返回 (nRet, timings)
+    #     camera.apply_config({"Width": 1280, "OffsetX": 64, "TriggerMode": "Off", "ExposureTime": 8000.0})
+    # apply many parameters at once ordered format -> geometry -> trigger -> exposure, skipping unchanged values;
+    # grabbing is stopped around format/geometry writes. Returns (nRet, timings)
+    def apply_config(self, config):
+        return applyConfig(self.paramCache, config, self._pauseGrabbing, self._resumeGrabbing)
+
+    def _pauseGrabbing(self):
+        nRet = self.streamSource.contents.stopGrabbing(self.streamSource)
+        if nRet != 0:
+            print("stopGrabbing fail!")
+            return -1
+        return 0
+
+    def _resumeGrabbing(self):
+        # 图像尺寸可能已变化，缓存池按新尺寸重新分配
+        # geometry may have changed, the frame pool reallocates for the new size
+        self.framePool.invalidate()
+        return self._startGrabbing()
+
+    # 按当前取流策略开始拉流
+    # start grabbing with the current grab strategy
+    def _startGrabbing(self):
+        nRet = self.streamSource.contents.startGrabbing(self.streamSource, c_ulonglong(0),
+                                                        c_int(_GRAB_STRATEGIES[self.grabStrategy]))
+        if nRet != 0:
+            print("startGrabbing fail!")
+            return -1
         return 0
 
+    def _setBufferCount(self, bufferCount):
+        nRet = self.streamSource.contents.setBufferCount(self.streamSource, c_uint(bufferCount))
+        if nRet != 0:
+            print("setBufferCount [%d] fail!" % bufferCount)
+            return -1
+        self.bufferCount = bufferCount
+        return 0
+
+    # 运行中切换取流策略和/或缓存个数（为空的保持不变）：停止拉流，设置后按新策略重新开始，取图方式不变
+    #     camera.set_grab_strategy(GRAB_LATEST, 2)
+    # switch the grab strategy and/or buffer count (None keeps the current one) while running: grabbing is
+    # stopped, reconfigured and restarted, the acquisition mode stays as it is
+    def set_grab_strategy(self, strategy=None, bufferCount=None):
+        if strategy is not None and strategy not in _GRAB_STRATEGIES:
+            print("unknown grab strategy [%s]!" % strategy)
+            return -1
+        if self._pauseGrabbing() != 0:
+            return -1
+        nRet = 0
+        if bufferCount is not None and self._setBufferCount(bufferCount) != 0:
+            nRet = -1
+        if strategy is not None:
+            self.grabStrategy = strategy
+        if self._startGrabbing() != 0:
+            return -1
+        return nRet
+
+    # 按 GRAB_PRESETS 中的预设切换
+    # switch to one of GRAB_PRESETS
+    def set_grab_preset(self, preset):
+        if preset not in GRAB_PRESETS:
+            print("unknown grab preset [%s]!" % preset)
+            return -1
+        bufferCount, strategy = GRAB_PRESETS[preset]
+        return self.set_grab_strategy(strategy, bufferCount)
+
+    # 读取属性值，未被参数更新事件作废的值直接取自缓存：int/double/bool 返回数值，enum 返回符号（bytes），失败返回 None
+    #     camera.getValue(NODE_DOUBLE, b"ExposureTime")
+    # read a property through the value cache: numbers for int/double/bool, the symbol (bytes) for enum, None on failure
+    def getValue(self, kind, attrName):
+        return self.paramCache.getValue(kind, attrName)
+
+    # 设置属性值，enum 传入符号（bytes），cmd 忽略 value 执行一次
+    # write a property, enum takes its symbol (bytes), cmd ignores value and executes once
+    def setValue(self, kind, attrName, value=None):
+        return self.paramCache.setValue(kind, attrName, value)
+
+    # 读取整型属性，失败返回 None
+    # read an integer property, None on failure
+    def getIntValue(self, attrName):
+        return self.paramCache.getValue(NODE_INT, attrName)
+
+    # 设置整型属性
+    # set an integer property
+    def setIntValue(self, attrName, value):
+        return self.paramCache.setValue(NODE_INT, attrName, value)
+
     def grabOne(self):
         # 创建流对象
         # create stream source object
@@ -505,152 +1008,68 @@ class OptCamera:
     # 设置感兴趣区域  --- 感兴趣区域的宽高 和 xy方向的偏移量  入参值应符合对应相机的递增规则
     # set ROI ---Height, width, offsetX, offsetY. Input value shall comply with the step length and Max & Min limits.
     def setROI(self, OffsetX, OffsetY, nWidth, nHeight):
-        # 获取原始的宽度
-        # get the max width of image
-        widthMaxNode = pointer(GENICAM_IntNode())
-        widthMaxNodeInfo = GENICAM_IntNodeInfo()
-        widthMaxNodeInfo.pCamera = pointer(self.camera)
-        widthMaxNodeInfo.attrName = b"WidthMax"
-        nRet = GENICAM_createIntNode(byref(widthMaxNodeInfo), byref(widthMaxNode))
-        if nRet != 0:
-            print("create WidthMax Node fail!")
+        # 获取原始的宽度和高度
+        # get the max width and height of image
+        oriWidth = self.getIntValue(b"WidthMax")
+        if oriWidth is None:
             return -1
-
-        oriWidth = c_longlong()
-        nRet = widthMaxNode.contents.getValue(widthMaxNode, byref(oriWidth))
-        if nRet != 0:
-            print("widthMaxNode getValue fail!")
-            # 释放相关资源
-            # release node resource before return
-            widthMaxNode.contents.release(widthMaxNode)
+        oriHeight = self.getIntValue(b"HeightMax")
+        if oriHeight is None:
             return -1
 
-            # 释放相关资源
-        # release node resource at the end of use
-        widthMaxNode.contents.release(widthMaxNode)
-
-        # 获取原始的高度
-        # get the max height of image
-        heightMaxNode = pointer(GENICAM_IntNode())
-        heightMaxNodeInfo = GENICAM_IntNodeInfo()
-        heightMaxNodeInfo.pCamera = pointer(self.camera)
-        heightMaxNodeInfo.attrName = b"HeightMax"
-        nRet = GENICAM_createIntNode(byref(heightMaxNodeInfo), byref(heightMaxNode))
-        if nRet != 0:
-            print("create HeightMax Node fail!")
-            return -1
-
-        oriHeight = c_longlong()
-        nRet = heightMaxNode.contents.getValue(heightMaxNode, byref(oriHeight))
-        if nRet != 0:
-            print("heightMaxNode getValue fail!")
-            # 释放相关资源
-            # release node resource before return
-            heightMaxNode.contents.release(heightMaxNode)
-            return -1
-
-        # 释放相关资源
-        # release node resource at the end of use
-        heightMaxNode.contents.release(heightMaxNode)
-
         # 检验参数
         # check parameter valid
-        if (oriWidth.value < (OffsetX + nWidth)) or (oriHeight.value < (OffsetY + nHeight)):
+        if (oriWidth < (OffsetX + nWidth)) or (oriHeight < (OffsetY + nHeight)):
             print("please check input param!")
             return -1
 
-        # 设置宽度
-        # set image width
-        widthNode = pointer(GENICAM_IntNode())
-        widthNodeInfo = GENICAM_IntNodeInfo()
-        widthNodeInfo.pCamera = pointer(self.camera)
-        widthNodeInfo.attrName = b"Width"
-        nRet = GENICAM_createIntNode(byref(widthNodeInfo), byref(widthNode))
-        if nRet != 0:
-            print("create Width Node fail!")
-            return -1
-
-        nRet = widthNode.contents.setValue(widthNode, c_longlong(nWidth))
-        if nRet != 0:
-            print("widthNode setValue [%d] fail!" % nWidth)
-            # 释放相关资源
-            # release node resource before return
-            widthNode.contents.release(widthNode)
-            return -1
-
-            # 释放相关资源
-        # release node resource at the end of use
-        widthNode.contents.release(widthNode)
+        # 依次设置宽度、高度、OffsetX、OffsetY
+        # set image width, height, OffsetX and OffsetY in turn
+        for attrName, value in ((b"Width", nWidth), (b"Height", nHeight), (b"OffsetX", OffsetX), (b"OffsetY", OffsetY)):
+            nRet = self.setIntValue(attrName, value)
+            if nRet != 0:
+                return -1
 
-        # 设置高度
-        # set image height
-        heightNode = pointer(GENICAM_IntNode())
-        heightNodeInfo = GENICAM_IntNodeInfo()
-        heightNodeInfo.pCamera = pointer(self.camera)
-        heightNodeInfo.attrName = b"Height"
-        nRet = GENICAM_createIntNode(byref(heightNodeInfo), byref(heightNode))
-        if nRet != 0:
-            print("create Height Node fail!")
-            return -1
+        # 图像尺寸已变化，缓存池按新尺寸重新分配
+        # geometry changed, the frame pool reallocates for the new size
+        self.framePool.invalidate()
+        return 0
 
-        nRet = heightNode.contents.setValue(heightNode, c_longlong(nHeight))
-        if nRet != 0:
-            print("heightNode setValue [%d] fail!" % nHeight)
-            # 释放相关资源
-            # release node resource before return
-            heightNode.contents.release(heightNode)
-            return -1
 
-            # 释放相关资源
-        # release node resource at the end of use
-        heightNode.contents.release(heightNode)
+# 多个相机同时取批：每个相机一个线程，out 为预分配的 (相机数, n, H, W[, C]) 数组时各相机写入 out[i]，
+# 返回与 cameras 对应的 FrameBatch 列表（失败的相机为 None）
+# batch grab on several cameras at once, one thread per camera; with a preallocated
+# (cameras, n, H, W[, C]) `out` camera i writes into out[i]. Returns FrameBatch objects in camera order
+def get_images_all(cameras, n, timeout=1000, out=None):
+    batches = [None] * len(cameras)
 
-        # 设置OffsetX
-        # set OffsetX
-        OffsetXNode = pointer(GENICAM_IntNode())
-        OffsetXNodeInfo = GENICAM_IntNodeInfo()
-        OffsetXNodeInfo.pCamera = pointer(self.camera)
-        OffsetXNodeInfo.attrName = b"OffsetX"
-        nRet = GENICAM_createIntNode(byref(OffsetXNodeInfo), byref(OffsetXNode))
-        if nRet != 0:
-            print("create OffsetX Node fail!")
-            return -1
+    def grab(i, camera):
+        batches[i] = camera.get_images(n, timeout, None if out is None else out[i])
 
-        nRet = OffsetXNode.contents.setValue(OffsetXNode, c_longlong(OffsetX))
-        if nRet != 0:
-            print("OffsetX setValue [%d] fail!" % OffsetX)
-            # 释放相关资源
-            # release node resource before return
-            OffsetXNode.contents.release(OffsetXNode)
-            return -1
+    threads = [threading.Thread(target=grab, args=(i, camera)) for i, camera in enumerate(cameras)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return batches
 
-            # 释放相关资源
-        # release node resource at the end of use
-        OffsetXNode.contents.release(OffsetXNode)
 
-        # 设置OffsetY
-        # set OffsetY
-        OffsetYNode = pointer(GENICAM_IntNode())
-        OffsetYNodeInfo = GENICAM_IntNodeInfo()
-        OffsetYNodeInfo.pCamera = pointer(self.camera)
-        OffsetYNodeInfo.attrName = b"OffsetY"
-        nRet = GENICAM_createIntNode(byref(OffsetYNodeInfo), byref(OffsetYNode))
-        if nRet != 0:
-            print("create OffsetY Node fail!")
-            return -1
+# 多个相机并行写入参数，config 为所有相机共用的字典或与 cameras 对应的字典列表，返回各相机的 (nRet, timings)
+# apply configs to several cameras in parallel; `config` is one dict for all or one dict per camera.
+# Returns (nRet, timings) per camera
+def apply_config_all(cameras, config):
+    configs = config if isinstance(config, (list, tuple)) else [config] * len(cameras)
+    results = [None] * len(cameras)
 
-        nRet = OffsetYNode.contents.setValue(OffsetYNode, c_longlong(OffsetY))
-        if nRet != 0:
-            print("OffsetY setValue [%d] fail!" % OffsetY)
-            # 释放相关资源
-            # release node resource before return
-            OffsetYNode.contents.release(OffsetYNode)
-            return -1
+    def apply(i, camera):
+        results[i] = camera.apply_config(configs[i])
 
-            # 释放相关资源
-        # release node resource at the end of use
-        OffsetYNode.contents.release(OffsetYNode)
-        return 0
+    threads = [threading.Thread(target=apply, args=(i, camera)) for i, camera in enumerate(cameras)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
 
 
 # 枚举相机
@@ -700,19 +1119,27 @@ if __name__ == '__main__':
         print("Model  name   = " + str(camera_info.getModelName(camera_info)))
         print("Serial number = " + str(camera_info.getSerialNumber(camera_info)))
         print("-------------------------------")
-        camera = OptCamera(index, camera_info)
+        camera = OptCamera(index, camera_info, mode=ACQ_MODE_THREAD)
         camera_list.append(camera)
 
+    # 启动完成后冻结已有对象，取图循环中不再主动调用 gc.collect()
+    # freeze startup objects, the grabbing loop no longer calls gc.collect()
+    gcMonitor = GcMonitor()
+    gcMonitor.start()
+    freezeAfterStartup()
+
     while True:
         cvImage = camera_list[0].get_image()
         cv2.imshow(f'myWindow0', cvImage)
+        camera_list[0].release_image(cvImage)
         cvImage = camera_list[1].get_image()
         cv2.imshow(f'myWindow1', cvImage)
-        gc.collect()
+        camera_list[1].release_image(cvImage)
 
         if cv2.waitKey(1) >= 0:
             # isGrab = False
             break
+    print("gc stats: %s" % gcMonitor.stats())
     print("--------- Demo end ---------")
     # 3s exit
     time.sleep(0.5)
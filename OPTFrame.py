@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+# coding: utf-8
+'''
+Created on 2026-10-16
+
+@author:
+'''
+
+import numpy
+
+from ImageConvert import *
+from OPTSDK import *
+from PixelConvert import convertToBGR24
+from PixelUnpack import PACKED_FORMATS, unpack
+
+
+# 根据像素格式和宽高计算输出图像的形状，Mono8 为灰度图，其余格式统一转码为 BGR24
+# shape of the output image: Mono8 stays gray, every other format is converted to BGR24
+def frameShape(pixelFormat, width, height):
+    if pixelFormat == EPixelType.gvspPixelMono8:
+        return (height, width)
+    return (height, width, 3)
+
+
+class FrameAccessors:
+    """
+    GENICAM_Frame 中每帧都要调用的函数指针，每个流只从第一帧中取一次并缓存，
+    之后的帧直接调用缓存的函数，不再每次都经过 frame.contents 和结构体字段查找。
+    同一个流的所有帧由同一份 SDK 实现提供，函数指针相同。
+
+        accessors = FrameAccessors(frame)
+        view = FrameView(frame, accessors)
+    """
+    __slots__ = ("getImageSize", "getImageHeight", "getImageWidth", "getImagePaddingX", "getImagePaddingY",
+                 "getImagePixelFormat", "getBlockId", "getImageTimeStamp", "getImage", "valid", "addRef", "release")
+
+    def __init__(self, frame):
+        contents = frame.contents
+        for name in self.__slots__:
+            # 结构体字段读出的函数对象仍指向该帧的内存，帧归还后会失效，这里按地址复制一份独立的函数指针
+            # a function read from a struct field still points into that frame's memory, which the SDK
+            # reuses once the frame is released, so copy the function address into a standalone pointer
+            func = getattr(contents, name)
+            setattr(self, name, type(func)(cast(func, c_void_p).value))
+
+
+class FrameView:
+    """
+    一帧的元数据，通过缓存的函数指针一次读出，保存在 __slots__ 中。
+    """
+    __slots__ = ("frame", "accessors", "dataSize", "height", "width", "paddingX", "paddingY",
+                 "pixelFormat", "blockId", "timeStamp", "imageBuff")
+
+    def __init__(self, frame, accessors):
+        self.frame = frame
+        self.accessors = accessors
+        self.dataSize = accessors.getImageSize(frame)
+        self.height = accessors.getImageHeight(frame)
+        self.width = accessors.getImageWidth(frame)
+        self.paddingX = accessors.getImagePaddingX(frame)
+        self.paddingY = accessors.getImagePaddingY(frame)
+        self.pixelFormat = accessors.getImagePixelFormat(frame)
+        self.blockId = accessors.getBlockId(frame)
+        self.timeStamp = accessors.getImageTimeStamp(frame)
+        self.imageBuff = accessors.getImage(frame)
+
+    # 转码所需的参数
+    # conversion parameters of this frame
+    def params(self):
+        return IMGCNV_SOpenParam(self.width, self.height, self.paddingX, self.paddingY,
+                                 self.dataSize, self.pixelFormat)
+
+
+class OptFrame:
+    """
+    GENICAM_Frame 的封装，图像数据以 numpy 视图的形式直接指向 SDK 的图像缓存，不做拷贝。
+    视图在 release() 之前有效，推荐通过 with 语句使用，退出时自动归还 SDK 缓存：
+
+        with camera.grab_frame() as frame:
+            image = frame.image()      # Mono8 零拷贝视图
+            bgr = frame.copy_to(out)   # 其他格式一次转码写入目标数组
+
+    连续取图时传入同一个流缓存的 FrameAccessors，省去每帧重新查找函数指针。
+    """
+    def __init__(self, frame, accessors=None):
+        if accessors is None:
+            accessors = FrameAccessors(frame)
+        self.frame = frame
+        self.accessors = accessors
+        self._released = False
+        # SDK 交付该帧的主机时刻（time.perf_counter_ns()），仅在开启阶段耗时统计时由 OptCamera 填写
+        # host instant the SDK delivered the frame, filled in by OptCamera while stage timing is enabled
+        self.delivered = 0
+
+        self.view = view = FrameView(frame, accessors)
+        # 给转码所需的参数赋值
+        # fill conversion parameter
+        self.params = view.params()
+        self.blockId = view.blockId
+        self.timeStamp = view.timeStamp
+        self.imageBuff = view.imageBuff
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.release()
+        return False
+
+    @property
+    def shape(self):
+        return frameShape(self.params.pixelForamt, self.params.width, self.params.height)
+
+    # 增加引用计数，需要在 with 之外继续持有帧时使用，每次 addRef 都要对应一次 release
+    # keep the SDK buffer alive beyond the with block, every addRef needs a matching release
+    def addRef(self):
+        self._checkValid()
+        return self.accessors.addRef(self.frame)
+
+    # 释放驱动图像缓存，之后所有视图都不可再访问
+    # give the buffer back to the SDK, views taken from this frame are invalid afterwards
+    def release(self):
+        if self._released:
+            return 0
+        self._released = True
+        return self.accessors.release(self.frame)
+
+    def _checkValid(self):
+        if self._released:
+            raise RuntimeError("frame [%d] has been released" % self.blockId)
+
+    # 裸数据的一维 uint8 视图
+    # 1-D uint8 view over the raw SDK buffer
+    def raw(self):
+        self._checkValid()
+        return numpy.ctypeslib.as_array(cast(c_void_p(self.imageBuff), POINTER(c_ubyte)),
+                                        shape=(self.params.dataSize,))
+
+    # Mono8 图像的二维视图（含 paddingX 时为带步长的视图），其他格式返回 None
+    # 2-D view for Mono8 images (strided when paddingX is set), None for other formats
+    def image(self):
+        if self.params.pixelForamt != EPixelType.gvspPixelMono8:
+            return None
+        height = self.params.height
+        width = self.params.width
+        stride = width + self.params.paddingX
+        return self.raw()[:height * stride].reshape(height, stride)[:, :width]
+
+    # 拷贝/转码到目标数组，Mono8 拷贝一次，其他格式由转码后端直接写入目标数组
+    # copy or convert into `out` in a single pass; allocates `out` when not given
+    def copy_to(self, out=None):
+        self._checkValid()
+        shape = self.shape
+        if out is None:
+            out = numpy.empty(shape, dtype=numpy.uint8)
+        elif out.shape != shape or out.dtype != numpy.uint8 or not out.flags.c_contiguous:
+            raise ValueError("target array must be C-contiguous uint8 of shape %s" % (shape,))
+
+        # 如果图像格式是 Mono8 直接使用
+        # no format conversion required for Mono8
+        if self.params.pixelForamt == EPixelType.gvspPixelMono8:
+            numpy.copyto(out, self.image())
+        else:
+            # 转码 => BGR24，按像素格式选择 ImageConvert / OpenCV / NumPy 后端
+            # convert to BGR24 with the backend chosen for the pixel format
+            if convertToBGR24(self.imageBuff, self.params, out) is None:
+                return None
+        return out
+
+    # 高位深单通道图像（10/12 位打包格式或 16 位存储的 Mono/Bayer）解包为 uint16 二维数组，保留原始位深
+    # unpack a deep single channel frame (10/12-bit packed, or Mono/Bayer stored in 16 bits)
+    # into a (height, width) uint16 array keeping its bit depth; allocates `out` when not given
+    def unpack(self, out=None):
+        self._checkValid()
+        pixelFormat = self.params.pixelForamt
+        height = self.params.height
+        width = self.params.width
+        if out is None:
+            out = numpy.empty((height, width), dtype=numpy.uint16)
+        elif out.shape != (height, width) or out.dtype != numpy.uint16 or not out.flags.c_contiguous:
+            raise ValueError("target array must be C-contiguous uint16 of shape %s" % ((height, width),))
+
+        if pixelFormat in PACKED_FORMATS:
+            if self.params.paddingX != 0:
+                raise ValueError("packed frames with paddingX are not supported")
+            return unpack(pixelFormat, self.raw(), out)
+
+        if (pixelFormat & GVSP_PIX_COLOR_MASK) == GVSP_PIX_MONO and \
+                (pixelFormat & GVSP_PIX_EFFECTIVE_PIXEL_SIZE_MASK) == GVSP_PIX_OCCUPY16BIT:
+            stride = width + self.params.paddingX
+            raw16 = self.raw()[:height * stride * 2].view("<u2")
+            numpy.copyto(out, raw16.reshape(height, stride)[:, :width])
+            return out
+        raise ValueError("pixel format [0x%08x] is not a single channel format deeper than 8 bits" % pixelFormat)
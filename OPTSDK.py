@@ -7,17 +7,18 @@ Created on 2017-10-18
 '''
 from ctypes import *
 
+from SDKLoader import SDKLibrary
+
 #定义枚举类型
 #define enum type
 def enum(**enums):
     return type('Enum', (), enums)
 
-#加载SDK动态库
-#load SDK library
-# 32bit
-#OPTSDKdll = OleDLL("./dll/x86/OPTSDK.dll")
-# 64bit
-OPTSDKdll = OleDLL("./dll/x64/OPTSDK.dll")
+#加载SDK动态库：第一次调用其中的函数时才加载，按解释器位数选择 dll/x64 或 dll/x86，
+#可用环境变量 OPTSDK_DLL_DIR 指定目录；未安装 SDK 时 import 仍然成功
+#load SDK library on first call, dll/x64 or dll/x86 by interpreter bitness,
+#OPTSDK_DLL_DIR overrides the directory; importing works without the SDK installed
+OPTSDKdll = SDKLibrary("OPTSDK")
 
 #SDK.h => define 宏定义
 MAX_PARAM_CNT        = 1000
@@ -164,26 +165,26 @@ GENICAM_EProtocolType = enum(
 class GENICAM_Camera(Structure):
     pass
 
-GENICAM_Camera_addRef  = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_Camera)) #返回值 参数1 参数2 参数3 ......
-GENICAM_Camera_release = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_Camera))
-GENICAM_Camera_getType = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_Camera))
-GENICAM_Camera_getName = eval('CFUNCTYPE')(c_char_p, POINTER(GENICAM_Camera))
-GENICAM_Camera_getKey  = eval('CFUNCTYPE')(c_char_p, POINTER(GENICAM_Camera))
-GENICAM_Camera_connect = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_Camera), c_int)
-GENICAM_Camera_disConnect = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_Camera))
-GENICAM_Camera_isConnect = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_Camera))
-GENICAM_Camera_getInterfaceName = eval('CFUNCTYPE')(c_char_p, POINTER(GENICAM_Camera))
-GENICAM_Camera_getInterfaceType = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_Camera))
-GENICAM_Camera_downLoadGenICamXML = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_Camera), c_char_p)
-GENICAM_Camera_getVendorName = eval('CFUNCTYPE')(c_char_p, POINTER(GENICAM_Camera))
-GENICAM_Camera_getModelName = eval('CFUNCTYPE')(c_char_p, POINTER(GENICAM_Camera))
-GENICAM_Camera_getSerialNumber = eval('CFUNCTYPE')(c_char_p, POINTER(GENICAM_Camera))
-GENICAM_Camera_getDeviceVersion = eval('CFUNCTYPE')(c_char_p, POINTER(GENICAM_Camera))
-GENICAM_Camera_getManufactureInfo = eval('CFUNCTYPE')(c_char_p, POINTER(GENICAM_Camera))
-GENICAM_Camera_saveDeviceCfg = eval('CFUNCTYPE')(c_uint, POINTER(GENICAM_Camera),c_char_p)
-GENICAM_Camera_loadDeviceCfg = eval('CFUNCTYPE')(c_uint, POINTER(GENICAM_Camera),c_char_p,POINTER(c_char*MAX_STRING_LENTH),POINTER(c_uint))
-GENICAM_Camera_writeUARTData = eval('CFUNCTYPE')(c_uint, POINTER(GENICAM_Camera),c_void_p,c_uint)
-GENICAM_Camera_readUARTData=eval('CFUNCTYPE')(c_uint, POINTER(GENICAM_Camera),c_void_p,c_uint)
+GENICAM_Camera_addRef  = CFUNCTYPE(c_int, POINTER(GENICAM_Camera)) #返回值 参数1 参数2 参数3 ......
+GENICAM_Camera_release = CFUNCTYPE(c_int, POINTER(GENICAM_Camera))
+GENICAM_Camera_getType = CFUNCTYPE(c_int, POINTER(GENICAM_Camera))
+GENICAM_Camera_getName = CFUNCTYPE(c_char_p, POINTER(GENICAM_Camera))
+GENICAM_Camera_getKey  = CFUNCTYPE(c_char_p, POINTER(GENICAM_Camera))
+GENICAM_Camera_connect = CFUNCTYPE(c_int, POINTER(GENICAM_Camera), c_int)
+GENICAM_Camera_disConnect = CFUNCTYPE(c_int, POINTER(GENICAM_Camera))
+GENICAM_Camera_isConnect = CFUNCTYPE(c_int, POINTER(GENICAM_Camera))
+GENICAM_Camera_getInterfaceName = CFUNCTYPE(c_char_p, POINTER(GENICAM_Camera))
+GENICAM_Camera_getInterfaceType = CFUNCTYPE(c_int, POINTER(GENICAM_Camera))
+GENICAM_Camera_downLoadGenICamXML = CFUNCTYPE(c_int, POINTER(GENICAM_Camera), c_char_p)
+GENICAM_Camera_getVendorName = CFUNCTYPE(c_char_p, POINTER(GENICAM_Camera))
+GENICAM_Camera_getModelName = CFUNCTYPE(c_char_p, POINTER(GENICAM_Camera))
+GENICAM_Camera_getSerialNumber = CFUNCTYPE(c_char_p, POINTER(GENICAM_Camera))
+GENICAM_Camera_getDeviceVersion = CFUNCTYPE(c_char_p, POINTER(GENICAM_Camera))
+GENICAM_Camera_getManufactureInfo = CFUNCTYPE(c_char_p, POINTER(GENICAM_Camera))
+GENICAM_Camera_saveDeviceCfg = CFUNCTYPE(c_uint, POINTER(GENICAM_Camera),c_char_p)
+GENICAM_Camera_loadDeviceCfg = CFUNCTYPE(c_uint, POINTER(GENICAM_Camera),c_char_p,POINTER(c_char*MAX_STRING_LENTH),POINTER(c_uint))
+GENICAM_Camera_writeUARTData = CFUNCTYPE(c_uint, POINTER(GENICAM_Camera),c_void_p,c_uint)
+GENICAM_Camera_readUARTData=CFUNCTYPE(c_uint, POINTER(GENICAM_Camera),c_void_p,c_uint)
 GENICAM_Camera._fields_ = [
                 ('priv', c_void_p),
                 ('addRef', GENICAM_Camera_addRef),
@@ -266,17 +267,17 @@ class GENICAM_DeviceInfo (Structure):
 class GENICAM_System(Structure):
     pass
 
-GENICAM_System_addRef = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_System)) 
-GENICAM_System_release = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_System))
-GENICAM_System_discovery = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_System), POINTER(POINTER(GENICAM_Camera)), \
+GENICAM_System_addRef = CFUNCTYPE(c_int, POINTER(GENICAM_System)) 
+GENICAM_System_release = CFUNCTYPE(c_int, POINTER(GENICAM_System))
+GENICAM_System_discovery = CFUNCTYPE(c_int, POINTER(GENICAM_System), POINTER(POINTER(GENICAM_Camera)), \
                                                POINTER(c_uint), c_int)
-GENICAM_System_getCamera = eval('CFUNCTYPE')(POINTER(GENICAM_Camera), POINTER(GENICAM_System), c_char_p)
-GENICAM_System_getCameraByDeviceUserID = eval('CFUNCTYPE')(POINTER(GENICAM_Camera), POINTER(GENICAM_System), c_char_p)
-GENICAM_System_getCameraByIP = eval('CFUNCTYPE')(POINTER(GENICAM_Camera), POINTER(GENICAM_System), c_char_p)
-GENICAM_System_getVersion = eval('CFUNCTYPE')(c_char_p, POINTER(GENICAM_System))
-GENICAM_System_enumDevicesInfo = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_System), POINTER(POINTER(GENICAM_DeviceInfo)), \
+GENICAM_System_getCamera = CFUNCTYPE(POINTER(GENICAM_Camera), POINTER(GENICAM_System), c_char_p)
+GENICAM_System_getCameraByDeviceUserID = CFUNCTYPE(POINTER(GENICAM_Camera), POINTER(GENICAM_System), c_char_p)
+GENICAM_System_getCameraByIP = CFUNCTYPE(POINTER(GENICAM_Camera), POINTER(GENICAM_System), c_char_p)
+GENICAM_System_getVersion = CFUNCTYPE(c_char_p, POINTER(GENICAM_System))
+GENICAM_System_enumDevicesInfo = CFUNCTYPE(c_int, POINTER(GENICAM_System), POINTER(POINTER(GENICAM_DeviceInfo)), \
                                                POINTER(c_uint), c_int)
-GENICAM_System_createDevice = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_System), POINTER(GENICAM_DeviceInfo), \
+GENICAM_System_createDevice = CFUNCTYPE(c_int, POINTER(GENICAM_System), POINTER(GENICAM_DeviceInfo), \
                                                POINTER(POINTER(GENICAM_Camera)))
 GENICAM_System._fields_ = [
                 ('priv', c_void_p),
@@ -310,25 +311,25 @@ GENICAM_EPayloadType = enum(
 class GENICAM_Frame(Structure):
     pass
 
-GENICAM_Frame_addRef = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_Frame))
-GENICAM_Frame_release = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_Frame))
-GENICAM_Frame_clone = eval('CFUNCTYPE')(POINTER(GENICAM_Frame), POINTER(GENICAM_Frame))
-GENICAM_Frame_reset = eval('CFUNCTYPE')(None, POINTER(GENICAM_Frame))
-GENICAM_Frame_valid = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_Frame))
-GENICAM_Frame_getImage = eval('CFUNCTYPE')(c_void_p, POINTER(GENICAM_Frame))
-GENICAM_Frame_getFrameStatus = eval('CFUNCTYPE')(c_uint, POINTER(GENICAM_Frame))
-GENICAM_Frame_getImageWidth = eval('CFUNCTYPE')(c_uint, POINTER(GENICAM_Frame))
-GENICAM_Frame_getImageHeight = eval('CFUNCTYPE')(c_uint, POINTER(GENICAM_Frame))
-GENICAM_Frame_getImageSize = eval('CFUNCTYPE')(c_uint, POINTER(GENICAM_Frame))
-GENICAM_Frame_getImagePixelFormat = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_Frame))
-GENICAM_Frame_getImageTimeStamp = eval('CFUNCTYPE')(c_ulonglong, POINTER(GENICAM_Frame))
-GENICAM_Frame_getBlockId = eval('CFUNCTYPE')(c_ulonglong, POINTER(GENICAM_Frame))
-GENICAM_Frame_getPayLoadTypes = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_Frame), c_int * MAX_PAYLOAD_TYPE_CNT, POINTER(c_uint))
-GENICAM_Frame_getChunkCount = eval('CFUNCTYPE')(c_uint, POINTER(GENICAM_Frame))
-GENICAM_Frame_getChunkDataByIndex = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_Frame), c_uint, POINTER(c_uint), \
+GENICAM_Frame_addRef = CFUNCTYPE(c_int, POINTER(GENICAM_Frame))
+GENICAM_Frame_release = CFUNCTYPE(c_int, POINTER(GENICAM_Frame))
+GENICAM_Frame_clone = CFUNCTYPE(POINTER(GENICAM_Frame), POINTER(GENICAM_Frame))
+GENICAM_Frame_reset = CFUNCTYPE(None, POINTER(GENICAM_Frame))
+GENICAM_Frame_valid = CFUNCTYPE(c_int, POINTER(GENICAM_Frame))
+GENICAM_Frame_getImage = CFUNCTYPE(c_void_p, POINTER(GENICAM_Frame))
+GENICAM_Frame_getFrameStatus = CFUNCTYPE(c_uint, POINTER(GENICAM_Frame))
+GENICAM_Frame_getImageWidth = CFUNCTYPE(c_uint, POINTER(GENICAM_Frame))
+GENICAM_Frame_getImageHeight = CFUNCTYPE(c_uint, POINTER(GENICAM_Frame))
+GENICAM_Frame_getImageSize = CFUNCTYPE(c_uint, POINTER(GENICAM_Frame))
+GENICAM_Frame_getImagePixelFormat = CFUNCTYPE(c_int, POINTER(GENICAM_Frame))
+GENICAM_Frame_getImageTimeStamp = CFUNCTYPE(c_ulonglong, POINTER(GENICAM_Frame))
+GENICAM_Frame_getBlockId = CFUNCTYPE(c_ulonglong, POINTER(GENICAM_Frame))
+GENICAM_Frame_getPayLoadTypes = CFUNCTYPE(c_int, POINTER(GENICAM_Frame), c_int * MAX_PAYLOAD_TYPE_CNT, POINTER(c_uint))
+GENICAM_Frame_getChunkCount = CFUNCTYPE(c_uint, POINTER(GENICAM_Frame))
+GENICAM_Frame_getChunkDataByIndex = CFUNCTYPE(c_int, POINTER(GENICAM_Frame), c_uint, POINTER(c_uint), \
                                                       c_char* MAX_STRING_LENTH * MAX_PARAM_CNT, POINTER(c_uint))
-GENICAM_Frame_getImagePaddingX = eval('CFUNCTYPE')(c_uint, POINTER(GENICAM_Frame))
-GENICAM_Frame_getImagePaddingY = eval('CFUNCTYPE')(c_uint, POINTER(GENICAM_Frame))
+GENICAM_Frame_getImagePaddingX = CFUNCTYPE(c_uint, POINTER(GENICAM_Frame))
+GENICAM_Frame_getImagePaddingY = CFUNCTYPE(c_uint, POINTER(GENICAM_Frame))
 
 GENICAM_Frame._fields_ = [
                 ('priv', c_void_p),
@@ -363,10 +364,10 @@ GENICAM_EGrabStrategy = enum(
                              )
 
 #SDK.h => void(*callbackFun)(GENICAM_Frame* pFrame) 回调函数原型
-callbackFunc = eval('CFUNCTYPE')(None, POINTER(GENICAM_Frame))
+callbackFunc = CFUNCTYPE(None, POINTER(GENICAM_Frame))
 
 #SDK.h => void(*callbackFunEx)(GENICAM_Frame* pFrame, void* pUser);
-callbackFuncEx = eval('CFUNCTYPE')(None, POINTER(GENICAM_Frame), c_void_p)
+callbackFuncEx = CFUNCTYPE(None, POINTER(GENICAM_Frame), c_void_p)
 
 #SDK.h => struct GENICAM_PCIEStreamStatsInfo
 class GENICAM_PCIEStreamStatsInfo(Structure):
@@ -432,22 +433,22 @@ class GENICAM_StreamStatisticsInfo (Structure):
 class GENICAM_StreamSource(Structure):
     pass
 
-GENICAM_StreamSource_addRef = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_StreamSource))
-GENICAM_StreamSource_release = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_StreamSource))
-GENICAM_StreamSource_startGrabbing = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_StreamSource), c_ulonglong, c_int)
-GENICAM_StreamSource_stopGrabbing = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_StreamSource))
-GENICAM_StreamSource_isGrabbing = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_StreamSource))
-GENICAM_StreamSource_getFrame = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_StreamSource), POINTER(POINTER(GENICAM_Frame)), c_uint)
-GENICAM_StreamSource_attachGrabbing = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_StreamSource), callbackFunc)
-GENICAM_StreamSource_detachGrabbing = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_StreamSource), callbackFunc)
-GENICAM_StreamSource_setBufferCount = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_StreamSource), c_uint)
-GENICAM_StreamSource_attachGrabbingEx = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_StreamSource), callbackFuncEx, c_void_p)
-GENICAM_StreamSource_detachGrabbingEx = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_StreamSource), callbackFuncEx, c_void_p)
-GENICAM_StreamSource_setInterPacketTimeout= eval('CFUNCTYPE')(c_int, POINTER(GENICAM_StreamSource), c_uint)
-GENICAM_StreamSource_setSingleResendMaxPacketNum= eval('CFUNCTYPE')(c_int, POINTER(GENICAM_StreamSource), c_uint)
-GENICAM_StreamSource_setMaxLostPacketNum= eval('CFUNCTYPE')(c_int, POINTER(GENICAM_StreamSource), c_uint)
-GENICAM_StreamSource_getStatisticsInfo= eval('CFUNCTYPE')(c_int, POINTER(GENICAM_StreamSource), POINTER(POINTER(GENICAM_StreamStatisticsInfo)))
-GENICAM_StreamSource_resetStatisticsInfo= eval('CFUNCTYPE')(c_int, POINTER(GENICAM_StreamSource))
+GENICAM_StreamSource_addRef = CFUNCTYPE(c_int, POINTER(GENICAM_StreamSource))
+GENICAM_StreamSource_release = CFUNCTYPE(c_int, POINTER(GENICAM_StreamSource))
+GENICAM_StreamSource_startGrabbing = CFUNCTYPE(c_int, POINTER(GENICAM_StreamSource), c_ulonglong, c_int)
+GENICAM_StreamSource_stopGrabbing = CFUNCTYPE(c_int, POINTER(GENICAM_StreamSource))
+GENICAM_StreamSource_isGrabbing = CFUNCTYPE(c_int, POINTER(GENICAM_StreamSource))
+GENICAM_StreamSource_getFrame = CFUNCTYPE(c_int, POINTER(GENICAM_StreamSource), POINTER(POINTER(GENICAM_Frame)), c_uint)
+GENICAM_StreamSource_attachGrabbing = CFUNCTYPE(c_int, POINTER(GENICAM_StreamSource), callbackFunc)
+GENICAM_StreamSource_detachGrabbing = CFUNCTYPE(c_int, POINTER(GENICAM_StreamSource), callbackFunc)
+GENICAM_StreamSource_setBufferCount = CFUNCTYPE(c_int, POINTER(GENICAM_StreamSource), c_uint)
+GENICAM_StreamSource_attachGrabbingEx = CFUNCTYPE(c_int, POINTER(GENICAM_StreamSource), callbackFuncEx, c_void_p)
+GENICAM_StreamSource_detachGrabbingEx = CFUNCTYPE(c_int, POINTER(GENICAM_StreamSource), callbackFuncEx, c_void_p)
+GENICAM_StreamSource_setInterPacketTimeout= CFUNCTYPE(c_int, POINTER(GENICAM_StreamSource), c_uint)
+GENICAM_StreamSource_setSingleResendMaxPacketNum= CFUNCTYPE(c_int, POINTER(GENICAM_StreamSource), c_uint)
+GENICAM_StreamSource_setMaxLostPacketNum= CFUNCTYPE(c_int, POINTER(GENICAM_StreamSource), c_uint)
+GENICAM_StreamSource_getStatisticsInfo= CFUNCTYPE(c_int, POINTER(GENICAM_StreamSource), POINTER(POINTER(GENICAM_StreamStatisticsInfo)))
+GENICAM_StreamSource_resetStatisticsInfo= CFUNCTYPE(c_int, POINTER(GENICAM_StreamSource))
 GENICAM_StreamSource._fields_ = [
                                 ('priv', c_void_p),
                                 ('addRef', GENICAM_StreamSource_addRef),
@@ -543,46 +544,46 @@ class GENICAM_SMsgChannelArg(Structure):
                 ]
     
 #SDK.h =>  void (*connectCallBack)(const GENICAM_SConnectArg* pConnectArg)
-connectCallBack = eval('CFUNCTYPE')(None, POINTER(GENICAM_SConnectArg))
+connectCallBack = CFUNCTYPE(None, POINTER(GENICAM_SConnectArg))
 
 #SDK.h => void (*connectCallBackEx)(const GENICAM_SConnectArg* pConnectArg, void* pUser)
-connectCallBackEx = eval('CFUNCTYPE')(None, POINTER(GENICAM_SConnectArg), c_void_p)
+connectCallBackEx = CFUNCTYPE(None, POINTER(GENICAM_SConnectArg), c_void_p)
 
 #SDK.h => void (*paramUpdateCallBack)(const GENICAM_SParamUpdataArg* pParamUpdateArg)
-paramUpdateCallBack = eval('CFUNCTYPE')(None, POINTER(GENICAM_SParamUpdataArg))
+paramUpdateCallBack = CFUNCTYPE(None, POINTER(GENICAM_SParamUpdataArg))
 
 #SDK.h => void (*paramUpdateCallBackEx)(const GENICAM_SParamUpdataArg* pParamUpdateArg, void* pUser)
-paramUpdateCallBackEx = eval('CFUNCTYPE')(None, POINTER(GENICAM_SParamUpdataArg), c_void_p)
+paramUpdateCallBackEx = CFUNCTYPE(None, POINTER(GENICAM_SParamUpdataArg), c_void_p)
 
 #SDK.h => void (*streamCallBack)(const GENICAM_SStreamArg* pStreamArg)
-streamCallBack = eval('CFUNCTYPE')(None, POINTER(GENICAM_SStreamArg))
+streamCallBack = CFUNCTYPE(None, POINTER(GENICAM_SStreamArg))
 
 #SDK.h => void (*streamCallBackEx)(const GENICAM_SStreamArg* pStreamArg, void *pUser)
-streamCallBackEx = eval('CFUNCTYPE')(None, POINTER(GENICAM_SStreamArg), c_void_p)
+streamCallBackEx = CFUNCTYPE(None, POINTER(GENICAM_SStreamArg), c_void_p)
 
 #SDK.h => void (*msgChannelCallBackEx)(const GENICAM_SMsgChannelArg* pMsgChannelArg, void *pUser)
-msgChannelCallBackEx = eval('CFUNCTYPE')(None, POINTER(GENICAM_SMsgChannelArg), c_void_p)
+msgChannelCallBackEx = CFUNCTYPE(None, POINTER(GENICAM_SMsgChannelArg), c_void_p)
 
 #SDK.h => struct GENICAM_EventSubscribe
 class GENICAM_EventSubscribe(Structure):
     pass
 
-GENICAM_EventSubscribe_addRef = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_EventSubscribe))
-GENICAM_EventSubscribe_release = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_EventSubscribe))
-GENICAM_EventSubscribe_subscribeConnectArgs = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_EventSubscribe), connectCallBack)
-GENICAM_EventSubscribe_unsubscribeConnectArgs = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_EventSubscribe), connectCallBack)
-GENICAM_EventSubscribe_subscribeParamUpdate = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_EventSubscribe), paramUpdateCallBack)
-GENICAM_EventSubscribe_unsubscribeParamUpdate = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_EventSubscribe), paramUpdateCallBack)
-GENICAM_EventSubscribe_subscribeStreamArg = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_EventSubscribe), streamCallBack)
-GENICAM_EventSubscribe_unsubscribeStreamArg = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_EventSubscribe), streamCallBack)
-GENICAM_EventSubscribe_subscribeConnectArgsEx = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_EventSubscribe), connectCallBackEx, c_void_p)
-GENICAM_EventSubscribe_unsubscribeConnectArgsEx = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_EventSubscribe), connectCallBackEx, c_void_p)
-GENICAM_EventSubscribe_subscribeParamUpdateEx = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_EventSubscribe), paramUpdateCallBackEx, c_void_p)
-GENICAM_EventSubscribe_unsubscribeParamUpdateEx = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_EventSubscribe), paramUpdateCallBackEx, c_void_p)
-GENICAM_EventSubscribe_subscribeStreamArgEx = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_EventSubscribe), streamCallBackEx, c_void_p)
-GENICAM_EventSubscribe_unsubscribeStreamArgEx = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_EventSubscribe), streamCallBackEx, c_void_p)
-GENICAM_EventSubscribe_subscribeMsgChannelEx = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_EventSubscribe), msgChannelCallBackEx, c_void_p)
-GENICAM_EventSubscribe_unsubscribeMsgChannelEx = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_EventSubscribe), msgChannelCallBackEx, c_void_p)
+GENICAM_EventSubscribe_addRef = CFUNCTYPE(c_int, POINTER(GENICAM_EventSubscribe))
+GENICAM_EventSubscribe_release = CFUNCTYPE(c_int, POINTER(GENICAM_EventSubscribe))
+GENICAM_EventSubscribe_subscribeConnectArgs = CFUNCTYPE(c_int, POINTER(GENICAM_EventSubscribe), connectCallBack)
+GENICAM_EventSubscribe_unsubscribeConnectArgs = CFUNCTYPE(c_int, POINTER(GENICAM_EventSubscribe), connectCallBack)
+GENICAM_EventSubscribe_subscribeParamUpdate = CFUNCTYPE(c_int, POINTER(GENICAM_EventSubscribe), paramUpdateCallBack)
+GENICAM_EventSubscribe_unsubscribeParamUpdate = CFUNCTYPE(c_int, POINTER(GENICAM_EventSubscribe), paramUpdateCallBack)
+GENICAM_EventSubscribe_subscribeStreamArg = CFUNCTYPE(c_int, POINTER(GENICAM_EventSubscribe), streamCallBack)
+GENICAM_EventSubscribe_unsubscribeStreamArg = CFUNCTYPE(c_int, POINTER(GENICAM_EventSubscribe), streamCallBack)
+GENICAM_EventSubscribe_subscribeConnectArgsEx = CFUNCTYPE(c_int, POINTER(GENICAM_EventSubscribe), connectCallBackEx, c_void_p)
+GENICAM_EventSubscribe_unsubscribeConnectArgsEx = CFUNCTYPE(c_int, POINTER(GENICAM_EventSubscribe), connectCallBackEx, c_void_p)
+GENICAM_EventSubscribe_subscribeParamUpdateEx = CFUNCTYPE(c_int, POINTER(GENICAM_EventSubscribe), paramUpdateCallBackEx, c_void_p)
+GENICAM_EventSubscribe_unsubscribeParamUpdateEx = CFUNCTYPE(c_int, POINTER(GENICAM_EventSubscribe), paramUpdateCallBackEx, c_void_p)
+GENICAM_EventSubscribe_subscribeStreamArgEx = CFUNCTYPE(c_int, POINTER(GENICAM_EventSubscribe), streamCallBackEx, c_void_p)
+GENICAM_EventSubscribe_unsubscribeStreamArgEx = CFUNCTYPE(c_int, POINTER(GENICAM_EventSubscribe), streamCallBackEx, c_void_p)
+GENICAM_EventSubscribe_subscribeMsgChannelEx = CFUNCTYPE(c_int, POINTER(GENICAM_EventSubscribe), msgChannelCallBackEx, c_void_p)
+GENICAM_EventSubscribe_unsubscribeMsgChannelEx = CFUNCTYPE(c_int, POINTER(GENICAM_EventSubscribe), msgChannelCallBackEx, c_void_p)
 
 GENICAM_EventSubscribe._fields_ = [
                                   ('priv', c_void_p),
@@ -619,16 +620,16 @@ GENICAM_createEventSubscribe = OPTSDKdll.GENICAM_createEventSubscribe
 class GENICAM_GigECamera(Structure):
     pass
 
-GENICAM_GigECamera_addRef = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_GigECamera))
-GENICAM_GigECamera_release = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_GigECamera))
-GENICAM_GigECamera_getIpAddress = eval('CFUNCTYPE')(c_char_p, POINTER(GENICAM_GigECamera))
-GENICAM_GigECamera_getSubnetMask = eval('CFUNCTYPE')(c_char_p, POINTER(GENICAM_GigECamera))
-GENICAM_GigECamera_getGateway = eval('CFUNCTYPE')(c_char_p, POINTER(GENICAM_GigECamera))
-GENICAM_GigECamera_getMacAddress = eval('CFUNCTYPE')(c_char_p, POINTER(GENICAM_GigECamera))
-GENICAM_GigECamera_forceIpAddress = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_GigECamera), c_char_p, c_char_p, c_char_p)
-GENICAM_GigECamera_getAccessPermission = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_GigECamera))
-GENICAM_GigECamera_getProtocolVersion = eval('CFUNCTYPE')(c_char_p, POINTER(GENICAM_GigECamera))
-GENICAM_GigECamera_getIPConfiguration = eval('CFUNCTYPE')(c_char_p, POINTER(GENICAM_GigECamera))
+GENICAM_GigECamera_addRef = CFUNCTYPE(c_int, POINTER(GENICAM_GigECamera))
+GENICAM_GigECamera_release = CFUNCTYPE(c_int, POINTER(GENICAM_GigECamera))
+GENICAM_GigECamera_getIpAddress = CFUNCTYPE(c_char_p, POINTER(GENICAM_GigECamera))
+GENICAM_GigECamera_getSubnetMask = CFUNCTYPE(c_char_p, POINTER(GENICAM_GigECamera))
+GENICAM_GigECamera_getGateway = CFUNCTYPE(c_char_p, POINTER(GENICAM_GigECamera))
+GENICAM_GigECamera_getMacAddress = CFUNCTYPE(c_char_p, POINTER(GENICAM_GigECamera))
+GENICAM_GigECamera_forceIpAddress = CFUNCTYPE(c_int, POINTER(GENICAM_GigECamera), c_char_p, c_char_p, c_char_p)
+GENICAM_GigECamera_getAccessPermission = CFUNCTYPE(c_int, POINTER(GENICAM_GigECamera))
+GENICAM_GigECamera_getProtocolVersion = CFUNCTYPE(c_char_p, POINTER(GENICAM_GigECamera))
+GENICAM_GigECamera_getIPConfiguration = CFUNCTYPE(c_char_p, POINTER(GENICAM_GigECamera))
 
 GENICAM_GigECamera._fields_ = [
                                ('priv', c_void_p),
@@ -659,13 +660,13 @@ GENICAM_createGigECamera = OPTSDKdll.GENICAM_createGigECamera
 class GENICAM_GigEInterface(Structure):
     pass
 
-GENICAM_GigEInterface_addRef = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_GigEInterface))
-GENICAM_GigEInterface_release = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_GigEInterface))
-GENICAM_GigEInterface_getDescription = eval('CFUNCTYPE')(c_char_p, POINTER(GENICAM_GigEInterface))
-GENICAM_GigEInterface_getIpAddress = eval('CFUNCTYPE')(c_char_p, POINTER(GENICAM_GigEInterface))
-GENICAM_GigEInterface_getSubnetMask = eval('CFUNCTYPE')(c_char_p, POINTER(GENICAM_GigEInterface))
-GENICAM_GigEInterface_getGateway = eval('CFUNCTYPE')(c_char_p, POINTER(GENICAM_GigEInterface))
-GENICAM_GigEInterface_getMacAddress = eval('CFUNCTYPE')(c_char_p, POINTER(GENICAM_GigEInterface))
+GENICAM_GigEInterface_addRef = CFUNCTYPE(c_int, POINTER(GENICAM_GigEInterface))
+GENICAM_GigEInterface_release = CFUNCTYPE(c_int, POINTER(GENICAM_GigEInterface))
+GENICAM_GigEInterface_getDescription = CFUNCTYPE(c_char_p, POINTER(GENICAM_GigEInterface))
+GENICAM_GigEInterface_getIpAddress = CFUNCTYPE(c_char_p, POINTER(GENICAM_GigEInterface))
+GENICAM_GigEInterface_getSubnetMask = CFUNCTYPE(c_char_p, POINTER(GENICAM_GigEInterface))
+GENICAM_GigEInterface_getGateway = CFUNCTYPE(c_char_p, POINTER(GENICAM_GigEInterface))
+GENICAM_GigEInterface_getMacAddress = CFUNCTYPE(c_char_p, POINTER(GENICAM_GigEInterface))
 
 GENICAM_GigEInterface._fields_ = [
                                   ('priv', c_void_p),
@@ -693,21 +694,21 @@ GENICAM_createGigEInterface = OPTSDKdll.GENICAM_createGigEInterface
 class GENICAM_UsbCamera(Structure):
     pass
 
-GENICAM_UsbCamera_addRef = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_UsbCamera))
-GENICAM_UsbCamera_release = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_UsbCamera))
-GENICAM_UsbCamera_getConfigurationValid = eval('CFUNCTYPE')(c_char_p, POINTER(GENICAM_UsbCamera))
-GENICAM_UsbCamera_getGenCPVersion = eval('CFUNCTYPE')(c_char_p, POINTER(GENICAM_UsbCamera))
-GENICAM_UsbCamera_getU3VVersion = eval('CFUNCTYPE')(c_char_p, POINTER(GENICAM_UsbCamera))
-GENICAM_UsbCamera_getDeviceGUID = eval('CFUNCTYPE')(c_char_p, POINTER(GENICAM_UsbCamera))
-GENICAM_UsbCamera_getFamilyName = eval('CFUNCTYPE')(c_char_p, POINTER(GENICAM_UsbCamera))
-GENICAM_UsbCamera_getU3VSerialNumber = eval('CFUNCTYPE')(c_char_p, POINTER(GENICAM_UsbCamera))
-GENICAM_UsbCamera_isLowSpeedSupported = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_UsbCamera))
-GENICAM_UsbCamera_isFullSpeedSupported = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_UsbCamera))
-GENICAM_UsbCamera_isHighSpeedSupported = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_UsbCamera))
-GENICAM_UsbCamera_isSuperSpeedSupported = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_UsbCamera))
-GENICAM_UsbCamera_getSpeed = eval('CFUNCTYPE')(c_char_p, POINTER(GENICAM_UsbCamera))
-GENICAM_UsbCamera_getMaxPower = eval('CFUNCTYPE')(c_char_p, POINTER(GENICAM_UsbCamera))
-GENICAM_UsbCamera_isDriverInstalled = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_UsbCamera))
+GENICAM_UsbCamera_addRef = CFUNCTYPE(c_int, POINTER(GENICAM_UsbCamera))
+GENICAM_UsbCamera_release = CFUNCTYPE(c_int, POINTER(GENICAM_UsbCamera))
+GENICAM_UsbCamera_getConfigurationValid = CFUNCTYPE(c_char_p, POINTER(GENICAM_UsbCamera))
+GENICAM_UsbCamera_getGenCPVersion = CFUNCTYPE(c_char_p, POINTER(GENICAM_UsbCamera))
+GENICAM_UsbCamera_getU3VVersion = CFUNCTYPE(c_char_p, POINTER(GENICAM_UsbCamera))
+GENICAM_UsbCamera_getDeviceGUID = CFUNCTYPE(c_char_p, POINTER(GENICAM_UsbCamera))
+GENICAM_UsbCamera_getFamilyName = CFUNCTYPE(c_char_p, POINTER(GENICAM_UsbCamera))
+GENICAM_UsbCamera_getU3VSerialNumber = CFUNCTYPE(c_char_p, POINTER(GENICAM_UsbCamera))
+GENICAM_UsbCamera_isLowSpeedSupported = CFUNCTYPE(c_int, POINTER(GENICAM_UsbCamera))
+GENICAM_UsbCamera_isFullSpeedSupported = CFUNCTYPE(c_int, POINTER(GENICAM_UsbCamera))
+GENICAM_UsbCamera_isHighSpeedSupported = CFUNCTYPE(c_int, POINTER(GENICAM_UsbCamera))
+GENICAM_UsbCamera_isSuperSpeedSupported = CFUNCTYPE(c_int, POINTER(GENICAM_UsbCamera))
+GENICAM_UsbCamera_getSpeed = CFUNCTYPE(c_char_p, POINTER(GENICAM_UsbCamera))
+GENICAM_UsbCamera_getMaxPower = CFUNCTYPE(c_char_p, POINTER(GENICAM_UsbCamera))
+GENICAM_UsbCamera_isDriverInstalled = CFUNCTYPE(c_int, POINTER(GENICAM_UsbCamera))
 
 GENICAM_UsbCamera._fields_ = [
                               ('priv', c_void_p),
@@ -743,14 +744,14 @@ GENICAM_createUsbCamera = OPTSDKdll.GENICAM_createUsbCamera
 class GENICAM_UsbInterface(Structure):
     pass
 
-GENICAM_UsbInterface_addRef = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_UsbInterface))
-GENICAM_UsbInterface_release = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_UsbInterface))
-GENICAM_UsbInterface_getDescription = eval('CFUNCTYPE')(c_char_p, POINTER(GENICAM_UsbInterface))
-GENICAM_UsbInterface_getVendorID = eval('CFUNCTYPE')(c_char_p, POINTER(GENICAM_UsbInterface))
-GENICAM_UsbInterface_getDeviceID = eval('CFUNCTYPE')(c_char_p, POINTER(GENICAM_UsbInterface))
-GENICAM_UsbInterface_getSubsystemID = eval('CFUNCTYPE')(c_char_p, POINTER(GENICAM_UsbInterface))
-GENICAM_UsbInterface_getRevision = eval('CFUNCTYPE')(c_char_p, POINTER(GENICAM_UsbInterface))
-GENICAM_UsbInterface_getSpeed = eval('CFUNCTYPE')(c_char_p, POINTER(GENICAM_UsbInterface))
+GENICAM_UsbInterface_addRef = CFUNCTYPE(c_int, POINTER(GENICAM_UsbInterface))
+GENICAM_UsbInterface_release = CFUNCTYPE(c_int, POINTER(GENICAM_UsbInterface))
+GENICAM_UsbInterface_getDescription = CFUNCTYPE(c_char_p, POINTER(GENICAM_UsbInterface))
+GENICAM_UsbInterface_getVendorID = CFUNCTYPE(c_char_p, POINTER(GENICAM_UsbInterface))
+GENICAM_UsbInterface_getDeviceID = CFUNCTYPE(c_char_p, POINTER(GENICAM_UsbInterface))
+GENICAM_UsbInterface_getSubsystemID = CFUNCTYPE(c_char_p, POINTER(GENICAM_UsbInterface))
+GENICAM_UsbInterface_getRevision = CFUNCTYPE(c_char_p, POINTER(GENICAM_UsbInterface))
+GENICAM_UsbInterface_getSpeed = CFUNCTYPE(c_char_p, POINTER(GENICAM_UsbInterface))
 
 GENICAM_UsbInterface._fields_ = [
                                  ('priv', c_void_p),
@@ -779,17 +780,17 @@ GENICAM_createUsbInterface = OPTSDKdll.GENICAM_createUsbInterface
 class GENICAM_IntNode(Structure):
     pass
 
-GENICAM_IntNode_addRef = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_IntNode))
-GENICAM_IntNode_release = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_IntNode))
-GENICAM_IntNode_getValue = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_IntNode), POINTER(c_longlong))
-GENICAM_IntNode_setValue = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_IntNode), c_longlong)
-GENICAM_IntNode_getMinVal = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_IntNode), POINTER(c_longlong))
-GENICAM_IntNode_getMaxVal = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_IntNode), POINTER(c_longlong))
-GENICAM_IntNode_isValid = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_IntNode))
-GENICAM_IntNode_isAvailable = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_IntNode))
-GENICAM_IntNode_isReadable = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_IntNode))
-GENICAM_IntNode_isWriteable = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_IntNode))
-GENICAM_IntNode_getIncrement = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_IntNode), POINTER(c_longlong))
+GENICAM_IntNode_addRef = CFUNCTYPE(c_int, POINTER(GENICAM_IntNode))
+GENICAM_IntNode_release = CFUNCTYPE(c_int, POINTER(GENICAM_IntNode))
+GENICAM_IntNode_getValue = CFUNCTYPE(c_int, POINTER(GENICAM_IntNode), POINTER(c_longlong))
+GENICAM_IntNode_setValue = CFUNCTYPE(c_int, POINTER(GENICAM_IntNode), c_longlong)
+GENICAM_IntNode_getMinVal = CFUNCTYPE(c_int, POINTER(GENICAM_IntNode), POINTER(c_longlong))
+GENICAM_IntNode_getMaxVal = CFUNCTYPE(c_int, POINTER(GENICAM_IntNode), POINTER(c_longlong))
+GENICAM_IntNode_isValid = CFUNCTYPE(c_int, POINTER(GENICAM_IntNode))
+GENICAM_IntNode_isAvailable = CFUNCTYPE(c_int, POINTER(GENICAM_IntNode))
+GENICAM_IntNode_isReadable = CFUNCTYPE(c_int, POINTER(GENICAM_IntNode))
+GENICAM_IntNode_isWriteable = CFUNCTYPE(c_int, POINTER(GENICAM_IntNode))
+GENICAM_IntNode_getIncrement = CFUNCTYPE(c_int, POINTER(GENICAM_IntNode), POINTER(c_longlong))
 
 GENICAM_IntNode._fields_ = [
                             ('priv', c_void_p),
@@ -822,16 +823,16 @@ GENICAM_createIntNode = OPTSDKdll.GENICAM_createIntNode
 class GENICAM_DoubleNode(Structure):
     pass
 
-GENICAM_DoubleNode_addRef = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_DoubleNode))
-GENICAM_DoubleNode_release = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_DoubleNode))
-GENICAM_DoubleNode_getValue = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_DoubleNode), POINTER(c_double))
-GENICAM_DoubleNode_setValue = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_DoubleNode), c_double)
-GENICAM_DoubleNode_getMinVal = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_DoubleNode), POINTER(c_double))
-GENICAM_DoubleNode_getMaxVal = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_DoubleNode), POINTER(c_double))
-GENICAM_DoubleNode_isValid = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_DoubleNode))
-GENICAM_DoubleNode_isAvailable = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_DoubleNode))
-GENICAM_DoubleNode_isReadable = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_DoubleNode))
-GENICAM_DoubleNode_isWriteable = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_DoubleNode))
+GENICAM_DoubleNode_addRef = CFUNCTYPE(c_int, POINTER(GENICAM_DoubleNode))
+GENICAM_DoubleNode_release = CFUNCTYPE(c_int, POINTER(GENICAM_DoubleNode))
+GENICAM_DoubleNode_getValue = CFUNCTYPE(c_int, POINTER(GENICAM_DoubleNode), POINTER(c_double))
+GENICAM_DoubleNode_setValue = CFUNCTYPE(c_int, POINTER(GENICAM_DoubleNode), c_double)
+GENICAM_DoubleNode_getMinVal = CFUNCTYPE(c_int, POINTER(GENICAM_DoubleNode), POINTER(c_double))
+GENICAM_DoubleNode_getMaxVal = CFUNCTYPE(c_int, POINTER(GENICAM_DoubleNode), POINTER(c_double))
+GENICAM_DoubleNode_isValid = CFUNCTYPE(c_int, POINTER(GENICAM_DoubleNode))
+GENICAM_DoubleNode_isAvailable = CFUNCTYPE(c_int, POINTER(GENICAM_DoubleNode))
+GENICAM_DoubleNode_isReadable = CFUNCTYPE(c_int, POINTER(GENICAM_DoubleNode))
+GENICAM_DoubleNode_isWriteable = CFUNCTYPE(c_int, POINTER(GENICAM_DoubleNode))
 
 GENICAM_DoubleNode._fields_ = [
                                ('priv', c_void_p),
@@ -863,19 +864,19 @@ GENICAM_createDoubleNode = OPTSDKdll.GENICAM_createDoubleNode
 class GENICAM_EnumNode(Structure):
     pass
 
-GENICAM_EnumNode_addRef = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_EnumNode))
-GENICAM_EnumNode_release = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_EnumNode))
-GENICAM_EnumNode_getValueSymbol = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_EnumNode), c_char_p, POINTER(c_uint))
-GENICAM_EnumNode_setValueBySymbol = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_EnumNode), c_char_p)
-GENICAM_EnumNode_getEnumSymbolList = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_EnumNode), POINTER(c_char * 256), POINTER(c_uint)) #???
-GENICAM_EnumNode_isValid = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_EnumNode))
-GENICAM_EnumNode_isAvailable = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_EnumNode))
-GENICAM_EnumNode_isReadable = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_EnumNode))
-GENICAM_EnumNode_isWriteable = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_EnumNode))
-GENICAM_EnumNode_setValue = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_EnumNode),c_uint64)
-GENICAM_EnumNode_getValue = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_EnumNode),POINTER(c_uint64))
-GENICAM_EnumNode_getValueBySymbol = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_EnumNode), c_char_p, POINTER(c_uint64))
-GENICAM_EnumNode_getSymbolByValue = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_EnumNode), c_uint64, c_char_p,POINTER(c_uint))
+GENICAM_EnumNode_addRef = CFUNCTYPE(c_int, POINTER(GENICAM_EnumNode))
+GENICAM_EnumNode_release = CFUNCTYPE(c_int, POINTER(GENICAM_EnumNode))
+GENICAM_EnumNode_getValueSymbol = CFUNCTYPE(c_int, POINTER(GENICAM_EnumNode), c_char_p, POINTER(c_uint))
+GENICAM_EnumNode_setValueBySymbol = CFUNCTYPE(c_int, POINTER(GENICAM_EnumNode), c_char_p)
+GENICAM_EnumNode_getEnumSymbolList = CFUNCTYPE(c_int, POINTER(GENICAM_EnumNode), POINTER(c_char * 256), POINTER(c_uint)) #???
+GENICAM_EnumNode_isValid = CFUNCTYPE(c_int, POINTER(GENICAM_EnumNode))
+GENICAM_EnumNode_isAvailable = CFUNCTYPE(c_int, POINTER(GENICAM_EnumNode))
+GENICAM_EnumNode_isReadable = CFUNCTYPE(c_int, POINTER(GENICAM_EnumNode))
+GENICAM_EnumNode_isWriteable = CFUNCTYPE(c_int, POINTER(GENICAM_EnumNode))
+GENICAM_EnumNode_setValue = CFUNCTYPE(c_int, POINTER(GENICAM_EnumNode),c_uint64)
+GENICAM_EnumNode_getValue = CFUNCTYPE(c_int, POINTER(GENICAM_EnumNode),POINTER(c_uint64))
+GENICAM_EnumNode_getValueBySymbol = CFUNCTYPE(c_int, POINTER(GENICAM_EnumNode), c_char_p, POINTER(c_uint64))
+GENICAM_EnumNode_getSymbolByValue = CFUNCTYPE(c_int, POINTER(GENICAM_EnumNode), c_uint64, c_char_p,POINTER(c_uint))
 
 GENICAM_EnumNode._fields_ = [
                 ('priv', c_void_p),
@@ -910,14 +911,14 @@ GENICAM_createEnumNode = OPTSDKdll.GENICAM_createEnumNode
 class GENICAM_BoolNode(Structure):
     pass
 
-GENICAM_BoolNode_addRef = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_BoolNode))
-GENICAM_BoolNode_release = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_BoolNode))
-GENICAM_BoolNode_getValue = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_BoolNode), POINTER(c_uint))
-GENICAM_BoolNode_setValue = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_BoolNode), c_uint)
-GENICAM_BoolNode_isValid = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_BoolNode))
-GENICAM_BoolNode_isAvailable = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_BoolNode))
-GENICAM_BoolNode_isReadable = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_BoolNode))
-GENICAM_BoolNode_isWriteable = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_BoolNode))
+GENICAM_BoolNode_addRef = CFUNCTYPE(c_int, POINTER(GENICAM_BoolNode))
+GENICAM_BoolNode_release = CFUNCTYPE(c_int, POINTER(GENICAM_BoolNode))
+GENICAM_BoolNode_getValue = CFUNCTYPE(c_int, POINTER(GENICAM_BoolNode), POINTER(c_uint))
+GENICAM_BoolNode_setValue = CFUNCTYPE(c_int, POINTER(GENICAM_BoolNode), c_uint)
+GENICAM_BoolNode_isValid = CFUNCTYPE(c_int, POINTER(GENICAM_BoolNode))
+GENICAM_BoolNode_isAvailable = CFUNCTYPE(c_int, POINTER(GENICAM_BoolNode))
+GENICAM_BoolNode_isReadable = CFUNCTYPE(c_int, POINTER(GENICAM_BoolNode))
+GENICAM_BoolNode_isWriteable = CFUNCTYPE(c_int, POINTER(GENICAM_BoolNode))
 
 GENICAM_BoolNode._fields_ = [
                             ('priv', c_void_p),
@@ -947,13 +948,13 @@ GENICAM_createBoolNode = OPTSDKdll.GENICAM_createBoolNode
 class GENICAM_CmdNode(Structure):
     pass
 
-GENICAM_CmdNode_addRef = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_CmdNode))
-GENICAM_CmdNode_release = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_CmdNode))
-GENICAM_CmdNode_execute = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_CmdNode))
-GENICAM_CmdNode_isValid = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_CmdNode))
-GENICAM_CmdNode_isAvailable = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_CmdNode))
-GENICAM_CmdNode_isReadable = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_CmdNode))
-GENICAM_CmdNode_isWriteable = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_CmdNode))
+GENICAM_CmdNode_addRef = CFUNCTYPE(c_int, POINTER(GENICAM_CmdNode))
+GENICAM_CmdNode_release = CFUNCTYPE(c_int, POINTER(GENICAM_CmdNode))
+GENICAM_CmdNode_execute = CFUNCTYPE(c_int, POINTER(GENICAM_CmdNode))
+GENICAM_CmdNode_isValid = CFUNCTYPE(c_int, POINTER(GENICAM_CmdNode))
+GENICAM_CmdNode_isAvailable = CFUNCTYPE(c_int, POINTER(GENICAM_CmdNode))
+GENICAM_CmdNode_isReadable = CFUNCTYPE(c_int, POINTER(GENICAM_CmdNode))
+GENICAM_CmdNode_isWriteable = CFUNCTYPE(c_int, POINTER(GENICAM_CmdNode))
 
 GENICAM_CmdNode._fields_ = [
                             ('priv', c_void_p),
@@ -982,14 +983,14 @@ GENICAM_createCmdNode = OPTSDKdll.GENICAM_createCmdNode
 class GENICAM_StringNode(Structure):
     pass
 
-GENICAM_StringNode_addRef = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_StringNode))
-GENICAM_StringNode_release = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_StringNode))
-GENICAM_StringNode_getValue = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_StringNode), c_char_p, POINTER(c_uint))
-GENICAM_StringNode_setValue = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_StringNode), c_char_p)
-GENICAM_StringNode_isValid = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_StringNode))
-GENICAM_StringNode_isAvailable = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_StringNode))
-GENICAM_StringNode_isReadable = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_StringNode))
-GENICAM_StringNode_isWriteable = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_StringNode))
+GENICAM_StringNode_addRef = CFUNCTYPE(c_int, POINTER(GENICAM_StringNode))
+GENICAM_StringNode_release = CFUNCTYPE(c_int, POINTER(GENICAM_StringNode))
+GENICAM_StringNode_getValue = CFUNCTYPE(c_int, POINTER(GENICAM_StringNode), c_char_p, POINTER(c_uint))
+GENICAM_StringNode_setValue = CFUNCTYPE(c_int, POINTER(GENICAM_StringNode), c_char_p)
+GENICAM_StringNode_isValid = CFUNCTYPE(c_int, POINTER(GENICAM_StringNode))
+GENICAM_StringNode_isAvailable = CFUNCTYPE(c_int, POINTER(GENICAM_StringNode))
+GENICAM_StringNode_isReadable = CFUNCTYPE(c_int, POINTER(GENICAM_StringNode))
+GENICAM_StringNode_isWriteable = CFUNCTYPE(c_int, POINTER(GENICAM_StringNode))
 
 GENICAM_StringNode._fields_ = [
                                ('priv', c_void_p),
@@ -1019,21 +1020,21 @@ GENICAM_createStringNode = OPTSDKdll.GENICAM_createStringNode
 class GENICAM_AcquisitionControl(Structure):
     pass
 
-GENICAM_AcquisitionControl_addRef = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_AcquisitionControl))
-GENICAM_AcquisitionControl_release = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_AcquisitionControl))
-GENICAM_AcquisitionControl_acquisitionFrameCount = eval('CFUNCTYPE')(GENICAM_IntNode, POINTER(GENICAM_AcquisitionControl))
-GENICAM_AcquisitionControl_acquisitionFrameRate = eval('CFUNCTYPE')(GENICAM_DoubleNode, POINTER(GENICAM_AcquisitionControl))
-GENICAM_AcquisitionControl_acquisitionFrameRateEnable = eval('CFUNCTYPE')(GENICAM_BoolNode, POINTER(GENICAM_AcquisitionControl))
-GENICAM_AcquisitionControl_acquisitionMode = eval('CFUNCTYPE')(GENICAM_EnumNode, POINTER(GENICAM_AcquisitionControl))
-GENICAM_AcquisitionControl_exposureAuto = eval('CFUNCTYPE')(GENICAM_EnumNode, POINTER(GENICAM_AcquisitionControl))
-GENICAM_AcquisitionControl_exposureMode = eval('CFUNCTYPE')(GENICAM_EnumNode, POINTER(GENICAM_AcquisitionControl))
-GENICAM_AcquisitionControl_exposureTime = eval('CFUNCTYPE')(GENICAM_DoubleNode, POINTER(GENICAM_AcquisitionControl))
-GENICAM_AcquisitionControl_triggerActivation = eval('CFUNCTYPE')(GENICAM_EnumNode, POINTER(GENICAM_AcquisitionControl))
-GENICAM_AcquisitionControl_triggerDelay = eval('CFUNCTYPE')(GENICAM_DoubleNode, POINTER(GENICAM_AcquisitionControl))
-GENICAM_AcquisitionControl_triggerMode = eval('CFUNCTYPE')(GENICAM_EnumNode, POINTER(GENICAM_AcquisitionControl))
-GENICAM_AcquisitionControl_triggerSelector = eval('CFUNCTYPE')(GENICAM_EnumNode, POINTER(GENICAM_AcquisitionControl))
-GENICAM_AcquisitionControl_triggerSource = eval('CFUNCTYPE')(GENICAM_EnumNode, POINTER(GENICAM_AcquisitionControl))
-GENICAM_AcquisitionControl_triggerSoftware = eval('CFUNCTYPE')(GENICAM_CmdNode, POINTER(GENICAM_AcquisitionControl))
+GENICAM_AcquisitionControl_addRef = CFUNCTYPE(c_int, POINTER(GENICAM_AcquisitionControl))
+GENICAM_AcquisitionControl_release = CFUNCTYPE(c_int, POINTER(GENICAM_AcquisitionControl))
+GENICAM_AcquisitionControl_acquisitionFrameCount = CFUNCTYPE(GENICAM_IntNode, POINTER(GENICAM_AcquisitionControl))
+GENICAM_AcquisitionControl_acquisitionFrameRate = CFUNCTYPE(GENICAM_DoubleNode, POINTER(GENICAM_AcquisitionControl))
+GENICAM_AcquisitionControl_acquisitionFrameRateEnable = CFUNCTYPE(GENICAM_BoolNode, POINTER(GENICAM_AcquisitionControl))
+GENICAM_AcquisitionControl_acquisitionMode = CFUNCTYPE(GENICAM_EnumNode, POINTER(GENICAM_AcquisitionControl))
+GENICAM_AcquisitionControl_exposureAuto = CFUNCTYPE(GENICAM_EnumNode, POINTER(GENICAM_AcquisitionControl))
+GENICAM_AcquisitionControl_exposureMode = CFUNCTYPE(GENICAM_EnumNode, POINTER(GENICAM_AcquisitionControl))
+GENICAM_AcquisitionControl_exposureTime = CFUNCTYPE(GENICAM_DoubleNode, POINTER(GENICAM_AcquisitionControl))
+GENICAM_AcquisitionControl_triggerActivation = CFUNCTYPE(GENICAM_EnumNode, POINTER(GENICAM_AcquisitionControl))
+GENICAM_AcquisitionControl_triggerDelay = CFUNCTYPE(GENICAM_DoubleNode, POINTER(GENICAM_AcquisitionControl))
+GENICAM_AcquisitionControl_triggerMode = CFUNCTYPE(GENICAM_EnumNode, POINTER(GENICAM_AcquisitionControl))
+GENICAM_AcquisitionControl_triggerSelector = CFUNCTYPE(GENICAM_EnumNode, POINTER(GENICAM_AcquisitionControl))
+GENICAM_AcquisitionControl_triggerSource = CFUNCTYPE(GENICAM_EnumNode, POINTER(GENICAM_AcquisitionControl))
+GENICAM_AcquisitionControl_triggerSoftware = CFUNCTYPE(GENICAM_CmdNode, POINTER(GENICAM_AcquisitionControl))
     
 GENICAM_AcquisitionControl._fields_ = [
                                        ('priv', c_void_p),
@@ -1076,13 +1077,13 @@ GENICAM_EConfigSet = enum(
 class GENICAM_UserSetControl(Structure):
     pass
 
-GENICAM_UserSetControl_addRef = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_UserSetControl))
-GENICAM_UserSetControl_release = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_UserSetControl))
-GENICAM_UserSetControl_restoreDefault = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_UserSetControl))
-GENICAM_UserSetControl_setCurrentUserSet = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_UserSetControl), c_int)
-GENICAM_UserSetControl_saveUserSet = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_UserSetControl), c_int)
-GENICAM_UserSetControl_getCurrentUserSet = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_UserSetControl))
-GENICAM_UserSetControl_isAvailable = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_UserSetControl))
+GENICAM_UserSetControl_addRef = CFUNCTYPE(c_int, POINTER(GENICAM_UserSetControl))
+GENICAM_UserSetControl_release = CFUNCTYPE(c_int, POINTER(GENICAM_UserSetControl))
+GENICAM_UserSetControl_restoreDefault = CFUNCTYPE(c_int, POINTER(GENICAM_UserSetControl))
+GENICAM_UserSetControl_setCurrentUserSet = CFUNCTYPE(c_int, POINTER(GENICAM_UserSetControl), c_int)
+GENICAM_UserSetControl_saveUserSet = CFUNCTYPE(c_int, POINTER(GENICAM_UserSetControl), c_int)
+GENICAM_UserSetControl_getCurrentUserSet = CFUNCTYPE(c_int, POINTER(GENICAM_UserSetControl))
+GENICAM_UserSetControl_isAvailable = CFUNCTYPE(c_int, POINTER(GENICAM_UserSetControl))
 
 GENICAM_UserSetControl._fields_ = [
                                    ('priv', c_void_p),
@@ -1110,15 +1111,15 @@ GENICAM_createUserSetControl = OPTSDKdll.GENICAM_createUserSetControl
 class GENICAM_ISPControl(Structure):
     pass
 
-GENICAM_ISPControl_addRef = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_ISPControl))
-GENICAM_ISPControl_release = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_ISPControl))
-GENICAM_ISPControl_brightness = eval('CFUNCTYPE')(GENICAM_IntNode, POINTER(GENICAM_ISPControl))
-GENICAM_ISPControl_sharpness = eval('CFUNCTYPE')(GENICAM_IntNode, POINTER(GENICAM_ISPControl))
-GENICAM_ISPControl_sharpnessAuto = eval('CFUNCTYPE')(GENICAM_BoolNode, POINTER(GENICAM_ISPControl))
-GENICAM_ISPControl_sharpnessEnable = eval('CFUNCTYPE')(GENICAM_EnumNode, POINTER(GENICAM_ISPControl))
-GENICAM_ISPControl_contrast = eval('CFUNCTYPE')(GENICAM_IntNode, POINTER(GENICAM_ISPControl))
-GENICAM_ISPControl_hue = eval('CFUNCTYPE')(GENICAM_IntNode, POINTER(GENICAM_ISPControl))
-GENICAM_ISPControl_saturation = eval('CFUNCTYPE')(GENICAM_IntNode, POINTER(GENICAM_ISPControl))
+GENICAM_ISPControl_addRef = CFUNCTYPE(c_int, POINTER(GENICAM_ISPControl))
+GENICAM_ISPControl_release = CFUNCTYPE(c_int, POINTER(GENICAM_ISPControl))
+GENICAM_ISPControl_brightness = CFUNCTYPE(GENICAM_IntNode, POINTER(GENICAM_ISPControl))
+GENICAM_ISPControl_sharpness = CFUNCTYPE(GENICAM_IntNode, POINTER(GENICAM_ISPControl))
+GENICAM_ISPControl_sharpnessAuto = CFUNCTYPE(GENICAM_BoolNode, POINTER(GENICAM_ISPControl))
+GENICAM_ISPControl_sharpnessEnable = CFUNCTYPE(GENICAM_EnumNode, POINTER(GENICAM_ISPControl))
+GENICAM_ISPControl_contrast = CFUNCTYPE(GENICAM_IntNode, POINTER(GENICAM_ISPControl))
+GENICAM_ISPControl_hue = CFUNCTYPE(GENICAM_IntNode, POINTER(GENICAM_ISPControl))
+GENICAM_ISPControl_saturation = CFUNCTYPE(GENICAM_IntNode, POINTER(GENICAM_ISPControl))
 
 GENICAM_ISPControl._fields_ = [
                                ('priv', c_void_p),
@@ -1148,17 +1149,17 @@ GENICAM_createISPControl = OPTSDKdll.GENICAM_createISPControl
 class GENICAM_AnalogControl(Structure):
     pass
  
-GENICAM_AnalogControl_addRef = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_AnalogControl))
-GENICAM_AnalogControl_release = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_AnalogControl))
-GENICAM_AnalogControl_blackLevelSelector = eval('CFUNCTYPE')(GENICAM_EnumNode, POINTER(GENICAM_AnalogControl))
-GENICAM_AnalogControl_blackLevelAuto = eval('CFUNCTYPE')(GENICAM_EnumNode, POINTER(GENICAM_AnalogControl))
-GENICAM_AnalogControl_blackLevel = eval('CFUNCTYPE')(GENICAM_IntNode, POINTER(GENICAM_AnalogControl))
-GENICAM_AnalogControl_gainAuto = eval('CFUNCTYPE')(GENICAM_EnumNode, POINTER(GENICAM_AnalogControl))
-GENICAM_AnalogControl_gainRaw = eval('CFUNCTYPE')(GENICAM_DoubleNode, POINTER(GENICAM_AnalogControl))
-GENICAM_AnalogControl_gamma = eval('CFUNCTYPE')(GENICAM_DoubleNode, POINTER(GENICAM_AnalogControl))
-GENICAM_AnalogControl_balanceRatioSelector = eval('CFUNCTYPE')(GENICAM_EnumNode, POINTER(GENICAM_AnalogControl))
-GENICAM_AnalogControl_balanceWhiteAuto = eval('CFUNCTYPE')(GENICAM_EnumNode, POINTER(GENICAM_AnalogControl))
-GENICAM_AnalogControl_balanceRatio = eval('CFUNCTYPE')(GENICAM_DoubleNode, POINTER(GENICAM_AnalogControl))
+GENICAM_AnalogControl_addRef = CFUNCTYPE(c_int, POINTER(GENICAM_AnalogControl))
+GENICAM_AnalogControl_release = CFUNCTYPE(c_int, POINTER(GENICAM_AnalogControl))
+GENICAM_AnalogControl_blackLevelSelector = CFUNCTYPE(GENICAM_EnumNode, POINTER(GENICAM_AnalogControl))
+GENICAM_AnalogControl_blackLevelAuto = CFUNCTYPE(GENICAM_EnumNode, POINTER(GENICAM_AnalogControl))
+GENICAM_AnalogControl_blackLevel = CFUNCTYPE(GENICAM_IntNode, POINTER(GENICAM_AnalogControl))
+GENICAM_AnalogControl_gainAuto = CFUNCTYPE(GENICAM_EnumNode, POINTER(GENICAM_AnalogControl))
+GENICAM_AnalogControl_gainRaw = CFUNCTYPE(GENICAM_DoubleNode, POINTER(GENICAM_AnalogControl))
+GENICAM_AnalogControl_gamma = CFUNCTYPE(GENICAM_DoubleNode, POINTER(GENICAM_AnalogControl))
+GENICAM_AnalogControl_balanceRatioSelector = CFUNCTYPE(GENICAM_EnumNode, POINTER(GENICAM_AnalogControl))
+GENICAM_AnalogControl_balanceWhiteAuto = CFUNCTYPE(GENICAM_EnumNode, POINTER(GENICAM_AnalogControl))
+GENICAM_AnalogControl_balanceRatio = CFUNCTYPE(GENICAM_DoubleNode, POINTER(GENICAM_AnalogControl))
 
 GENICAM_AnalogControl._fields_ = [
                                   ('priv', c_void_p),
@@ -1190,9 +1191,9 @@ GENICAM_createAnalogControl = OPTSDKdll.GENICAM_createAnalogControl
 class GENICAM_DeviceControl(Structure):
     pass
 
-GENICAM_DeviceControl_addRef = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_DeviceControl))   
-GENICAM_DeviceControl_release = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_DeviceControl))
-GENICAM_DeviceControl_deviceUserID = eval('CFUNCTYPE')(GENICAM_StringNode, POINTER(GENICAM_DeviceControl))
+GENICAM_DeviceControl_addRef = CFUNCTYPE(c_int, POINTER(GENICAM_DeviceControl))   
+GENICAM_DeviceControl_release = CFUNCTYPE(c_int, POINTER(GENICAM_DeviceControl))
+GENICAM_DeviceControl_deviceUserID = CFUNCTYPE(GENICAM_StringNode, POINTER(GENICAM_DeviceControl))
 
 GENICAM_DeviceControl._fields_ = [
                                   ('priv', c_void_p),
@@ -1216,12 +1217,12 @@ GENICAM_createDeviceControl = OPTSDKdll.GENICAM_createDeviceControl
 class GENICAM_DigitalIOControl(Structure):
     pass
 
-GENICAM_DigitalIOControl_addRef = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_DigitalIOControl))
-GENICAM_DigitalIOControl_release = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_DigitalIOControl))
-GENICAM_DigitalIOControl_lineSelector = eval('CFUNCTYPE')(GENICAM_EnumNode, POINTER(GENICAM_DigitalIOControl))
-GENICAM_DigitalIOControl_lineDebouncerTimeAbs = eval('CFUNCTYPE')(GENICAM_DoubleNode, POINTER(GENICAM_DigitalIOControl))
-GENICAM_DigitalIOControl_userOutputSelector = eval('CFUNCTYPE')(GENICAM_EnumNode, POINTER(GENICAM_DigitalIOControl))
-GENICAM_DigitalIOControl_userOutputValue = eval('CFUNCTYPE')(GENICAM_BoolNode, POINTER(GENICAM_DigitalIOControl))
+GENICAM_DigitalIOControl_addRef = CFUNCTYPE(c_int, POINTER(GENICAM_DigitalIOControl))
+GENICAM_DigitalIOControl_release = CFUNCTYPE(c_int, POINTER(GENICAM_DigitalIOControl))
+GENICAM_DigitalIOControl_lineSelector = CFUNCTYPE(GENICAM_EnumNode, POINTER(GENICAM_DigitalIOControl))
+GENICAM_DigitalIOControl_lineDebouncerTimeAbs = CFUNCTYPE(GENICAM_DoubleNode, POINTER(GENICAM_DigitalIOControl))
+GENICAM_DigitalIOControl_userOutputSelector = CFUNCTYPE(GENICAM_EnumNode, POINTER(GENICAM_DigitalIOControl))
+GENICAM_DigitalIOControl_userOutputValue = CFUNCTYPE(GENICAM_BoolNode, POINTER(GENICAM_DigitalIOControl))
 
 GENICAM_DigitalIOControl._fields_ = [
                                      ('priv', c_void_p),
@@ -1248,9 +1249,9 @@ GENICAM_createDigitalIOControl = OPTSDKdll.GENICAM_createDigitalIOControl
 class GENICAM_TransportLayerControl(Structure):
     pass
 
-GENICAM_TransportLayerControl_addRef = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_TransportLayerControl))
-GENICAM_TransportLayerControl_release = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_TransportLayerControl))
-GENICAM_TransportLayerControl_gevSCPD = eval('CFUNCTYPE')(GENICAM_IntNode, POINTER(GENICAM_TransportLayerControl))
+GENICAM_TransportLayerControl_addRef = CFUNCTYPE(c_int, POINTER(GENICAM_TransportLayerControl))
+GENICAM_TransportLayerControl_release = CFUNCTYPE(c_int, POINTER(GENICAM_TransportLayerControl))
+GENICAM_TransportLayerControl_gevSCPD = CFUNCTYPE(GENICAM_IntNode, POINTER(GENICAM_TransportLayerControl))
 
 GENICAM_TransportLayerControl._fields_ = [
                                           ('priv', c_void_p),
@@ -1275,15 +1276,15 @@ GENICAM_createTransportLayerControl = OPTSDKdll.GENICAM_createTransportLayerCont
 class GENICAM_ImageFormatControl(Structure):
     pass
 
-GENICAM_ImageFormatControl_addRef = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_ImageFormatControl))
-GENICAM_ImageFormatControl_release = eval('CFUNCTYPE')(c_int, POINTER(GENICAM_ImageFormatControl))
-GENICAM_ImageFormatControl_height = eval('CFUNCTYPE')(GENICAM_IntNode, POINTER(GENICAM_ImageFormatControl))
-GENICAM_ImageFormatControl_width = eval('CFUNCTYPE')(GENICAM_IntNode, POINTER(GENICAM_ImageFormatControl))
-GENICAM_ImageFormatControl_offsetX = eval('CFUNCTYPE')(GENICAM_IntNode, POINTER(GENICAM_ImageFormatControl))
-GENICAM_ImageFormatControl_offsetY = eval('CFUNCTYPE')(GENICAM_IntNode, POINTER(GENICAM_ImageFormatControl))
-GENICAM_ImageFormatControl_pixelFormat = eval('CFUNCTYPE')(GENICAM_EnumNode, POINTER(GENICAM_ImageFormatControl))
-GENICAM_ImageFormatControl_reverseX = eval('CFUNCTYPE')(GENICAM_BoolNode, POINTER(GENICAM_ImageFormatControl))
-GENICAM_ImageFormatControl_reverseY = eval('CFUNCTYPE')(GENICAM_BoolNode, POINTER(GENICAM_ImageFormatControl))
+GENICAM_ImageFormatControl_addRef = CFUNCTYPE(c_int, POINTER(GENICAM_ImageFormatControl))
+GENICAM_ImageFormatControl_release = CFUNCTYPE(c_int, POINTER(GENICAM_ImageFormatControl))
+GENICAM_ImageFormatControl_height = CFUNCTYPE(GENICAM_IntNode, POINTER(GENICAM_ImageFormatControl))
+GENICAM_ImageFormatControl_width = CFUNCTYPE(GENICAM_IntNode, POINTER(GENICAM_ImageFormatControl))
+GENICAM_ImageFormatControl_offsetX = CFUNCTYPE(GENICAM_IntNode, POINTER(GENICAM_ImageFormatControl))
+GENICAM_ImageFormatControl_offsetY = CFUNCTYPE(GENICAM_IntNode, POINTER(GENICAM_ImageFormatControl))
+GENICAM_ImageFormatControl_pixelFormat = CFUNCTYPE(GENICAM_EnumNode, POINTER(GENICAM_ImageFormatControl))
+GENICAM_ImageFormatControl_reverseX = CFUNCTYPE(GENICAM_BoolNode, POINTER(GENICAM_ImageFormatControl))
+GENICAM_ImageFormatControl_reverseY = CFUNCTYPE(GENICAM_BoolNode, POINTER(GENICAM_ImageFormatControl))
   
 GENICAM_ImageFormatControl._fields_ = [
                                        ('priv', c_void_p),
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# coding: utf-8
+'''
+Created on 2026-10-16
+
+@author:
+'''
+
+import threading
+
+from NodeCache import *
+from SDKUtil import createEventSubscribe
+
+
+class ParamCache:
+    """
+    属性值的读缓存，建立在 NodeCache 之上。读取时命中缓存直接返回，不经过控制通道；
+    通过 subscribeParamUpdateEx 订阅参数更新事件，只有 SDK 报告某个属性更新时才让该属性的缓存失效。
+    未订阅成功时不做缓存，每次读取都直接读设备。
+
+        paramCache = ParamCache(nodeCache)
+        paramCache.subscribe(camera)
+        exposureTime = paramCache.getValue(NODE_DOUBLE, b"ExposureTime")
+    """
+    def __init__(self, nodeCache):
+        self.nodeCache = nodeCache
+        self._lock = threading.Lock()
+        self._values = {}
+        # 每次失效加一，读设备期间发生失效时不写入缓存
+        # bumped by every invalidation, a device read that raced with one is not cached
+        self._generation = 0
+        self._paramUpdateCallback = paramUpdateCallBackEx(self._onParamUpdate)
+        self.subscribed = False
+
+        # 统计信息
+        # statistics
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    # 注册参数更新回调
+    # subscribe parameter update notify
+    def subscribe(self, camera):
+        eventSubscribe = createEventSubscribe(camera)
+        if eventSubscribe is None:
+            return -1
+
+        nRet = eventSubscribe.contents.subscribeParamUpdateEx(eventSubscribe, self._paramUpdateCallback, None)
+        # 不再使用时，需释放相关资源
+        # release subscribe resource at the end of use
+        eventSubscribe.contents.release(eventSubscribe)
+        if nRet != 0:
+            print("subscribeParamUpdateEx fail!")
+            return -1
+        self.subscribed = True
+        return 0
+
+    # 反注册参数更新回调，之后不再缓存
+    # unsubscribe parameter update notify, nothing is cached afterwards
+    def unsubscribe(self, camera):
+        if not self.subscribed:
+            return 0
+        self.subscribed = False
+        self.invalidate()
+
+        eventSubscribe = createEventSubscribe(camera)
+        if eventSubscribe is None:
+            return -1
+
+        nRet = eventSubscribe.contents.unsubscribeParamUpdateEx(eventSubscribe, self._paramUpdateCallback, None)
+        # 不再使用时，需释放相关资源
+        # release subscribe resource at the end of use
+        eventSubscribe.contents.release(eventSubscribe)
+        if nRet != 0:
+            print("unsubscribeParamUpdateEx fail!")
+            return -1
+        return 0
+
+    # 参数更新回调：paramNames 中前 referenceParamCnt 个为本次更新的属性名
+    # parameter update callback: the first referenceParamCnt entries of paramNames were updated
+    def _onParamUpdate(self, paramUpdateArg, userInfo):
+        arg = paramUpdateArg.contents
+        count = min(arg.referenceParamCnt, MAX_PARAM_CNT)
+        self.invalidate([arg.paramNames[i].value for i in range(count)])
+
+    # 让指定属性（为空时全部属性）的缓存失效
+    # drop the cached value of the given attributes, or of every attribute
+    def invalidate(self, attrNames=None):
+        with self._lock:
+            self._generation += 1
+            if attrNames is None:
+                self._values.clear()
+                return
+            for attrName in attrNames:
+                if self._values.pop(attrName, None) is not None:
+                    self.invalidations += 1
+
+    # 读取属性值，缓存中没有时读设备并缓存
+    # read a property, from the cache when possible, otherwise from the device
+    def getValue(self, kind, attrName):
+        with self._lock:
+            cached = self._values.get(attrName)
+            if cached is not None and cached[0] == kind:
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+            generation = self._generation
+
+        value = self.nodeCache.getValue(kind, attrName)
+        if value is None or not self.subscribed:
+            return value
+        with self._lock:
+            if generation == self._generation:
+                self._values[attrName] = (kind, value)
+        return value
+
+    # 写属性值，写入后该属性的缓存失效（设备可能按步长调整写入的值）
+    # write a property and drop its cached value, the device may round what was written
+    def setValue(self, kind, attrName, value=None):
+        nRet = self.nodeCache.setValue(kind, attrName, value)
+        self.invalidate([attrName])
+        return nRet
+
+    @property
+    def hitRate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "values": len(self._values),
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "hitRate": self.hitRate,
+            }
@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+# coding: utf-8
+'''
+Created on 2026-10-16
+
+@author:
+'''
+
+import threading
+
+import numpy
+
+from ImageConvert import *
+from OPTSDK import *
+from PixelUnpack import PACKED_FORMATS, unpack
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+# 转码后端
+# conversion backends
+CONVERT_BACKEND_DLL = "dll"        # ImageConvert.dll，仅 Windows / ImageConvert.dll, Windows only
+CONVERT_BACKEND_OPENCV = "opencv"  # cv2.cvtColor 拜耳插值 / cv2.cvtColor Bayer demosaic
+CONVERT_BACKEND_NUMPY = "numpy"    # 2x2 超像素插值 / 2x2 superpixel demosaic
+
+CONVERT_BACKENDS = (CONVERT_BACKEND_DLL, CONVERT_BACKEND_OPENCV, CONVERT_BACKEND_NUMPY)
+
+# 拜耳格式 => (第一行前两个像素的排列, 位深)，10/12/16 位为小端 uint16，打包格式先由 PixelUnpack 解包
+# Bayer formats => (colors of the first two pixels of the first row, bit depth), 10/12/16-bit are little endian
+# uint16, packed formats are unpacked by PixelUnpack first
+BAYER_FORMATS = {
+    EPixelType.gvspPixelBayRG8: ("RG", 8),
+    EPixelType.gvspPixelBayGB8: ("GB", 8),
+    EPixelType.gvspPixelBayGR8: ("GR", 8),
+    EPixelType.gvspPixelBayBG8: ("BG", 8),
+    EPixelType.gvspPixelBayRG10: ("RG", 10),
+    EPixelType.gvspPixelBayGB10: ("GB", 10),
+    EPixelType.gvspPixelBayGR10: ("GR", 10),
+    EPixelType.gvspPixelBayBG10: ("BG", 10),
+    EPixelType.gvspPixelBayRG12: ("RG", 12),
+    EPixelType.gvspPixelBayGB12: ("GB", 12),
+    EPixelType.gvspPixelBayGR12: ("GR", 12),
+    EPixelType.gvspPixelBayBG12: ("BG", 12),
+    EPixelType.gvspPixelBayRG16: ("RG", 16),
+    EPixelType.gvspPixelBayGB16: ("GB", 16),
+    EPixelType.gvspPixelBayGR16: ("GR", 16),
+    EPixelType.gvspPixelBayBG16: ("BG", 16),
+    EPixelType.gvspPixelBayRG10Packed: ("RG", 10),
+    EPixelType.gvspPixelBayGB10Packed: ("GB", 10),
+    EPixelType.gvspPixelBayGR10Packed: ("GR", 10),
+    EPixelType.gvspPixelBayBG10Packed: ("BG", 10),
+    EPixelType.gvspPixelBayRG12Packed: ("RG", 12),
+    EPixelType.gvspPixelBayGB12Packed: ("GB", 12),
+    EPixelType.gvspPixelBayGR12Packed: ("GR", 12),
+    EPixelType.gvspPixelBayBG12Packed: ("BG", 12),
+    EPixelType.gvspPixelBayRG10p: ("RG", 10),
+    EPixelType.gvspPixelBayRG12p: ("RG", 12),
+}
+
+# OpenCV 以第二行第二、三个像素命名拜耳格式，RGGB 传感器对应 COLOR_BayerBG2BGR
+# OpenCV names Bayer patterns after the second row, an RGGB sensor is COLOR_BayerBG2BGR
+if cv2 is not None:
+    _OPENCV_BAYER_CODES = {
+        "RG": cv2.COLOR_BayerBG2BGR,
+        "GB": cv2.COLOR_BayerGR2BGR,
+        "GR": cv2.COLOR_BayerGB2BGR,
+        "BG": cv2.COLOR_BayerRG2BGR,
+    }
+
+# 2x2 单元中 R 和 B 的位置
+# position of R and B inside a 2x2 cell
+_BAYER_CELLS = {
+    "RG": ((0, 0), (1, 1)),
+    "GB": ((1, 0), (0, 1)),
+    "GR": ((0, 1), (1, 0)),
+    "BG": ((1, 1), (0, 0)),
+}
+
+# 按像素格式指定的后端，未指定时使用 defaultBackend()
+# backend chosen per pixel format, defaultBackend() applies to the others
+_backends = {}
+_scratch = threading.local()
+
+
+# ImageConvert 动态库是否能找到，第一次查询后缓存结果（每帧都会查询默认后端）
+# whether the ImageConvert library can be found, probed once and cached since the default
+# backend is looked up for every frame
+_dllAvailable = None
+
+
+def dllAvailable():
+    global _dllAvailable
+    if _dllAvailable is None:
+        _dllAvailable = ImageConvertdll.available()
+    return _dllAvailable
+
+
+# 某个像素格式可用的后端
+# backends able to convert the given pixel format
+def availableBackends(pixelFormat):
+    backends = []
+    if dllAvailable():
+        backends.append(CONVERT_BACKEND_DLL)
+    if pixelFormat in BAYER_FORMATS:
+        if cv2 is not None:
+            backends.append(CONVERT_BACKEND_OPENCV)
+        backends.append(CONVERT_BACKEND_NUMPY)
+    return backends
+
+
+# 默认后端：有 ImageConvert.dll 时使用 dll，否则拜耳格式优先使用 OpenCV
+# default backend: the dll where it exists, otherwise OpenCV first for Bayer formats
+def defaultBackend(pixelFormat):
+    backends = availableBackends(pixelFormat)
+    return backends[0] if backends else None
+
+
+# 为像素格式指定转码后端，backend 为 None 时恢复默认
+# choose the backend of a pixel format, None restores the default
+def setConvertBackend(pixelFormat, backend):
+    if backend is None:
+        _backends.pop(pixelFormat, None)
+        return
+    if backend not in CONVERT_BACKENDS:
+        raise ValueError("unknown convert backend [%s], expected one of %s" % (backend, CONVERT_BACKENDS))
+    if backend not in availableBackends(pixelFormat):
+        raise ValueError("convert backend [%s] does not support pixel format [0x%08x]" % (backend, pixelFormat))
+    _backends[pixelFormat] = backend
+
+
+def getConvertBackend(pixelFormat):
+    return _backends.get(pixelFormat) or defaultBackend(pixelFormat)
+
+
+# 转码为 BGR24 写入 out，返回 out，失败返回 None
+# convert into the BGR24 array `out`, returns `out` or None on failure
+def convertToBGR24(imageBuff, params, out, backend=None):
+    if backend is None:
+        backend = getConvertBackend(params.pixelForamt)
+    if backend == CONVERT_BACKEND_DLL:
+        rgbSize = c_int()
+        nRet = IMGCNV_ConvertToBGR24(c_void_p(imageBuff), byref(params), out.ctypes.data_as(c_void_p), byref(rgbSize))
+        if nRet != 0:
+            print("image convert fail! errorCode:[%d]" % nRet)
+            return None
+        return out
+
+    if params.pixelForamt not in BAYER_FORMATS or backend is None:
+        print("no convert backend for pixel format [0x%08x]!" % params.pixelForamt)
+        return None
+    pattern, bits = BAYER_FORMATS[params.pixelForamt]
+    mosaic = bayerMosaic(imageBuff, params, bits)
+    if backend == CONVERT_BACKEND_OPENCV:
+        cv2.cvtColor(mosaic, _OPENCV_BAYER_CODES[pattern], dst=out)
+    else:
+        demosaicNumpy(mosaic, pattern, out)
+    return out
+
+
+# 拜耳原始数据的 8 位二维视图，高位深数据（打包格式先解包）右移到 8 位后写入线程私有的临时缓存
+# 2-D 8-bit view of the Bayer data; deeper data (unpacked first when packed) is shifted down
+# into a per-thread scratch buffer
+def bayerMosaic(imageBuff, params, bits):
+    height = params.height
+    width = params.width
+    stride = width + params.paddingX
+    if bits == 8:
+        raw = numpy.ctypeslib.as_array(cast(c_void_p(imageBuff), POINTER(c_ubyte)), shape=(height * stride,))
+        return raw.reshape(height, stride)[:, :width]
+
+    if params.pixelForamt in PACKED_FORMATS:
+        source = getattr(_scratch, "unpacked", None)
+        if source is None or source.shape != (height, width):
+            source = numpy.empty((height, width), dtype=numpy.uint16)
+            _scratch.unpacked = source
+        raw = numpy.ctypeslib.as_array(cast(c_void_p(imageBuff), POINTER(c_ubyte)), shape=(params.dataSize,))
+        unpack(params.pixelForamt, raw, source)
+    else:
+        raw = numpy.ctypeslib.as_array(cast(c_void_p(imageBuff), POINTER(c_ushort)), shape=(height * stride,))
+        source = raw.reshape(height, stride)[:, :width]
+    mosaic = getattr(_scratch, "mosaic", None)
+    if mosaic is None or mosaic.shape != (height, width):
+        mosaic = numpy.empty((height, width), dtype=numpy.uint8)
+        _scratch.mosaic = mosaic
+    numpy.right_shift(source, bits - 8, out=mosaic, casting="unsafe")
+    return mosaic
+
+
+# 2x2 超像素插值：每个 2x2 单元的 R、B 和两个 G 的均值填满该单元，宽高为奇数时复制最后一行/列
+# 2x2 superpixel demosaic: R, B and the mean of both G of a cell fill the whole cell,
+# an odd last row/column repeats its neighbour
+def demosaicNumpy(mosaic, pattern, out):
+    height, width = mosaic.shape
+    h2 = height // 2 * 2
+    w2 = width // 2 * 2
+    (ry, rx), (by, bx) = _BAYER_CELLS[pattern]
+    red = mosaic[ry:h2:2, rx:w2:2]
+    blue = mosaic[by:h2:2, bx:w2:2]
+    green = numpy.add(mosaic[ry:h2:2, bx:w2:2], mosaic[by:h2:2, rx:w2:2], dtype=numpy.uint16)
+    green >>= 1
+    for dy in (0, 1):
+        for dx in (0, 1):
+            cell = out[dy:h2:2, dx:w2:2]
+            cell[..., 0] = blue
+            cell[..., 1] = green
+            cell[..., 2] = red
+    if w2 < width:
+        out[:h2, w2:] = out[:h2, w2 - 1:w2]
+    if h2 < height:
+        out[h2:] = out[h2 - 1:h2]
+    return out
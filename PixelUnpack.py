@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# coding: utf-8
+'''
+Created on 2026-10-16
+
+@author:
+'''
+
+import numpy
+
+from OPTSDK import *
+
+
+# 输出缓存检查：uint16、C 连续，返回一维视图
+# check the target is C-contiguous uint16, returns a 1-D view of it
+def _checkOut(out):
+    if out.dtype != numpy.uint16 or not out.flags.c_contiguous:
+        raise ValueError("target array must be C-contiguous uint16")
+    return out.reshape(-1)
+
+
+# 按字节步长读取小端 16 位字，不拷贝（允许非对齐）
+# little endian 16-bit words read every `step` bytes starting at `offset`, no copy (unaligned is fine)
+def _words(src, offset, step, count):
+    return numpy.ndarray((count,), dtype="<u2", buffer=src, offset=offset, strides=(step,))
+
+
+def _groups(src, pixelsPerGroup, bytesPerGroup, out):
+    count = out.size
+    if count % pixelsPerGroup != 0:
+        raise ValueError("pixel count must be a multiple of %d" % pixelsPerGroup)
+    groups = count // pixelsPerGroup
+    if src.size < groups * bytesPerGroup:
+        raise ValueError("source holds %d bytes, %d needed" % (src.size, groups * bytesPerGroup))
+    if src.dtype != numpy.uint8 or src.ndim != 1:
+        raise ValueError("source must be a 1-D uint8 array")
+    return groups
+
+
+# GigE Vision Mono12Packed / BayerXX12Packed：2 个像素 3 字节
+# b0 = p0[11:4]，b1 低 4 位 = p0[3:0]，b1 高 4 位 = p1[3:0]，b2 = p1[11:4]
+# GigE Vision Mono12Packed / BayerXX12Packed, 2 pixels in 3 bytes:
+# b0 = p0[11:4], low nibble of b1 = p0[3:0], high nibble of b1 = p1[3:0], b2 = p1[11:4]
+def unpack12Packed(src, out):
+    flat = _checkOut(out)
+    groups = _groups(src, 2, 3, out)
+    bytes3 = src[:groups * 3].reshape(groups, 3)
+    pixels = flat.reshape(groups, 2)
+
+    p0 = pixels[:, 0]
+    p0[:] = bytes3[:, 0]
+    p0 <<= 4
+    p0 |= bytes3[:, 1] & 0x0F
+    # b1 | b2 << 8 右移 4 位正好是 p1
+    # the word b1 | b2 << 8 shifted right by 4 is exactly p1
+    numpy.right_shift(_words(src, 1, 3, groups), 4, out=pixels[:, 1])
+    return out
+
+
+# GigE Vision Mono10Packed / BayerXX10Packed：2 个像素 3 字节
+# b0 = p0[9:2]，b1 bit0-1 = p0[1:0]，b1 bit4-5 = p1[1:0]，b2 = p1[9:2]
+# GigE Vision Mono10Packed / BayerXX10Packed, 2 pixels in 3 bytes:
+# b0 = p0[9:2], bits 0-1 of b1 = p0[1:0], bits 4-5 of b1 = p1[1:0], b2 = p1[9:2]
+def unpack10Packed(src, out):
+    flat = _checkOut(out)
+    groups = _groups(src, 2, 3, out)
+    bytes3 = src[:groups * 3].reshape(groups, 3)
+    pixels = flat.reshape(groups, 2)
+
+    p0 = pixels[:, 0]
+    p0[:] = bytes3[:, 0]
+    p0 <<= 2
+    p0 |= bytes3[:, 1] & 0x03
+
+    p1 = pixels[:, 1]
+    p1[:] = bytes3[:, 2]
+    p1 <<= 2
+    p1 |= (bytes3[:, 1] >> 4) & 0x03
+    return out
+
+
+# GenICam PFNC 12p（如 BayerRG12p）：LSB 优先连续打包，2 个像素 3 字节
+# p0 = b0 | (b1 & 0xF) << 8，p1 = b1 >> 4 | b2 << 4
+# GenICam PFNC 12p (e.g. BayerRG12p), LSB-first bit stream, 2 pixels in 3 bytes:
+# p0 = b0 | (b1 & 0xF) << 8, p1 = b1 >> 4 | b2 << 4
+def unpack12p(src, out):
+    flat = _checkOut(out)
+    groups = _groups(src, 2, 3, out)
+    pixels = flat.reshape(groups, 2)
+
+    numpy.bitwise_and(_words(src, 0, 3, groups), 0x0FFF, out=pixels[:, 0])
+    numpy.right_shift(_words(src, 1, 3, groups), 4, out=pixels[:, 1])
+    return out
+
+
+# GenICam PFNC 10p（如 BayerRG10p）：LSB 优先连续打包，4 个像素 5 字节，
+# 第 k 个像素从第 k 个字节的第 2k 位开始，读一个 16 位字移位后取低 10 位
+# GenICam PFNC 10p (e.g. BayerRG10p), LSB-first bit stream, 4 pixels in 5 bytes:
+# pixel k starts at bit 2k of byte k, so one shifted 16-bit word holds it
+def unpack10p(src, out):
+    flat = _checkOut(out)
+    groups = _groups(src, 4, 5, out)
+    pixels = flat.reshape(groups, 4)
+
+    for k in range(4):
+        p = pixels[:, k]
+        numpy.right_shift(_words(src, k, 5, groups), 2 * k, out=p)
+        p &= 0x03FF
+    return out
+
+
+# 打包格式 => (解包函数, 有效位数)
+# packed formats => (unpacker, significant bits)
+PACKED_FORMATS = {
+    EPixelType.gvspPixelMono10Packed: (unpack10Packed, 10),
+    EPixelType.gvspPixelMono12Packed: (unpack12Packed, 12),
+    EPixelType.gvspPixelBayGR10Packed: (unpack10Packed, 10),
+    EPixelType.gvspPixelBayRG10Packed: (unpack10Packed, 10),
+    EPixelType.gvspPixelBayGB10Packed: (unpack10Packed, 10),
+    EPixelType.gvspPixelBayBG10Packed: (unpack10Packed, 10),
+    EPixelType.gvspPixelBayGR12Packed: (unpack12Packed, 12),
+    EPixelType.gvspPixelBayRG12Packed: (unpack12Packed, 12),
+    EPixelType.gvspPixelBayGB12Packed: (unpack12Packed, 12),
+    EPixelType.gvspPixelBayBG12Packed: (unpack12Packed, 12),
+    EPixelType.gvspPixelBayRG10p: (unpack10p, 10),
+    EPixelType.gvspPixelBayRG12p: (unpack12p, 12),
+}
+
+
+# 把打包数据解包到 out（uint16，像素数与图像一致），返回 out
+# unpack `src` (1-D uint8) into `out` (uint16, one element per pixel), returns `out`
+def unpack(pixelFormat, src, out):
+    if pixelFormat not in PACKED_FORMATS:
+        raise ValueError("pixel format [0x%08x] is not a packed format" % pixelFormat)
+    return PACKED_FORMATS[pixelFormat][0](src, out)
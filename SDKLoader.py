@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# coding: utf-8
+'''
+Created on 2026-10-16
+
+@author:
+'''
+
+import os
+import struct
+import sys
+import threading
+from ctypes.util import find_library
+
+# Windows 下与原来一样用 OleDLL（返回值为负时抛出 OSError），其他平台用 CDLL
+# OleDLL on Windows as before (negative results raise OSError), CDLL elsewhere
+if os.name == "nt":
+    from ctypes import OleDLL as _LibraryLoader
+else:
+    from ctypes import CDLL as _LibraryLoader
+
+# 指定动态库所在目录的环境变量，优先于默认目录
+# environment variable naming the library directory, searched before the default locations
+SDK_DIR_ENV = "OPTSDK_DLL_DIR"
+
+# 选择后端的环境变量：dll（默认，加载真实的动态库）或 sim（SimSDK 仿真相机，不需要硬件）
+# environment variable choosing the backend: dll (default, the real library) or sim (SimSDK, no hardware)
+SDK_BACKEND_ENV = "OPTSDK_BACKEND"
+SDK_BACKEND_DLL = "dll"
+SDK_BACKEND_SIM = "sim"
+
+# 仿真后端提供的库
+# libraries the simulated backend provides
+SIM_LIBRARIES = ("OPTSDK",)
+
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def sdkBackend():
+    return os.environ.get(SDK_BACKEND_ENV, SDK_BACKEND_DLL).lower()
+
+
+# 当前解释器的位数对应的库目录名
+# library directory name for the bitness of this interpreter
+def libraryArch():
+    return "x64" if struct.calcsize("P") == 8 else "x86"
+
+
+def libraryFileName(name):
+    if os.name == "nt":
+        return name + ".dll"
+    if sys.platform == "darwin":
+        return "lib%s.dylib" % name
+    return "lib%s.so" % name
+
+
+# 查找动态库，依次为：环境变量目录、本模块下的 dll/<arch>、当前目录下的 dll/<arch>、系统库路径；找不到返回 None
+# locate a library: the environment directory, dll/<arch> next to this module, dll/<arch> under the
+# working directory, then the system search path. None when it is nowhere to be found
+def findLibrary(name):
+    fileName = libraryFileName(name)
+    arch = libraryArch()
+    dirs = []
+    envDir = os.environ.get(SDK_DIR_ENV)
+    if envDir:
+        dirs += [os.path.join(envDir, arch), envDir]
+    dirs += [os.path.join(_MODULE_DIR, "dll", arch), os.path.join("dll", arch)]
+    for libDir in dirs:
+        path = os.path.join(libDir, fileName)
+        if os.path.isfile(path):
+            return os.path.abspath(path)
+    return find_library(name)
+
+
+class SDKFunction:
+    """
+    动态库中的一个导出函数，第一次调用时才加载动态库并取得函数指针，之后直接调用缓存的函数。
+    """
+    __slots__ = ("library", "name", "_func")
+
+    def __init__(self, library, name):
+        self.library = library
+        self.name = name
+        self._func = None
+
+    def __call__(self, *args):
+        func = self._func
+        if func is None:
+            func = self._func = getattr(self.library.load(), self.name)
+        return func(*args)
+
+    def __repr__(self):
+        return "<SDKFunction %s.%s>" % (self.library.name, self.name)
+
+
+class SDKLibrary:
+    """
+    延迟加载的 SDK 动态库：import 时只记录库名，第一次调用其中的函数时才查找并加载。
+    OPTSDK_BACKEND=sim 时 OPTSDK 由 SimSDK 仿真实现代替。
+    没有安装 SDK 时 import 仍然成功，调用函数时抛出 OSError；可先用 available() 判断。
+
+        OPTSDKdll = SDKLibrary("OPTSDK")
+        GENICAM_getSystemInstance = OPTSDKdll.GENICAM_getSystemInstance
+    """
+    def __init__(self, name):
+        self.name = name
+        self.path = None
+        self._dll = None
+        self._lock = threading.Lock()
+
+    def __getattr__(self, funcName):
+        if funcName.startswith("_"):
+            raise AttributeError(funcName)
+        func = SDKFunction(self, funcName)
+        setattr(self, funcName, func)
+        return func
+
+    # 加载动态库，已加载时直接返回
+    # load the library, a no-op once loaded
+    def load(self):
+        dll = self._dll
+        if dll is not None:
+            return dll
+        with self._lock:
+            if self._dll is None and self._simulated():
+                import SimSDK
+                self._dll = SimSDK.library()
+                self.path = SDK_BACKEND_SIM
+            if self._dll is None:
+                path = findLibrary(self.name)
+                if path is None:
+                    raise OSError("%s library not found, set %s to the directory holding %s"
+                                  % (self.name, SDK_DIR_ENV, libraryFileName(self.name)))
+                self._dll = _LibraryLoader(path)
+                self.path = path
+            return self._dll
+
+    def _simulated(self):
+        return sdkBackend() == SDK_BACKEND_SIM and self.name in SIM_LIBRARIES
+
+    @property
+    def loaded(self):
+        return self._dll is not None
+
+    # 动态库是否可用：已加载或能找到
+    # whether the library is usable: already loaded or present on disk
+    def available(self):
+        return self._dll is not None or self._simulated() or findLibrary(self.name) is not None
@@ -0,0 +1,22 @@
+#!/usr/bin/env python
+# coding: utf-8
+'''
+Created on 2026-10-17
+
+@author:
+'''
+
+from OPTSDK import *
+
+
+# 创建相机的事件订阅对象，失败返回 None；用完后需调用 release 释放
+# create the event subscribe object of a camera, None on failure; release it when done
+def createEventSubscribe(camera):
+    eventSubscribe = pointer(GENICAM_EventSubscribe())
+    eventSubscribeInfo = GENICAM_EventSubscribeInfo()
+    eventSubscribeInfo.pCamera = pointer(camera)
+    nRet = GENICAM_createEventSubscribe(byref(eventSubscribeInfo), byref(eventSubscribe))
+    if nRet != 0:
+        print("create eventSubscribe fail!")
+        return None
+    return eventSubscribe
@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+# coding: utf-8
+'''
+Created on 2026-10-16
+
+@author:
+'''
+
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy
+
+from OPTFrame import frameShape
+
+_RING_MAGIC = 0x4F505452494E4701
+_ALIGN = 64
+
+# 环形缓存头：magic, slots, slotBytes, 最新帧序号
+# ring header: magic, slots, slotBytes, sequence number of the newest frame
+_RING_HEADER = 4
+
+# 每个槽的头信息，seq 为奇数表示正在写入（seqlock）
+# per-slot header, an odd seq means the slot is being written (seqlock)
+SLOT_HEADER_DTYPE = numpy.dtype([
+    ("seq", numpy.uint64),
+    ("blockId", numpy.uint64),
+    ("timeStamp", numpy.uint64),
+    ("height", numpy.uint32),
+    ("width", numpy.uint32),
+    ("channels", numpy.uint32),
+    ("pixelFormat", numpy.uint32),
+    ("nbytes", numpy.uint64),
+])
+
+
+def _alignUp(value):
+    return (value + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+class RingFrame:
+    """
+    从共享内存环形缓存中读到的一帧，image 直接指向共享内存，不做拷贝。
+    写端绕回后该槽会被覆盖，处理完成后调用 valid() 确认数据在读取期间没有被改写。
+    """
+    def __init__(self, ring, slot, seq, header, image):
+        self._ring = ring
+        self.slot = slot
+        self.seq = seq
+        self.blockId = int(header["blockId"])
+        self.timeStamp = int(header["timeStamp"])
+        self.pixelFormat = int(header["pixelFormat"])
+        self.image = image
+
+    # 该槽仍是读取时的那一帧时返回 True
+    # True while the slot still holds the frame that was read
+    def valid(self):
+        return self._ring._slotSeq(self.slot) == self.seq * 2
+
+
+class SharedFrameRing:
+    """
+    基于 multiprocessing.shared_memory 的单写多读图像环形缓存，用于每个相机一个进程的取图方式。
+    相机进程创建环形缓存并把每一帧直接拷贝/转码到下一个槽中，主进程按名称打开，
+    通过 latest() 取到最新一帧的共享内存视图。
+
+        # 相机进程
+        ring = SharedFrameRing(slots=4, slotBytes=widthMax * heightMax * 3)
+        ring.write(optFrame)
+        # 主进程
+        ring = SharedFrameRing(name)
+        frame = ring.latest(lastSeq)
+
+    name 为空时创建新的共享内存，否则打开已有的共享内存。
+    """
+    def __init__(self, name=None, slots=4, slotBytes=0):
+        if name is None:
+            if slots < 2:
+                raise ValueError("a frame ring needs at least 2 slots")
+            if slotBytes <= 0:
+                raise ValueError("slotBytes must be positive")
+            slotStride = _alignUp(slotBytes)
+            dataOffset = _alignUp(_RING_HEADER * 8 + slots * SLOT_HEADER_DTYPE.itemsize)
+            self._shm = shared_memory.SharedMemory(create=True, size=dataOffset + slots * slotStride)
+            self.owner = True
+        else:
+            self._shm = self._attach(name)
+            self.owner = False
+
+        self._ringHeader = numpy.ndarray((_RING_HEADER,), dtype=numpy.uint64, buffer=self._shm.buf)
+        if self.owner:
+            self._ringHeader[:] = (_RING_MAGIC, slots, slotBytes, 0)
+        elif self._ringHeader[0] != _RING_MAGIC:
+            self._ringHeader = None
+            self._shm.close()
+            raise ValueError("shared memory [%s] is not a frame ring" % name)
+
+        self.slots = int(self._ringHeader[1])
+        self.slotBytes = int(self._ringHeader[2])
+        self._slotStride = _alignUp(self.slotBytes)
+        self._dataOffset = _alignUp(_RING_HEADER * 8 + self.slots * SLOT_HEADER_DTYPE.itemsize)
+        self._headers = numpy.ndarray((self.slots,), dtype=SLOT_HEADER_DTYPE, buffer=self._shm.buf,
+                                      offset=_RING_HEADER * 8)
+        if self.owner:
+            self._headers[:] = 0
+
+        # 统计信息
+        # statistics
+        self.written = 0
+        self.tooLarge = 0
+        self.torn = 0
+
+    @staticmethod
+    def _attach(name):
+        # 打开方不负责释放共享内存，避免 resource_tracker 在打开方退出时把它删除
+        # the attaching side does not own the segment, keep resource_tracker from unlinking it on exit
+        try:
+            return shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            shm = shared_memory.SharedMemory(name=name)
+            try:
+                resource_tracker.unregister(shm._name, "shared_memory")
+            except Exception:
+                pass
+            return shm
+
+    @property
+    def name(self):
+        return self._shm.name
+
+    @property
+    def seq(self):
+        return int(self._ringHeader[3])
+
+    def _slotSeq(self, slot):
+        return int(self._headers["seq"][slot])
+
+    def _slotView(self, slot, shape):
+        return numpy.ndarray(shape, dtype=numpy.uint8, buffer=self._shm.buf,
+                             offset=self._dataOffset + slot * self._slotStride)
+
+    # 写端：把一帧拷贝/转码到下一个槽中，返回该帧的序号，槽容量不足或转码失败返回 -1
+    # writer: copy/convert a frame into the next slot, returns its sequence number, -1 on failure
+    def write(self, optFrame):
+        shape = frameShape(optFrame.params.pixelForamt, optFrame.params.width, optFrame.params.height)
+        nbytes = int(numpy.prod(shape))
+        if nbytes > self.slotBytes:
+            self.tooLarge += 1
+            print("frame of [%d] bytes does not fit the ring slot of [%d] bytes!" % (nbytes, self.slotBytes))
+            return -1
+
+        seq = self.seq + 1
+        slot = (seq - 1) % self.slots
+        headers = self._headers
+        headers["seq"][slot] = seq * 2 - 1
+        if optFrame.copy_to(self._slotView(slot, shape)) is None:
+            headers["seq"][slot] = 0
+            return -1
+        headers["blockId"][slot] = optFrame.blockId
+        headers["timeStamp"][slot] = optFrame.timeStamp
+        headers["height"][slot] = shape[0]
+        headers["width"][slot] = shape[1]
+        headers["channels"][slot] = shape[2] if len(shape) == 3 else 1
+        headers["pixelFormat"][slot] = optFrame.params.pixelForamt
+        headers["nbytes"][slot] = nbytes
+        headers["seq"][slot] = seq * 2
+        self._ringHeader[3] = seq
+        self.written += 1
+        return seq
+
+    # 读端：取比 lastSeq 更新的最新一帧，没有新帧或该槽正被改写时返回 None
+    # reader: newest frame after lastSeq, None when there is none or its slot is being rewritten
+    def latest(self, lastSeq=0):
+        seq = self.seq
+        if seq == 0 or seq <= lastSeq:
+            return None
+        slot = (seq - 1) % self.slots
+        header = self._headers[slot].copy()
+        if int(header["seq"]) != seq * 2:
+            self.torn += 1
+            return None
+        if header["channels"] == 1:
+            shape = (int(header["height"]), int(header["width"]))
+        else:
+            shape = (int(header["height"]), int(header["width"]), int(header["channels"]))
+        frame = RingFrame(self, slot, seq, header, self._slotView(slot, shape))
+        if not frame.valid():
+            self.torn += 1
+            return None
+        return frame
+
+    # 关闭映射，调用前需丢弃所有 RingFrame；创建方同时删除共享内存
+    # unmap the ring, drop every RingFrame first; the creating side also unlinks it
+    def close(self):
+        self._ringHeader = None
+        self._headers = None
+        self._shm.close()
+        if self.owner:
+            self._shm.unlink()
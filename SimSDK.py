@@ -0,0 +1,1048 @@
+#!/usr/bin/env python
+# coding: utf-8
+'''
+Created on 2026-10-16
+
+@author:
+'''
+
+import collections
+import itertools
+import os
+import random
+import re
+import threading
+import time
+from ctypes import _Pointer
+
+import numpy
+
+from OPTSDK import *
+
+# 仿真参数的环境变量，格式为 逗号分隔的 key=value，例如
+#     OPTSDK_BACKEND=sim OPTSDK_SIM="cameras=2,width=1920,height=1080,format=BayerRG8,fps=60,jitter=0.5,loss=0.01"
+# simulation settings as comma separated key=value pairs
+SIM_CONFIG_ENV = "OPTSDK_SIM"
+
+
+class SimConfig:
+    """
+    仿真相机的参数：相机数量、分辨率、像素格式、帧率、抖动（帧到达时间的标准差，毫秒）、丢帧率（0~1，
+    GevSCPD 为 0 时的值，包间隔越大丢得越少）、每个流的缓存个数以及网卡个数（相机依次轮流接在各网卡上）。
+    """
+    def __init__(self, cameras=2, width=1280, height=1024, format="Mono8", fps=30.0, jitter=0.0, loss=0.0,
+                 buffers=8, interfaces=1):
+        self.cameras = int(cameras)
+        self.width = int(width)
+        self.height = int(height)
+        self.format = format
+        self.fps = float(fps)
+        self.jitter = float(jitter)
+        self.loss = float(loss)
+        self.buffers = int(buffers)
+        self.interfaces = max(1, int(interfaces))
+
+    # 从环境变量解析，未给出的项使用默认值
+    # parse the environment variable, missing keys keep their default
+    @classmethod
+    def fromEnv(cls):
+        kwargs = {}
+        for item in os.environ.get(SIM_CONFIG_ENV, "").split(","):
+            if "=" in item:
+                key, value = item.split("=", 1)
+                kwargs[key.strip()] = value.strip()
+        return cls(**kwargs)
+
+
+# 像素格式符号（GenICam 命名，如 BayerRG8）与 EPixelType 值的相互转换
+# pixel format symbols (GenICam names such as BayerRG8) to EPixelType values and back
+PIXEL_FORMATS = dict((name[len("gvspPixel"):].replace("Bay", "Bayer", 1).encode(), value)
+                     for name, value in vars(EPixelType).items()
+                     if name.startswith("gvspPixel") and value & GVSP_PIX_EFFECTIVE_PIXEL_SIZE_MASK)
+PIXEL_FORMAT_SYMBOLS = dict((value, symbol) for symbol, value in PIXEL_FORMATS.items())
+
+
+def pixelFormatValue(symbol):
+    if isinstance(symbol, str):
+        symbol = symbol.encode()
+    if symbol.startswith(b"Bay") and not symbol.startswith(b"Bayer"):
+        symbol = b"Bayer" + symbol[3:]
+    if symbol not in PIXEL_FORMATS:
+        raise ValueError("unknown pixel format [%s]" % symbol.decode())
+    return PIXEL_FORMATS[symbol]
+
+
+# 一帧原始数据占用的字节数
+# size in bytes of one raw frame
+def frameSize(pixelFormat, width, height):
+    occupyBits = (pixelFormat & GVSP_PIX_EFFECTIVE_PIXEL_SIZE_MASK) >> GVSP_PIX_EFFECTIVE_PIXEL_SIZE_SHIFT
+    return width * height * occupyBits // 8
+
+
+# 生成 count 幅移动的渐变图作为帧数据；16 位存储的格式按有效位深取值
+# `count` shifted gradients used as frame data; formats stored in 16 bits stay within their bit depth
+def makePatterns(pixelFormat, width, height, count=4):
+    occupyBits = (pixelFormat & GVSP_PIX_EFFECTIVE_PIXEL_SIZE_MASK) >> GVSP_PIX_EFFECTIVE_PIXEL_SIZE_SHIFT
+    patterns = []
+    for k in range(count):
+        if occupyBits == 16:
+            bits = int(re.findall(rb"\d+", PIXEL_FORMAT_SYMBOLS[pixelFormat])[-1])
+            grid = numpy.add.outer(numpy.arange(height), numpy.arange(width)) * 4 + k * 64
+            patterns.append((grid & ((1 << bits) - 1)).astype(numpy.uint16))
+        else:
+            rowBytes = width * occupyBits // 8
+            grid = numpy.add.outer(numpy.arange(height), numpy.arange(rowBytes)) + k * 8
+            patterns.append((grid & 0xFF).astype(numpy.uint8))
+    return patterns
+
+
+# 对象句柄：结构体的 priv 字段保存 id，回调中据此找到对应的 Python 对象
+# handles: the priv field of every struct holds an id that maps back to its Python object
+_handles = {}
+_handleIds = itertools.count(1)
+
+
+def _register(obj):
+    handle = next(_handleIds)
+    _handles[handle] = obj
+    return handle
+
+
+def _lookup(pStruct):
+    return _handles.get(pStruct.contents.priv)
+
+
+def _isPointerType(ctype):
+    return isinstance(ctype, type) and issubclass(ctype, (_Pointer, c_char_p))
+
+
+# 按结构体中函数指针的原型生成回调，字符串与指针类型以 c_void_p 传递，以便原地写入调用者的缓存；
+# 没有实现的函数返回 -1（返回值为指针时返回空指针），按值返回结构体的函数无法由回调实现，保持为空
+# build thunks for the function pointers of a struct. Strings and pointers travel as c_void_p so callers'
+# buffers can be written in place; missing methods return -1 (NULL for pointer results). Functions returning
+# a struct by value cannot be implemented by a callback and stay NULL
+def _vtable(structType, methods, thunks):
+    table = structType()
+    for name, fieldType in structType._fields_:
+        if not hasattr(fieldType, "_argtypes_"):
+            continue
+        restype = fieldType._restype_
+        if _isPointerType(restype):
+            restype = c_void_p
+        elif restype is not None and not hasattr(restype, "_type_"):
+            continue
+        argtypes = [c_void_p if argtype is c_char_p else argtype for argtype in fieldType._argtypes_]
+        func = methods.get(name)
+        if func is None:
+            func = _stub(restype)
+        thunk = CFUNCTYPE(restype, *argtypes)(func)
+        thunks.append(thunk)
+        setattr(table, name, cast(thunk, fieldType))
+    return table
+
+
+def _stub(restype):
+    result = None if restype is None else (0 if restype is c_void_p else -1)
+    return lambda *args: result
+
+
+# 以模板复制一个结构体实例，priv 指向 obj
+# copy a struct from its template with priv pointing at obj
+def _instance(template, obj):
+    instance = type(template).from_buffer_copy(template)
+    instance.priv = _register(obj)
+    return instance
+
+
+def _callAll(callbacks, arg):
+    for callback, userInfo in list(callbacks):
+        callback(arg, userInfo)
+
+
+class SimFrame:
+    """
+    仿真的一帧，数据直接引用相机预先生成的图案，引用计数归零时归还流的缓存。
+    """
+    def __init__(self, stream, blockId, data, pixelFormat, width, height):
+        self.stream = stream
+        self.blockId = blockId
+        self.timeStamp = time.perf_counter_ns()
+        self.data = data
+        self.pixelFormat = pixelFormat
+        self.width = width
+        self.height = height
+        self.refs = 1
+        self.struct = _instance(stream.camera.library.frameTemplate, self)
+        self.pointer = pointer(self.struct)
+
+    def release(self):
+        self.refs -= 1
+        if self.refs == 0:
+            _handles.pop(self.struct.priv, None)
+            self.stream._bufferReturned()
+        return 0
+
+
+class SimStream:
+    """
+    仿真的流：采集线程按 AcquisitionFrameRate（且不快于曝光时间）加抖动生成帧，按丢帧率丢弃，
+    有回调时在采集线程中调用回调，否则放入 getFrame 的队列。缓存全部被占用时，
+    Sequential 策略丢弃新帧，LatestImage 策略丢弃队列中最旧的一帧。LatestImage 策略的队列只保留最新一帧，
+    被新帧替换的旧帧计入 overrideBlock；UpcomingImage 策略下 getFrame 丢弃调用前已到达的帧，等待下一帧。
+    """
+    def __init__(self, camera):
+        self.camera = camera
+        self.bufferCount = camera.config.buffers
+        self.strategy = GENICAM_EGrabStrategy.grabStrartegySequential
+        self.grabbing = False
+        self._thread = None
+        self._stop = threading.Event()
+        self._cond = threading.Condition()
+        self._queue = collections.deque()
+        self._outstanding = 0
+        self._triggers = 0
+        self.callbacks = []
+        self.blockId = 0
+        self._maxImages = 0
+        self.resetStats()
+
+    def resetStats(self):
+        self.imageReceived = 0
+        self.lostPacketBlock = 0
+        self.overrideBlock = 0
+        self.fps = 0.0
+        self.bandwidth = 0.0
+        self._rateStart = time.perf_counter()
+        self._rateFrames = 0
+        self._rateBytes = 0
+        return 0
+
+    def start(self, maxImages, strategy):
+        if self.grabbing:
+            return 0
+        self.strategy = strategy
+        self._maxImages = maxImages
+        self.grabbing = True
+        self._stop.clear()
+        self.camera.prepareStream()
+        self._thread = threading.Thread(target=self._run, name="SimCamera-%d-stream" % self.camera.index,
+                                        daemon=True)
+        self._thread.start()
+        return 0
+
+    def stop(self):
+        if not self.grabbing:
+            return 0
+        self.grabbing = False
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+        # 回调中停止拉流时不能等待采集线程自身
+        # a callback stopping the stream cannot join its own thread
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+        with self._cond:
+            while self._queue:
+                self._queue.popleft().release()
+        return 0
+
+    def trigger(self):
+        with self._cond:
+            self._triggers += 1
+            self._cond.notify_all()
+
+    def getFrame(self, timeout):
+        deadline = time.perf_counter() + timeout / 1000.0
+        with self._cond:
+            if self.strategy == GENICAM_EGrabStrategy.grabStrartegyUpcomingImage:
+                while self._queue:
+                    self._queue.popleft().release()
+            while not self._queue:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    return None
+                self._cond.wait(remaining)
+            return self._queue.popleft()
+
+    def _bufferReturned(self):
+        with self._cond:
+            self._outstanding -= 1
+
+    def _waitNext(self, due):
+        camera = self.camera
+        if camera.getParam(b"TriggerMode") == b"On":
+            with self._cond:
+                while self._triggers == 0 and not self._stop.is_set():
+                    self._cond.wait(0.1)
+                if self._triggers == 0:
+                    return due
+                self._triggers -= 1
+            return time.perf_counter()
+
+        now = time.perf_counter()
+        # 落后超过一帧时不补发，从当前时刻重新计时
+        # more than a frame behind: resynchronise instead of bursting to catch up
+        if now - due > camera.framePeriod():
+            due = now
+        delay = due - now
+        if camera.config.jitter > 0:
+            delay += abs(random.gauss(0.0, camera.config.jitter / 1000.0))
+        if delay > 0:
+            self._stop.wait(delay)
+        return due
+
+    def _run(self):
+        camera = self.camera
+        due = time.perf_counter()
+        delivered = 0
+        while not self._stop.is_set():
+            due = self._waitNext(due + camera.framePeriod())
+            if self._stop.is_set():
+                break
+            if not camera.online:
+                continue
+
+            self.blockId += 1
+            if camera.config.loss > 0 and random.random() < camera.lossProbability():
+                self.lostPacketBlock += 1
+                self._streamEvent(GENICAM_EEventStatus.streamEventLostPacket)
+                continue
+            frame = self._newFrame()
+            if frame is None:
+                continue
+            self._updateRate(frame.data.nbytes)
+
+            if self.callbacks:
+                frame.refs = len(self.callbacks)
+                for callback, userInfo in list(self.callbacks):
+                    callback(frame.pointer, userInfo)
+            else:
+                with self._cond:
+                    if self.strategy == GENICAM_EGrabStrategy.grabStrartegyLatestImage:
+                        while self._queue:
+                            self._queue.popleft().release()
+                            self.overrideBlock += 1
+                    self._queue.append(frame)
+                    self._cond.notify()
+
+            delivered += 1
+            if self._maxImages and delivered >= self._maxImages:
+                break
+        self.grabbing = False
+
+    def _newFrame(self):
+        camera = self.camera
+        with self._cond:
+            overridden = self._outstanding >= self.bufferCount
+            if overridden:
+                self.overrideBlock += 1
+                if self.strategy == GENICAM_EGrabStrategy.grabStrartegyLatestImage and self._queue:
+                    self._queue.popleft().release()
+            dropped = self._outstanding >= self.bufferCount
+            if not dropped:
+                self._outstanding += 1
+        if overridden:
+            self._streamEvent(GENICAM_EEventStatus.streamEventLostFrame)
+        if dropped:
+            return None
+        patterns = camera.patterns
+        frame = SimFrame(self, self.blockId, patterns[self.blockId % len(patterns)],
+                         camera.streamFormat, camera.streamWidth, camera.streamHeight)
+        self.imageReceived += 1
+        return frame
+
+    # 通知流事件订阅者
+    # notify the stream event subscribers
+    def _streamEvent(self, status):
+        camera = self.camera
+        if not camera.streamCallbacks:
+            return
+        arg = GENICAM_SStreamArg()
+        arg.channel = camera.index
+        arg.blockID = self.blockId
+        arg.timestamp = time.perf_counter_ns()
+        arg.eStreamEventStatus = status
+        _callAll(camera.streamCallbacks, pointer(arg))
+
+    def _updateRate(self, nbytes):
+        self._rateFrames += 1
+        self._rateBytes += nbytes
+        elapsed = time.perf_counter() - self._rateStart
+        if elapsed >= 1.0:
+            self.fps = self._rateFrames / elapsed
+            # 单位 Mbit/s
+            # in Mbit/s
+            self.bandwidth = self._rateBytes * 8 / elapsed / 1e6
+            self._rateStart += elapsed
+            self._rateFrames = 0
+            self._rateBytes = 0
+
+
+# 整型属性的范围与步长：(最小值, 最大值, 步长)，最大值为 None 时由相机按当前参数计算
+# integer ranges as (min, max, increment); a None max is computed by the camera from the current values
+_INT_RANGES = {
+    b"Width": (64, None, 8),
+    b"Height": (64, None, 2),
+    b"OffsetX": (0, None, 8),
+    b"OffsetY": (0, None, 2),
+    b"BinningHorizontal": (1, 4, 1),
+    b"BinningVertical": (1, 4, 1),
+    b"GevSCPD": (0, 100000, 1),
+    b"GevSCPSPacketSize": (576, 9000, 4),
+}
+
+# GevSCPD 每增加 _SCPD_LOSS_SCALE 纳秒，丢帧率按 1 / (1 + GevSCPD / _SCPD_LOSS_SCALE) 下降；
+# 每个 GVSP 包中 IP/UDP/GVSP 头占用的字节数
+# loss falls as 1 / (1 + GevSCPD / _SCPD_LOSS_SCALE); bytes of IP/UDP/GVSP headers in every packet
+_SCPD_LOSS_SCALE = 1000.0
+_PACKET_OVERHEAD = 36
+
+_DOUBLE_RANGES = {
+    b"ExposureTime": (10.0, 1000000.0),
+    b"AcquisitionFrameRate": (0.1, 1000.0),
+    b"GainRaw": (1.0, 32.0),
+    b"TriggerDelay": (0.0, 1000000.0),
+}
+
+_ENUM_SYMBOLS = {
+    b"TriggerMode": (b"Off", b"On"),
+    b"TriggerSource": (b"Software", b"Line1"),
+    b"TriggerSelector": (b"FrameStart",),
+    b"TriggerActivation": (b"RisingEdge", b"FallingEdge"),
+    b"ExposureAuto": (b"Off", b"Continuous"),
+    b"GainAuto": (b"Off", b"Continuous"),
+    b"AcquisitionMode": (b"Continuous",),
+}
+
+_BOOL_NODES = (b"ReverseX", b"ReverseY", b"AcquisitionFrameRateEnable")
+
+_CMD_NODES = (b"TriggerSoftware",)
+
+# 只读属性
+# read-only properties
+_READ_ONLY = (b"WidthMax", b"HeightMax", b"PayloadSize")
+
+# 拉流期间不能修改的属性
+# properties locked while grabbing
+_STREAM_LOCKED = (b"Width", b"Height", b"OffsetX", b"OffsetY", b"PixelFormat",
+                  b"BinningHorizontal", b"BinningVertical", b"ReverseX", b"ReverseY")
+
+# 影响 PayloadSize 的属性
+# properties that change PayloadSize
+_PAYLOAD_PARAMS = (b"Width", b"Height", b"PixelFormat", b"BinningHorizontal", b"BinningVertical")
+
+
+class SimCamera:
+    """
+    仿真相机：GENICAM_Camera 及其属性节点、流、事件订阅的 Python 实现。
+    setOnline(False) 模拟掉线（通知连接状态回调并暂停出图）。
+    """
+    def __init__(self, library, index, config):
+        self.library = library
+        self.index = index
+        self.config = config
+        self.connected = False
+        self.online = True
+        self._lock = threading.RLock()
+        self.connectCallbacks = []
+        self.paramCallbacks = []
+        self.streamCallbacks = []
+        self.patterns = None
+        self._patternKey = None
+        self.streamPackets = 0
+
+        self.strings = dict((name, create_string_buffer(value)) for name, value in (
+            ("key", b"Sim:SimCamera%02d" % index),
+            ("name", b"SimCamera%02d" % index),
+            ("vendor", b"Sim"),
+            ("model", b"SimCamera"),
+            ("serial", b"SIM%06d" % index),
+            ("version", b"1.0.0"),
+            ("interface", b"sim%d" % (index % config.interfaces)),
+            ("interfaceIp", b"192.168.%d.1" % (index % config.interfaces + 1)),
+            ("interfaceMask", b"255.255.255.0"),
+            ("interfaceGateway", b"0.0.0.0"),
+            ("interfaceMac", b"02:00:00:00:00:%02x" % (index % config.interfaces)),
+        ))
+
+        pixelFormat = pixelFormatValue(config.format)
+        self.kinds = {}
+        self.params = {}
+        for name, value in ((b"WidthMax", config.width), (b"HeightMax", config.height),
+                            (b"Width", config.width), (b"Height", config.height),
+                            (b"OffsetX", 0), (b"OffsetY", 0), (b"BinningHorizontal", 1), (b"BinningVertical", 1),
+                            (b"GevSCPD", 0), (b"GevSCPSPacketSize", 1500),
+                            (b"PayloadSize", frameSize(pixelFormat, config.width, config.height))):
+            self._define(name, "int", value)
+        for name, value in ((b"ExposureTime", 10000.0), (b"AcquisitionFrameRate", config.fps),
+                            (b"GainRaw", 1.0), (b"TriggerDelay", 0.0)):
+            self._define(name, "double", value)
+        for name, symbols in _ENUM_SYMBOLS.items():
+            self._define(name, "enum", symbols[0])
+        self._define(b"PixelFormat", "enum", PIXEL_FORMAT_SYMBOLS[pixelFormat])
+        for name in _BOOL_NODES:
+            self._define(name, "bool", 1 if name == b"AcquisitionFrameRateEnable" else 0)
+        for name in _CMD_NODES:
+            self._define(name, "cmd", None)
+
+        self.struct = _instance(library.cameraTemplate, self)
+        self.stream = SimStream(self)
+
+    def _define(self, name, kind, value):
+        self.kinds[name] = kind
+        self.params[name] = value
+
+    def getParam(self, name):
+        with self._lock:
+            return self.params.get(name)
+
+    # 帧间隔：不快于 AcquisitionFrameRate，也不快于曝光时间和一帧所有包按 GevSCPD（纳秒）间隔发送的时间
+    # frame period, limited by AcquisitionFrameRate, by the exposure time and by sending every packet
+    # of a frame GevSCPD nanoseconds apart
+    def framePeriod(self):
+        with self._lock:
+            period = 1.0 / self.params[b"AcquisitionFrameRate"] if self.params[b"AcquisitionFrameRateEnable"] \
+                else 1.0 / self.config.fps
+            return max(period, self.params[b"ExposureTime"] / 1e6,
+                       self.streamPackets * self.params[b"GevSCPD"] / 1e9)
+
+    # 丢帧率：模拟交换机拥塞，包间隔 GevSCPD 越大丢得越少
+    # loss rate modelling switch congestion, a longer inter-packet delay loses less
+    def lossProbability(self):
+        return self.config.loss / (1.0 + self.params[b"GevSCPD"] / _SCPD_LOSS_SCALE)
+
+    # 开始拉流时按当前像素格式与尺寸生成帧数据
+    # build the frame data for the current format and geometry when grabbing starts
+    def prepareStream(self):
+        with self._lock:
+            self.streamFormat = pixelFormatValue(self.params[b"PixelFormat"])
+            self.streamWidth = self.params[b"Width"]
+            self.streamHeight = self.params[b"Height"]
+            payload = self.params[b"GevSCPSPacketSize"] - _PACKET_OVERHEAD
+            self.streamPackets = -(-frameSize(self.streamFormat, self.streamWidth, self.streamHeight) // payload)
+        key = (self.streamFormat, self.streamWidth, self.streamHeight)
+        if key != self._patternKey:
+            self.patterns = makePatterns(*key)
+            self._patternKey = key
+
+    def intRange(self, name):
+        minValue, maxValue, increment = _INT_RANGES.get(name, (None, None, 1))
+        params = self.params
+        if name == b"Width":
+            maxValue = params[b"WidthMax"] - params[b"OffsetX"]
+        elif name == b"Height":
+            maxValue = params[b"HeightMax"] - params[b"OffsetY"]
+        elif name == b"OffsetX":
+            maxValue = params[b"WidthMax"] - params[b"Width"]
+        elif name == b"OffsetY":
+            maxValue = params[b"HeightMax"] - params[b"Height"]
+        elif minValue is None:
+            minValue = maxValue = params[name]
+        return minValue, maxValue, increment
+
+    def doubleRange(self, name):
+        return _DOUBLE_RANGES[name]
+
+    # 写属性，成功后通知参数更新回调，返回 0 或 -1
+    # write a property and notify the parameter update subscribers, 0 or -1
+    def setParam(self, name, value):
+        kind = self.kinds[name]
+        with self._lock:
+            if name in _READ_ONLY:
+                return -1
+            if name in _STREAM_LOCKED and self.stream.grabbing:
+                return -1
+            if kind == "int":
+                minValue, maxValue, increment = self.intRange(name)
+                if value < minValue or value > maxValue or (value - minValue) % increment != 0:
+                    return -1
+            elif kind == "double":
+                minValue, maxValue = self.doubleRange(name)
+                if value < minValue or value > maxValue:
+                    return -1
+            elif kind == "enum":
+                if name == b"PixelFormat":
+                    if value not in PIXEL_FORMATS:
+                        return -1
+                elif value not in _ENUM_SYMBOLS[name]:
+                    return -1
+            elif kind == "bool":
+                value = 1 if value else 0
+            elif kind == "cmd":
+                if name == b"TriggerSoftware":
+                    self.stream.trigger()
+                return 0
+
+            self.params[name] = value
+            updated = [name]
+            if name in (b"BinningHorizontal", b"BinningVertical"):
+                updated += self._applyBinning()
+            if name in _PAYLOAD_PARAMS:
+                self.params[b"PayloadSize"] = frameSize(pixelFormatValue(self.params[b"PixelFormat"]),
+                                                        self.params[b"Width"], self.params[b"Height"])
+                updated.append(b"PayloadSize")
+        self._notifyParamUpdate(updated)
+        return 0
+
+    # 合并改变 WidthMax/HeightMax，当前尺寸超出时收缩并清零偏移
+    # binning changes WidthMax/HeightMax, the current geometry shrinks to fit and offsets reset
+    def _applyBinning(self):
+        params = self.params
+        params[b"WidthMax"] = self.config.width // params[b"BinningHorizontal"] // 8 * 8
+        params[b"HeightMax"] = self.config.height // params[b"BinningVertical"] // 2 * 2
+        updated = [b"WidthMax", b"HeightMax"]
+        for size, offset, sizeMax in ((b"Width", b"OffsetX", b"WidthMax"), (b"Height", b"OffsetY", b"HeightMax")):
+            if params[size] + params[offset] > params[sizeMax]:
+                params[offset] = 0
+                params[size] = min(params[size], params[sizeMax])
+                updated += [size, offset]
+        return updated
+
+    def _notifyParamUpdate(self, names):
+        if not self.paramCallbacks:
+            return
+        arg = GENICAM_SParamUpdataArg()
+        arg.referenceParamCnt = len(names)
+        for i, name in enumerate(names):
+            arg.paramNames[i].value = name
+        _callAll(self.paramCallbacks, pointer(arg))
+
+    def setOnline(self, online):
+        self.online = online
+        arg = GENICAM_SConnectArg()
+        arg.m_event = EVType.onLine if online else EVType.offLine
+        _callAll(self.connectCallbacks, pointer(arg))
+
+
+class SimNode:
+    def __init__(self, camera, name):
+        self.camera = camera
+        self.name = name
+        self.refs = 1
+
+
+class SimLibrary:
+    """
+    OPTSDK 动态库的仿真实现，提供 OPTCamera/MultiCamera 使用的导出函数：
+    GENICAM_getSystemInstance、GENICAM_createStreamSource、GENICAM_createGigEInterface、GENICAM_createEventSubscribe
+    以及 Int/Double/Enum/Bool/Cmd 节点的创建函数。由 SDKLoader 在 OPTSDK_BACKEND=sim 时加载。
+    AcquisitionControl 的函数按值返回节点结构体，无法用回调实现，GENICAM_createAcquisitionControl 返回失败。
+    """
+    def __init__(self, config=None):
+        self.config = config if config is not None else SimConfig.fromEnv()
+        self._thunks = []
+        self._buildTemplates()
+
+        self.cameras = [SimCamera(self, index, self.config) for index in range(self.config.cameras)]
+        self.cameraArray = (GENICAM_Camera * max(1, len(self.cameras)))()
+        for i, camera in enumerate(self.cameras):
+            self.cameraArray[i] = camera.struct
+            # 数组中的结构体是副本，priv 相同，指向同一个相机
+            # the array holds copies with the same priv, mapping to the same camera
+        self.system = _instance(self.systemTemplate, self)
+
+    def __getattr__(self, funcName):
+        if funcName.startswith("_"):
+            raise AttributeError(funcName)
+
+        def notSimulated(*args):
+            print("%s is not supported by the simulated SDK" % funcName)
+            return -1
+        return notSimulated
+
+    def _buildTemplates(self):
+        thunks = self._thunks
+        self.systemTemplate = _vtable(GENICAM_System, {
+            "addRef": lambda pSystem: 0,
+            "release": lambda pSystem: 0,
+            "discovery": self._discovery,
+            "getCamera": self._getCamera,
+            "getVersion": lambda pSystem: addressof(_SIM_VERSION),
+        }, thunks)
+        self.cameraTemplate = _vtable(GENICAM_Camera, {
+            "addRef": lambda pCamera: 0,
+            "release": lambda pCamera: 0,
+            "getType": lambda pCamera: GENICAM_EProtocolType.typeGigE,
+            "getName": self._cameraString("name"),
+            "getKey": self._cameraString("key"),
+            "connect": self._connect,
+            "disConnect": self._disConnect,
+            "isConnect": lambda pCamera: 0 if _lookup(pCamera).connected else -1,
+            "getInterfaceName": self._cameraString("interface"),
+            "getInterfaceType": lambda pCamera: GENICAM_EProtocolType.typeGigE,
+            "getVendorName": self._cameraString("vendor"),
+            "getModelName": self._cameraString("model"),
+            "getSerialNumber": self._cameraString("serial"),
+            "getDeviceVersion": self._cameraString("version"),
+            "getManufactureInfo": self._cameraString("vendor"),
+        }, thunks)
+        self.frameTemplate = _vtable(GENICAM_Frame, {
+            "addRef": self._frameAddRef,
+            "release": lambda pFrame: _lookup(pFrame).release(),
+            "valid": lambda pFrame: 0,
+            "getImage": lambda pFrame: _lookup(pFrame).data.ctypes.data,
+            "getFrameStatus": lambda pFrame: 0,
+            "getImageWidth": lambda pFrame: _lookup(pFrame).width,
+            "getImageHeight": lambda pFrame: _lookup(pFrame).height,
+            "getImageSize": lambda pFrame: _lookup(pFrame).data.nbytes,
+            "getImagePixelFormat": lambda pFrame: _lookup(pFrame).pixelFormat,
+            "getImageTimeStamp": lambda pFrame: _lookup(pFrame).timeStamp,
+            "getBlockId": lambda pFrame: _lookup(pFrame).blockId,
+            "getImagePaddingX": lambda pFrame: 0,
+            "getImagePaddingY": lambda pFrame: 0,
+        }, thunks)
+        self.streamTemplate = _vtable(GENICAM_StreamSource, {
+            "addRef": lambda pStream: 0,
+            "release": self._releaseHandle,
+            "startGrabbing": lambda pStream, maxImages, strategy: _lookup(pStream).start(maxImages, strategy),
+            "stopGrabbing": lambda pStream: _lookup(pStream).stop(),
+            "isGrabbing": lambda pStream: 1 if _lookup(pStream).grabbing else 0,
+            "getFrame": self._getFrame,
+            "setBufferCount": self._setBufferCount,
+            "attachGrabbingEx": self._attachGrabbingEx,
+            "detachGrabbingEx": self._detachGrabbingEx,
+            "setInterPacketTimeout": lambda pStream, value: 0,
+            "setSingleResendMaxPacketNum": lambda pStream, value: 0,
+            "setMaxLostPacketNum": lambda pStream, value: 0,
+            "getStatisticsInfo": self._getStatisticsInfo,
+            "resetStatisticsInfo": lambda pStream: _lookup(pStream).resetStats(),
+        }, thunks)
+        self.gigEInterfaceTemplate = _vtable(GENICAM_GigEInterface, {
+            "addRef": lambda pInterface: 0,
+            "release": self._releaseHandle,
+            "getDescription": self._cameraString("interface"),
+            "getIpAddress": self._cameraString("interfaceIp"),
+            "getSubnetMask": self._cameraString("interfaceMask"),
+            "getGateway": self._cameraString("interfaceGateway"),
+            "getMacAddress": self._cameraString("interfaceMac"),
+        }, thunks)
+        self.eventTemplate = _vtable(GENICAM_EventSubscribe, {
+            "addRef": lambda pEvent: 0,
+            "release": self._releaseHandle,
+            "subscribeConnectArgsEx": self._subscriber("connectCallbacks", True),
+            "unsubscribeConnectArgsEx": self._subscriber("connectCallbacks", False),
+            "subscribeParamUpdateEx": self._subscriber("paramCallbacks", True),
+            "unsubscribeParamUpdateEx": self._subscriber("paramCallbacks", False),
+            "subscribeStreamArgEx": self._subscriber("streamCallbacks", True),
+            "unsubscribeStreamArgEx": self._subscriber("streamCallbacks", False),
+        }, thunks)
+
+        nodeRelease = self._nodeRelease
+        nodeAddRef = self._nodeAddRef
+        self.nodeTemplates = {
+            "int": _vtable(GENICAM_IntNode, {
+                "addRef": nodeAddRef, "release": nodeRelease,
+                "getValue": self._nodeGetValue, "setValue": self._nodeSetValue,
+                "getMinVal": self._intBound(0), "getMaxVal": self._intBound(1), "getIncrement": self._intBound(2),
+                "isValid": lambda pNode: 0, "isAvailable": lambda pNode: 1,
+                "isReadable": lambda pNode: 1, "isWriteable": self._isWriteable,
+            }, thunks),
+            "double": _vtable(GENICAM_DoubleNode, {
+                "addRef": nodeAddRef, "release": nodeRelease,
+                "getValue": self._nodeGetValue, "setValue": self._nodeSetValue,
+                "getMinVal": self._doubleBound(0), "getMaxVal": self._doubleBound(1),
+                "isValid": lambda pNode: 0, "isAvailable": lambda pNode: 1,
+                "isReadable": lambda pNode: 1, "isWriteable": self._isWriteable,
+            }, thunks),
+            "enum": _vtable(GENICAM_EnumNode, {
+                "addRef": nodeAddRef, "release": nodeRelease,
+                "getValueSymbol": self._enumGetSymbol, "setValueBySymbol": self._enumSetSymbol,
+                "getEnumSymbolList": self._enumSymbolList,
+                "isValid": lambda pNode: 0, "isAvailable": lambda pNode: 1,
+                "isReadable": lambda pNode: 1, "isWriteable": self._isWriteable,
+            }, thunks),
+            "bool": _vtable(GENICAM_BoolNode, {
+                "addRef": nodeAddRef, "release": nodeRelease,
+                "getValue": self._nodeGetValue, "setValue": self._nodeSetValue,
+                "isValid": lambda pNode: 0, "isAvailable": lambda pNode: 1,
+                "isReadable": lambda pNode: 1, "isWriteable": self._isWriteable,
+            }, thunks),
+            "cmd": _vtable(GENICAM_CmdNode, {
+                "addRef": nodeAddRef, "release": nodeRelease,
+                "execute": lambda pNode: _lookup(pNode).camera.setParam(_lookup(pNode).name, None),
+                "isValid": lambda pNode: 0, "isAvailable": lambda pNode: 1,
+                "isReadable": lambda pNode: 1, "isWriteable": lambda pNode: 1,
+            }, thunks),
+        }
+
+    # 流与事件订阅对象释放时只删除句柄，对应的相机状态保留
+    # releasing a stream source or an event subscriber only drops its handle, the camera state stays
+    @staticmethod
+    def _releaseHandle(pStruct):
+        _handles.pop(pStruct.contents.priv, None)
+        return 0
+
+    # ---- system / camera ----
+    def _discovery(self, pSystem, ppCameraList, pCameraCnt, protocolType):
+        ppCameraList[0] = cast(self.cameraArray, POINTER(GENICAM_Camera))
+        pCameraCnt[0] = len(self.cameras)
+        return 0
+
+    def _getCamera(self, pSystem, key):
+        key = string_at(key)
+        for i, camera in enumerate(self.cameras):
+            if camera.strings["key"].value == key:
+                return addressof(self.cameraArray[i])
+        return 0
+
+    def _cameraString(self, name):
+        return lambda pCamera: addressof(_lookup(pCamera).strings[name])
+
+    def _connect(self, pCamera, accessPermission):
+        camera = _lookup(pCamera)
+        if not camera.online:
+            return -1
+        camera.connected = True
+        return 0
+
+    def _disConnect(self, pCamera):
+        camera = _lookup(pCamera)
+        camera.stream.stop()
+        camera.connected = False
+        return 0
+
+    # ---- stream ----
+    def _getFrame(self, pStream, ppFrame, timeout):
+        frame = _lookup(pStream).getFrame(timeout)
+        if frame is None:
+            return -1
+        ppFrame[0] = frame.pointer
+        return 0
+
+    def _setBufferCount(self, pStream, count):
+        stream = _lookup(pStream)
+        if stream.grabbing or count < 1:
+            return -1
+        stream.bufferCount = count
+        return 0
+
+    def _attachGrabbingEx(self, pStream, callback, userInfo):
+        _lookup(pStream).callbacks.append((callback, userInfo))
+        return 0
+
+    def _detachGrabbingEx(self, pStream, callback, userInfo):
+        return self._remove(_lookup(pStream).callbacks, callback)
+
+    def _getStatisticsInfo(self, pStream, ppStatsInfo):
+        stream = _lookup(pStream)
+        stats = GENICAM_StreamStatisticsInfo()
+        stats.nCameraType = GENICAM_EProtocolType.typeGigE
+        # 按 GigE 的结构体布局填写
+        # fill in the GigE layout
+        stats.u.G.imageReceived = stream.imageReceived
+        stats.u.G.lostPacketBlock = stream.lostPacketBlock
+        stats.u.G.overrideBlock = stream.overrideBlock
+        stats.u.G.fps = stream.fps
+        stats.u.G.bandwidth = stream.bandwidth
+        stream.statsInfo = stats
+        ppStatsInfo[0] = pointer(stats)
+        return 0
+
+    # ---- event subscribe ----
+    def _subscriber(self, attrName, subscribe):
+        def subscriber(pEvent, callback, userInfo):
+            callbacks = getattr(_lookup(pEvent), attrName)
+            if subscribe:
+                callbacks.append((callback, userInfo))
+                return 0
+            return self._remove(callbacks, callback)
+        return subscriber
+
+    @staticmethod
+    def _remove(callbacks, callback):
+        address = cast(callback, c_void_p).value
+        for item in callbacks:
+            if cast(item[0], c_void_p).value == address:
+                callbacks.remove(item)
+                return 0
+        return -1
+
+    # ---- nodes ----
+    def _nodeAddRef(self, pNode):
+        _lookup(pNode).refs += 1
+        return 0
+
+    def _nodeRelease(self, pNode):
+        node = _lookup(pNode)
+        node.refs -= 1
+        if node.refs == 0:
+            _handles.pop(pNode.contents.priv, None)
+        return 0
+
+    def _nodeGetValue(self, pNode, pValue):
+        node = _lookup(pNode)
+        pValue[0] = node.camera.getParam(node.name)
+        return 0
+
+    def _nodeSetValue(self, pNode, value):
+        node = _lookup(pNode)
+        return node.camera.setParam(node.name, value)
+
+    def _isWriteable(self, pNode):
+        node = _lookup(pNode)
+        return 0 if node.name in _READ_ONLY else 1
+
+    def _intBound(self, which):
+        def bound(pNode, pValue):
+            node = _lookup(pNode)
+            with node.camera._lock:
+                pValue[0] = node.camera.intRange(node.name)[which]
+            return 0
+        return bound
+
+    def _doubleBound(self, which):
+        def bound(pNode, pValue):
+            node = _lookup(pNode)
+            pValue[0] = node.camera.doubleRange(node.name)[which]
+            return 0
+        return bound
+
+    def _enumGetSymbol(self, pNode, symbol, pSymbolSize):
+        node = _lookup(pNode)
+        value = node.camera.getParam(node.name) + b"\0"
+        if pSymbolSize[0] < len(value):
+            return -1
+        memmove(symbol, value, len(value))
+        pSymbolSize[0] = len(value)
+        return 0
+
+    def _enumSetSymbol(self, pNode, symbol):
+        node = _lookup(pNode)
+        return node.camera.setParam(node.name, string_at(symbol))
+
+    def _enumSymbolList(self, pNode, pSymbols, pCount):
+        node = _lookup(pNode)
+        symbols = list(PIXEL_FORMATS) if node.name == b"PixelFormat" else _ENUM_SYMBOLS[node.name]
+        count = min(len(symbols), pCount[0]) if pCount[0] else len(symbols)
+        for i in range(count):
+            pSymbols[i].value = symbols[i]
+        pCount[0] = count
+        return 0
+
+    def _createNode(self, kind, pNodeInfo, ppNode):
+        nodeInfo = _target(pNodeInfo)
+        camera = _lookup(nodeInfo.pCamera)
+        if camera is None or camera.kinds.get(nodeInfo.attrName) != kind:
+            return -1
+        node = _instance(self.nodeTemplates[kind], SimNode(camera, nodeInfo.attrName))
+        _target(ppNode).contents = node
+        return 0
+
+    # ---- exported functions ----
+    def GENICAM_getSystemInstance(self, ppSystem):
+        _target(ppSystem).contents = self.system
+        return 0
+
+    def GENICAM_createStreamSource(self, pStreamSourceInfo, ppStreamSource):
+        camera = _lookup(_target(pStreamSourceInfo).pCamera)
+        if camera is None:
+            return -1
+        streamSource = _instance(self.streamTemplate, camera.stream)
+        _target(ppStreamSource).contents = streamSource
+        return 0
+
+    # 相机所接的网卡，描述与相机的 getInterfaceName 相同
+    # the NIC a camera is attached to, described by the same name as getInterfaceName
+    def GENICAM_createGigEInterface(self, pGigEInterfaceInfo, ppGigEInterface):
+        camera = _lookup(_target(pGigEInterfaceInfo).pCamera)
+        if camera is None:
+            return -1
+        _target(ppGigEInterface).contents = _instance(self.gigEInterfaceTemplate, camera)
+        return 0
+
+    def GENICAM_createEventSubscribe(self, pEventSubscribeInfo, ppEventSubscribe):
+        camera = _lookup(_target(pEventSubscribeInfo).pCamera)
+        if camera is None:
+            return -1
+        _target(ppEventSubscribe).contents = _instance(self.eventTemplate, camera)
+        return 0
+
+    def GENICAM_createIntNode(self, pNodeInfo, ppNode):
+        return self._createNode("int", pNodeInfo, ppNode)
+
+    def GENICAM_createDoubleNode(self, pNodeInfo, ppNode):
+        return self._createNode("double", pNodeInfo, ppNode)
+
+    def GENICAM_createEnumNode(self, pNodeInfo, ppNode):
+        return self._createNode("enum", pNodeInfo, ppNode)
+
+    def GENICAM_createBoolNode(self, pNodeInfo, ppNode):
+        return self._createNode("bool", pNodeInfo, ppNode)
+
+    def GENICAM_createCmdNode(self, pNodeInfo, ppNode):
+        return self._createNode("cmd", pNodeInfo, ppNode)
+
+    def _frameAddRef(self, pFrame):
+        _lookup(pFrame).refs += 1
+        return 0
+
+
+_SIM_VERSION = create_string_buffer(b"SimSDK 1.0")
+
+
+# 导出函数的参数为 byref(x) 或 pointer(x)，取出 x
+# exported functions receive byref(x) or pointer(x), return x
+def _target(arg):
+    obj = getattr(arg, "_obj", None)
+    return obj if obj is not None else arg.contents
+
+
+_library = None
+_libraryLock = threading.Lock()
+
+
+# 设置仿真参数，需在第一次调用 SDK 函数之前调用
+# set the simulation parameters, before the first SDK call
+def configure(**kwargs):
+    global _library
+    with _libraryLock:
+        if _library is not None:
+            raise RuntimeError("the simulated SDK is already running, configure it before the first SDK call")
+        _library = SimLibrary(SimConfig(**kwargs))
+    return _library
+
+
+# SDKLoader 调用：返回仿真库单例
+# called by SDKLoader: the simulated library singleton
+def library():
+    global _library
+    with _libraryLock:
+        if _library is None:
+            _library = SimLibrary()
+        return _library
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="stream from simulated cameras through OptCamera")
+    parser.add_argument("--cameras", type=int, default=2)
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=1024)
+    parser.add_argument("--format", default="Mono8")
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--jitter", type=float, default=0.0, help="frame arrival jitter in ms")
+    parser.add_argument("--loss", type=float, default=0.0, help="frame loss rate, 0 to 1")
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    # SDKLoader 加载的是 SimSDK 模块而不是 __main__，在该模块中设置参数
+    # SDKLoader loads the SimSDK module rather than __main__, configure that one
+    import SimSDK
+    from SDKLoader import SDK_BACKEND_ENV, SDK_BACKEND_SIM
+    os.environ[SDK_BACKEND_ENV] = SDK_BACKEND_SIM
+    SimSDK.configure(cameras=args.cameras, width=args.width, height=args.height, format=args.format, fps=args.fps,
+              jitter=args.jitter, loss=args.loss)
+
+    from OPTCamera import *
+
+    cameraCnt, cameraList = enumCameras()
+    cameras = [OptCamera(index, cameraList[index], mode=ACQ_MODE_THREAD) for index in range(cameraCnt)]
+    time.sleep(args.seconds)
+    for camera in cameras:
+        stream = SimSDK.library().cameras[camera.index].stream
+        print("camera [%d] received %d lost %d overrun %d fps %.1f bandwidth %.1f Mbit/s"
+              % (camera.index, stream.imageReceived, stream.lostPacketBlock, stream.overrideBlock,
+                 stream.fps, stream.bandwidth))
+        camera.stop_grabbing()
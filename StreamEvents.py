@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+# coding: utf-8
+'''
+Created on 2026-10-17
+
+@author:
+'''
+
+import collections
+import time
+
+from OPTSDK import *
+from SDKUtil import createEventSubscribe
+
+# 流事件类型 => 名称，计数按此顺序
+# stream event status => name, counters follow this order
+STREAM_EVENT_NAMES = collections.OrderedDict((
+    (GENICAM_EEventStatus.streamEventNormal, "normal"),
+    (GENICAM_EEventStatus.streamEventLostFrame, "lostFrame"),
+    (GENICAM_EEventStatus.streamEventLostPacket, "lostPacket"),
+    (GENICAM_EEventStatus.streamEventImageError, "imageError"),
+    (GENICAM_EEventStatus.streamEventStreamChannelError, "streamChannelError"),
+))
+
+# 默认触发钩子的事件：除 normal 以外的全部
+# events that reach the hooks by default: everything but normal
+STREAM_EVENT_FAULTS = tuple(status for status in STREAM_EVENT_NAMES
+                            if status != GENICAM_EEventStatus.streamEventNormal)
+
+# 一条流事件：status 为 GENICAM_EEventStatus，timeStamp 为 SDK 给出的时间戳，hostTime 为收到事件时的 time.time()
+# one stream event: status is a GENICAM_EEventStatus, timeStamp comes from the SDK, hostTime is time.time() on arrival
+StreamEvent = collections.namedtuple("StreamEvent", "status name channel blockId timeStamp hostTime")
+
+
+class _Hook:
+    def __init__(self, callback, minInterval, statuses):
+        self.callback = callback
+        self.minInterval = minInterval
+        self.statuses = frozenset(statuses)
+        self.lastCall = None
+        self.suppressed = 0
+
+
+class StreamEvents:
+    """
+    流事件统计：通过 subscribeStreamArgEx 订阅丢帧、丢包、图像错误等流事件，不需要轮询。
+    计数和最近事件环形缓存只由 SDK 事件线程写入，读取时不加锁；环形缓存只保存非 normal 事件，
+    读取时正好被覆盖的最旧一条可能缺失。钩子按 minInterval 限速，期间被跳过的事件数通过 suppressed 传给钩子。
+
+        streamEvents.addHook(lambda event, suppressed: print(event.name, event.blockId, suppressed), 1.0)
+        streamEvents.subscribe(camera)
+        streamEvents.counts()       # {"normal": 0, "lostFrame": 2, "lostPacket": 5, ...}
+        streamEvents.recent(10)     # 最近 10 条 StreamEvent，从旧到新
+    """
+    def __init__(self, ringSize=256):
+        self._counts = dict((status, 0) for status in STREAM_EVENT_NAMES)
+        self.unknown = 0
+        self._ring = [None] * ringSize
+        self._written = 0
+        self._hooks = []
+        self._streamCallback = streamCallBackEx(self._onStreamEvent)
+        self.subscribed = False
+
+    # 注册流事件回调
+    # subscribe stream events
+    def subscribe(self, camera):
+        eventSubscribe = createEventSubscribe(camera)
+        if eventSubscribe is None:
+            return -1
+
+        nRet = eventSubscribe.contents.subscribeStreamArgEx(eventSubscribe, self._streamCallback, None)
+        # 不再使用时，需释放相关资源
+        # release subscribe resource at the end of use
+        eventSubscribe.contents.release(eventSubscribe)
+        if nRet != 0:
+            print("subscribeStreamArgEx fail!")
+            return -1
+        self.subscribed = True
+        return 0
+
+    # 反注册流事件回调
+    # unsubscribe stream events
+    def unsubscribe(self, camera):
+        if not self.subscribed:
+            return 0
+        self.subscribed = False
+
+        eventSubscribe = createEventSubscribe(camera)
+        if eventSubscribe is None:
+            return -1
+
+        nRet = eventSubscribe.contents.unsubscribeStreamArgEx(eventSubscribe, self._streamCallback, None)
+        # 不再使用时，需释放相关资源
+        # release subscribe resource at the end of use
+        eventSubscribe.contents.release(eventSubscribe)
+        if nRet != 0:
+            print("unsubscribeStreamArgEx fail!")
+            return -1
+        return 0
+
+    # 添加钩子 callback(event, suppressed)：statuses 中的事件到达时调用，两次调用至少间隔 minInterval 秒
+    # add a hook callback(event, suppressed), called for events in statuses at most once per minInterval seconds
+    def addHook(self, callback, minInterval=1.0, statuses=STREAM_EVENT_FAULTS):
+        self._hooks = self._hooks + [_Hook(callback, minInterval, statuses)]
+
+    def removeHook(self, callback):
+        self._hooks = [hook for hook in self._hooks if hook.callback is not callback]
+
+    # 流事件回调，在 SDK 事件线程中执行
+    # stream event callback, runs on the SDK event thread
+    def _onStreamEvent(self, streamArg, userInfo):
+        arg = streamArg.contents
+        status = arg.eStreamEventStatus
+        if status in self._counts:
+            self._counts[status] += 1
+        else:
+            self.unknown += 1
+        if status == GENICAM_EEventStatus.streamEventNormal:
+            return
+
+        event = StreamEvent(status, STREAM_EVENT_NAMES.get(status, str(status)), arg.channel, arg.blockID,
+                            arg.timestamp, time.time())
+        self._ring[self._written % len(self._ring)] = event
+        self._written += 1
+
+        now = time.monotonic()
+        for hook in self._hooks:
+            if status not in hook.statuses:
+                continue
+            if hook.lastCall is not None and now - hook.lastCall < hook.minInterval:
+                hook.suppressed += 1
+                continue
+            suppressed = hook.suppressed
+            hook.lastCall = now
+            hook.suppressed = 0
+            try:
+                hook.callback(event, suppressed)
+            except Exception as e:
+                print("stream event hook fail! %s" % e)
+
+    # 各类事件的计数 {名称: 次数}
+    # event counts as {name: count}
+    def counts(self):
+        return dict((STREAM_EVENT_NAMES[status], count) for status, count in self._counts.items())
+
+    def count(self, status):
+        return self._counts.get(status, 0)
+
+    # 最近 n 条（为空时为环形缓存中的全部）非 normal 事件，从旧到新
+    # the last n (default: all buffered) non-normal events, oldest first
+    def recent(self, n=None):
+        written = self._written
+        size = len(self._ring)
+        available = min(written, size)
+        if n is None or n > available:
+            n = available
+        events = [self._ring[i % size] for i in range(written - n, written)]
+        return [event for event in events if event is not None]
+
+    def reset(self):
+        for status in self._counts:
+            self._counts[status] = 0
+        self.unknown = 0
+        self._ring = [None] * len(self._ring)
+        self._written = 0
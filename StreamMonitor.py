@@ -0,0 +1,291 @@
+#!/usr/bin/env python
+# coding: utf-8
+'''
+Created on 2026-10-17
+
+@author:
+'''
+
+import collections
+import http.server
+import threading
+import time
+
+from OPTSDK import *
+
+# 流统计中的计数器，SDK 侧可能因 resetStatisticsInfo 或重新拉流而归零，监视器累计为单调递增的总数
+# stream statistics counters; the SDK side may restart from zero, the monitor keeps monotonic totals
+STREAM_COUNTERS = ("imageReceived", "imageError", "lostPacketBlock", "overrideBlock")
+
+_CAMERA_TYPES = {
+    GENICAM_EProtocolType.typeGigE: "GigE",
+    GENICAM_EProtocolType.typeUsb3: "U3V",
+    GENICAM_EProtocolType.typeCL: "CL",
+    GENICAM_EProtocolType.typePCIe: "PCIe",
+}
+
+# Prometheus 指标：(名称, 类型, 说明, 取值)
+# Prometheus metrics as (name, type, help, value from a sample)
+_METRICS = (
+    ("optsdk_stream_up", "gauge", "1 when the last statistics poll succeeded",
+     lambda sample: 1 if sample["ok"] else 0),
+    ("optsdk_stream_fps", "gauge", "frame rate reported by the SDK",
+     lambda sample: sample["fps"]),
+    ("optsdk_stream_bandwidth", "gauge", "bandwidth reported by the SDK",
+     lambda sample: sample["bandwidth"]),
+    ("optsdk_stream_bandwidth_peak", "gauge", "highest bandwidth seen since monitoring started",
+     lambda sample: sample["bandwidthPeak"]),
+    ("optsdk_stream_images_received_total", "counter", "images received",
+     lambda sample: sample["totals"]["imageReceived"]),
+    ("optsdk_stream_image_errors_total", "counter", "incomplete or corrupt images",
+     lambda sample: sample["totals"]["imageError"]),
+    ("optsdk_stream_lost_blocks_total", "counter", "lost packet blocks",
+     lambda sample: sample["totals"]["lostPacketBlock"]),
+    ("optsdk_stream_override_blocks_total", "counter", "blocks overwritten because every buffer was in use",
+     lambda sample: sample["totals"]["overrideBlock"]),
+    ("optsdk_stream_received_rate", "gauge", "images received per second over the last interval",
+     lambda sample: sample["rates"]["imageReceived"]),
+    ("optsdk_stream_lost_rate", "gauge", "lost packet blocks per second over the last interval",
+     lambda sample: sample["rates"]["lostPacketBlock"]),
+    ("optsdk_stream_loss_ratio", "gauge", "lost / (received + lost) blocks over the last interval",
+     lambda sample: sample["lossRatio"]),
+    ("optsdk_stream_poll_errors_total", "counter", "failed statistics polls",
+     lambda sample: sample["pollErrors"]),
+)
+
+
+# 读取流统计信息，按相机类型选择结构体布局（GigE 与 U3V/PCIe 的字段偏移不同），失败返回 None
+# read the stream statistics using the layout of the camera type (GigE and U3V/PCIe differ), None on failure
+def readStreamStats(streamSource):
+    statsInfo = POINTER(GENICAM_StreamStatisticsInfo)()
+    nRet = streamSource.contents.getStatisticsInfo(streamSource, byref(statsInfo))
+    if nRet != 0 or not statsInfo:
+        return None
+    info = statsInfo.contents
+    layout = info.u.G if info.nCameraType == GENICAM_EProtocolType.typeGigE else info.u.P
+    stats = dict((name, getattr(layout, name)) for name in STREAM_COUNTERS)
+    stats["fps"] = layout.fps
+    stats["bandwidth"] = layout.bandwidth
+    stats["cameraType"] = _CAMERA_TYPES.get(info.nCameraType, str(info.nCameraType))
+    return stats
+
+
+class _StreamState:
+    """
+    一个被监视的流：上一次的原始计数、累计总数和最近的采样。
+    """
+    def __init__(self, streamSource, historySize):
+        self.streamSource = streamSource
+        self.last = None
+        self.lastTime = None
+        self.totals = dict((name, 0) for name in STREAM_COUNTERS)
+        self.bandwidthPeak = 0.0
+        self.pollErrors = 0
+        self.sample = None
+        self.history = collections.deque(maxlen=historySize)
+
+
+class StreamMonitor:
+    """
+    流统计监视器：后台线程每 interval 秒对每个相机调用一次 getStatisticsInfo，计算与上一次的差值和每秒速率。
+    结果可在进程内查询（stats()/history()/addListener()），也可通过 serve() 在本机以 Prometheus 文本格式导出。
+
+        monitor = StreamMonitor(1.0)
+        monitor.addCamera(camera)          # OptCamera，或 monitor.add("0", streamSource)
+        monitor.start()
+        monitor.serve(9464)                # http://127.0.0.1:9464/metrics
+    """
+    def __init__(self, interval=1.0, historySize=60):
+        self.interval = interval
+        self.historySize = historySize
+        self._lock = threading.Lock()
+        # 采样期间持有，remove() 返回后该流不会再被访问，可以安全释放
+        # held while polling, once remove() returns the stream is no longer touched and can be released
+        self._pollLock = threading.Lock()
+        self._streams = collections.OrderedDict()
+        self._listeners = []
+        self._thread = None
+        self._stop = threading.Event()
+        self._server = None
+        self._serverThread = None
+
+    def add(self, label, streamSource):
+        with self._lock:
+            self._streams[str(label)] = _StreamState(streamSource, self.historySize)
+
+    def addCamera(self, camera):
+        self.add(camera.index, camera.streamSource)
+
+    # 停止拉流、释放流对象之前移除
+    # remove a stream before it stops grabbing and is released
+    def remove(self, label):
+        with self._pollLock, self._lock:
+            self._streams.pop(str(label), None)
+
+    # 每次采样后在监视线程中调用 listener(label, sample)
+    # listener(label, sample) is called on the monitor thread after every poll
+    def addListener(self, listener):
+        self._listeners.append(listener)
+
+    def removeListener(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="StreamMonitor", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._serverThread.join()
+            self._server = None
+            self._serverThread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            start = time.perf_counter()
+            self.poll()
+            self._stop.wait(max(0.0, self.interval - (time.perf_counter() - start)))
+
+    # 对所有流采样一次，返回 {label: sample}；通常由监视线程调用
+    # poll every stream once and return {label: sample}; normally called by the monitor thread
+    def poll(self):
+        with self._lock:
+            streams = list(self._streams.items())
+        samples = {}
+        for label, state in streams:
+            with self._pollLock:
+                if self._streams.get(label) is not state:
+                    continue
+                sample = self._pollOne(state)
+            samples[label] = sample
+            for listener in list(self._listeners):
+                listener(label, sample)
+        return samples
+
+    def _pollOne(self, state):
+        now = time.perf_counter()
+        stats = readStreamStats(state.streamSource)
+        if stats is None:
+            state.pollErrors += 1
+            sample = dict(state.sample) if state.sample is not None else self._emptySample(state)
+            sample["ok"] = False
+            sample["pollErrors"] = state.pollErrors
+            with self._lock:
+                state.sample = sample
+            return sample
+
+        deltas = {}
+        for name in STREAM_COUNTERS:
+            value = stats[name]
+            previous = state.last[name] if state.last is not None else value
+            # 计数变小说明 SDK 侧已归零，这段时间的增量即为当前值
+            # a smaller value means the SDK counter restarted, the increment is the value itself
+            deltas[name] = value - previous if value >= previous else value
+            state.totals[name] += deltas[name]
+        elapsed = now - state.lastTime if state.lastTime is not None else 0.0
+        rates = dict((name, delta / elapsed if elapsed > 0 else 0.0) for name, delta in deltas.items())
+        blocks = deltas["imageReceived"] + deltas["lostPacketBlock"]
+        state.bandwidthPeak = max(state.bandwidthPeak, stats["bandwidth"])
+
+        sample = {
+            "ok": True,
+            "time": time.time(),
+            "interval": elapsed,
+            "cameraType": stats["cameraType"],
+            "fps": stats["fps"],
+            "bandwidth": stats["bandwidth"],
+            "bandwidthPeak": state.bandwidthPeak,
+            "counters": dict((name, stats[name]) for name in STREAM_COUNTERS),
+            "deltas": deltas,
+            "rates": rates,
+            "totals": dict(state.totals),
+            "lossRatio": deltas["lostPacketBlock"] / float(blocks) if blocks else 0.0,
+            "pollErrors": state.pollErrors,
+        }
+        with self._lock:
+            state.last = stats
+            state.lastTime = now
+            state.sample = sample
+            state.history.append(sample)
+        return sample
+
+    def _emptySample(self, state):
+        zeros = dict((name, 0) for name in STREAM_COUNTERS)
+        return {"ok": False, "time": time.time(), "interval": 0.0, "cameraType": None, "fps": 0.0,
+                "bandwidth": 0.0, "bandwidthPeak": state.bandwidthPeak, "counters": dict(zeros),
+                "deltas": dict(zeros), "rates": dict((name, 0.0) for name in STREAM_COUNTERS),
+                "totals": dict(state.totals), "lossRatio": 0.0, "pollErrors": state.pollErrors}
+
+    # 各相机最近一次采样 {label: sample}，尚未采样的相机不在其中
+    # latest sample per camera as {label: sample}, cameras not polled yet are left out
+    def stats(self):
+        with self._lock:
+            return dict((label, state.sample) for label, state in self._streams.items() if state.sample is not None)
+
+    # 某个相机最近 historySize 次成功采样，从旧到新
+    # the last historySize successful samples of one camera, oldest first
+    def history(self, label):
+        with self._lock:
+            state = self._streams.get(str(label))
+            return list(state.history) if state is not None else []
+
+    # Prometheus 文本格式（0.0.4）
+    # Prometheus text exposition format 0.0.4
+    def prometheusText(self):
+        samples = self.stats()
+        lines = []
+        for name, metricType, description, value in _METRICS:
+            lines.append("# HELP %s %s" % (name, description))
+            lines.append("# TYPE %s %s" % (name, metricType))
+            for label, sample in samples.items():
+                lines.append('%s{camera="%s"} %s' % (name, _escapeLabel(label), _formatValue(value(sample))))
+        return "\n".join(lines) + "\n"
+
+    # 在 host:port 上提供 /metrics，默认只监听本机；port 为 0 时由系统分配，返回实际端口
+    # serve /metrics on host:port, localhost only by default; port 0 picks a free port, the port is returned
+    def serve(self, port=9464, host="127.0.0.1"):
+        if self._server is not None:
+            return self._server.server_address[1]
+        monitor = self
+
+        class MetricsHandler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+                body = monitor.prometheusText().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = http.server.ThreadingHTTPServer((host, port), MetricsHandler)
+        self._server.daemon_threads = True
+        self._serverThread = threading.Thread(target=self._server.serve_forever, name="StreamMonitor-http",
+                                              daemon=True)
+        self._serverThread.start()
+        return self._server.server_address[1]
+
+
+def _escapeLabel(value):
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _formatValue(value):
+    if isinstance(value, float):
+        return repr(value)
+    return str(value)
@@ -0,0 +1,322 @@
+#!/usr/bin/env python
+# coding: utf-8
+'''
+Created on 2026-10-17
+
+@author:
+'''
+
+import datetime
+import json
+import os
+import sys
+import threading
+import time
+
+from OPTCamera import *
+from StreamMonitor import readStreamStats
+
+# 流对象上可调的传输参数 => 设置函数
+# transport knobs on the stream source => their setter
+_STREAM_SETTERS = {
+    "interPacketTimeout": "setInterPacketTimeout",
+    "singleResendMaxPacketNum": "setSingleResendMaxPacketNum",
+    "maxLostPacketNum": "setMaxLostPacketNum",
+}
+
+
+class TransportTuner:
+    """
+    GigE 传输参数自动调节：每 interval 秒读取一次流统计中的 lostPacketBlock / imageError，
+    丢包率 (lost + error) / (received + lost) 高于 targetLoss 时成倍增大包间隔 GevSCPD（并按需加大重传包数、
+    丢包上限和包超时），连续 settleIntervals 个周期达标后按 delayStep 逐步减小 GevSCPD 以收回带宽，
+    不再减到最近一次超标时的值（相当于对吞吐量做加性增、乘性减）。
+
+    setInterPacketTimeout / setSingleResendMaxPacketNum / setMaxLostPacketNum 没有读取接口，
+    只有给出 (初始值, 上限) 时才由调节器管理，否则保持不变。每次修改都打印并记录在 changes 中，
+    saveProfile() 按相机序列号保存调好的参数，applyProfile() 在下次启动时直接使用。
+
+        tuner = TransportTuner(camera, targetLoss=0.001, singleResend=(16, 256))
+        tuner.start()
+        ...
+        tuner.stop()
+        tuner.saveProfile("transport_profiles.json")
+    """
+    def __init__(self, camera, targetLoss=0.001, interval=2.0, minFrames=50, delayStep=500, minDelay=None,
+                 maxDelay=None, settleIntervals=3, interPacketTimeout=None, singleResend=None, maxLost=None):
+        self.camera = camera
+        self.targetLoss = targetLoss
+        self.interval = interval
+        self.minFrames = minFrames
+        self.delayStep = delayStep
+        self.settleIntervals = settleIntervals
+        self.minDelay, self.maxDelay = self._delayRange(minDelay, maxDelay)
+
+        # 流对象上的参数：名称 => [当前值, 上限, 设置函数名]，当前值为空表示尚未写入
+        # stream source knobs: name => [current, limit, setter], current is None until written
+        self.streamKnobs = {}
+        for name, limits in (("interPacketTimeout", interPacketTimeout), ("singleResendMaxPacketNum", singleResend),
+                             ("maxLostPacketNum", maxLost)):
+            if limits is not None:
+                self.streamKnobs[name] = [limits[0], limits[1], _STREAM_SETTERS[name]]
+
+        self.changes = []
+        self.lossRate = None
+        self.lastBadDelay = None
+        self._goodIntervals = 0
+        self._baseline = None
+        self._thread = None
+        self._stop = threading.Event()
+
+    # GevSCPD 的范围：未指定时取节点的最小/最大值
+    # GevSCPD range, taken from the node when not given
+    def _delayRange(self, minDelay, maxDelay):
+        node = self.camera.nodeCache.get(NODE_INT, b"GevSCPD")
+        if node is not None:
+            value = c_longlong()
+            if minDelay is None and node.contents.getMinVal(node, byref(value)) == 0:
+                minDelay = value.value
+            if maxDelay is None and node.contents.getMaxVal(node, byref(value)) == 0:
+                maxDelay = value.value
+        return minDelay or 0, maxDelay if maxDelay is not None else 100000
+
+    @property
+    def serial(self):
+        serial = self.camera.camera.getSerialNumber(self.camera.camera)
+        return serial.decode() if isinstance(serial, bytes) else str(serial)
+
+    @property
+    def delay(self):
+        return self.camera.getIntValue(b"GevSCPD")
+
+    # 写入流对象参数的初始值
+    # write the initial values of the managed stream source knobs
+    def applyStreamKnobs(self):
+        nRet = 0
+        for name, (value, limit, setter) in self.streamKnobs.items():
+            if self._setStreamKnob(name, value) != 0:
+                nRet = -1
+        return nRet
+
+    def _setStreamKnob(self, name, value):
+        streamSource = self.camera.streamSource
+        nRet = getattr(streamSource.contents, self.streamKnobs[name][2])(streamSource, c_uint(value))
+        if nRet != 0:
+            print("%s fail!" % self.streamKnobs[name][2])
+            return -1
+        self.streamKnobs[name][0] = value
+        return 0
+
+    def _change(self, knob, old, new, reason):
+        if knob == "GevSCPD":
+            nRet = self.camera.setIntValue(b"GevSCPD", new)
+        else:
+            nRet = self._setStreamKnob(knob, new)
+        if nRet != 0:
+            return -1
+        self.changes.append({"time": time.time(), "knob": knob, "old": old, "new": new,
+                             "loss": self.lossRate, "reason": reason})
+        print("camera [%d] %s %s -> %s (loss %.5f, %s)" % (self.camera.index, knob, old, new, self.lossRate, reason))
+        return 0
+
+    # 执行一个调节周期：读取流统计，样本足够时判断并调整参数；返回本周期的丢包率，样本不足或读取失败时返回 None
+    # run one control step: read the statistics and, with enough samples, adjust the knobs.
+    # Returns the loss rate of the step, None while samples are too few or on failure
+    def step(self):
+        stats = readStreamStats(self.camera.streamSource)
+        if stats is None:
+            print("getStatisticsInfo fail!")
+            return None
+        if stats["cameraType"] != "GigE":
+            print("camera [%d] is %s, only GigE transport is tuned" % (self.camera.index, stats["cameraType"]))
+            return None
+        if self._baseline is None:
+            self._baseline = stats
+            return None
+
+        received = stats["imageReceived"] - self._baseline["imageReceived"]
+        lost = stats["lostPacketBlock"] - self._baseline["lostPacketBlock"]
+        errors = stats["imageError"] - self._baseline["imageError"]
+        if received < 0 or lost < 0 or errors < 0:
+            # SDK 侧计数已归零，重新开始统计
+            # the SDK counters restarted, start over
+            self._baseline = stats
+            return None
+        # 样本至少要能容纳一次目标丢包，否则单个丢包就会被判为超标
+        # the sample must hold at least one loss at the target rate, or a single loss always reads as too many
+        if received + lost < max(self.minFrames, 1.0 / self.targetLoss if self.targetLoss > 0 else 0):
+            return None
+
+        self.lossRate = (lost + errors) / float(received + lost)
+        self._baseline = stats
+        delay = self.delay
+        if delay is None:
+            return None
+
+        if self.lossRate > self.targetLoss:
+            self._goodIntervals = 0
+            self.lastBadDelay = delay
+            changed = False
+            newDelay = min(max(delay * 2, delay + self.delayStep), self.maxDelay)
+            if newDelay != delay:
+                changed = self._change("GevSCPD", delay, newDelay, "loss above target") == 0
+            if lost > 0:
+                for name in ("singleResendMaxPacketNum", "maxLostPacketNum"):
+                    changed = self._escalate(name, "packets lost") or changed
+            if errors > 0:
+                changed = self._escalate("interPacketTimeout", "incomplete images") or changed
+            # 参数变化后的第一个周期不计入
+            # the interval right after a change is not judged
+            if changed:
+                self._baseline = None
+            return self.lossRate
+
+        self._goodIntervals += 1
+        # 长时间达标后不再受上一次超标值的限制，重新向下试探
+        # after a long good run the last bad delay no longer bounds the search
+        if self._goodIntervals >= 4 * self.settleIntervals:
+            self.lastBadDelay = None
+        if self._goodIntervals >= self.settleIntervals and delay > self.minDelay:
+            newDelay = max(delay - self.delayStep, self.minDelay)
+            if self.lastBadDelay is None or newDelay > self.lastBadDelay:
+                if self._change("GevSCPD", delay, newDelay, "loss below target") == 0:
+                    self._goodIntervals = 0
+                    self._baseline = None
+        return self.lossRate
+
+    def _escalate(self, name, reason):
+        knob = self.streamKnobs.get(name)
+        if knob is None or knob[0] >= knob[1]:
+            return False
+        return self._change(name, knob[0], min(knob[0] * 2, knob[1]), reason) == 0
+
+    # 达标且 GevSCPD 已无法再减小
+    # on target and GevSCPD can not go any lower
+    @property
+    def converged(self):
+        if self.lossRate is None or self.lossRate > self.targetLoss or self._goodIntervals < self.settleIntervals:
+            return False
+        delay = self.delay
+        return delay is not None and (delay <= self.minDelay or
+                                      (self.lastBadDelay is not None and delay - self.delayStep <= self.lastBadDelay))
+
+    def start(self):
+        if self._thread is not None:
+            return
+        if self.applyStreamKnobs() != 0:
+            print("camera [%d] some transport knobs could not be written" % self.camera.index)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="TransportTuner-%d" % self.camera.index,
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.step()
+
+    # 调好的参数
+    # the tuned settings
+    def profile(self):
+        profile = {
+            "serial": self.serial,
+            "GevSCPD": self.delay,
+            "lossRate": self.lossRate,
+            "targetLoss": self.targetLoss,
+            "tunedAt": datetime.datetime.now().isoformat(timespec="seconds"),
+        }
+        for name, (value, limit, setter) in self.streamKnobs.items():
+            profile[name] = value
+        return profile
+
+    # 按序列号写入 path（JSON，{序列号: 参数}），保留文件中其他相机的参数
+    # store the profile under the camera serial in path ({serial: profile} JSON), other cameras are kept
+    def saveProfile(self, path):
+        profiles = loadProfiles(path)
+        profile = self.profile()
+        profiles[profile["serial"]] = profile
+        tmpPath = path + ".tmp"
+        with open(tmpPath, "w") as f:
+            json.dump(profiles, f, indent=2, sort_keys=True)
+        os.replace(tmpPath, path)
+        return profile
+
+    # 写入 path 中该相机序列号对应的参数，没有时返回 -1
+    # apply the profile stored for this camera's serial, -1 when there is none
+    def applyProfile(self, path):
+        profile = loadProfiles(path).get(self.serial)
+        if profile is None:
+            print("camera [%d] has no transport profile in %s" % (self.camera.index, path))
+            return -1
+        nRet = 0
+        if profile.get("GevSCPD") is not None and self.camera.setIntValue(b"GevSCPD", profile["GevSCPD"]) != 0:
+            nRet = -1
+        for name in ("interPacketTimeout", "singleResendMaxPacketNum", "maxLostPacketNum"):
+            if profile.get(name) is None:
+                continue
+            if name not in self.streamKnobs:
+                self.streamKnobs[name] = [profile[name], profile[name], _STREAM_SETTERS[name]]
+            if self._setStreamKnob(name, profile[name]) != 0:
+                nRet = -1
+        return nRet
+
+
+# 读取参数文件，不存在时返回空字典
+# read a profile file, an empty dict when it does not exist
+def loadProfiles(path):
+    if not os.path.isfile(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="tune the GigE transport of every camera to a target loss rate")
+    parser.add_argument("--target", type=float, default=0.001, help="target loss rate, 0 to 1")
+    parser.add_argument("--interval", type=float, default=2.0, help="control interval in seconds")
+    parser.add_argument("--seconds", type=float, default=60.0, help="stop after this long unless all converge")
+    parser.add_argument("--step", type=int, default=500, help="GevSCPD decrease step")
+    parser.add_argument("--resend", type=int, nargs=2, metavar=("START", "MAX"), default=None,
+                        help="manage setSingleResendMaxPacketNum")
+    parser.add_argument("--max-lost", type=int, nargs=2, metavar=("START", "MAX"), default=None,
+                        help="manage setMaxLostPacketNum")
+    parser.add_argument("--timeout", type=int, nargs=2, metavar=("START", "MAX"), default=None,
+                        help="manage setInterPacketTimeout")
+    parser.add_argument("--profile", default="transport_profiles.json", help="profile file keyed by serial number")
+    parser.add_argument("--apply", action="store_true", help="apply the saved profiles instead of tuning")
+    args = parser.parse_args()
+
+    cameraCnt, cameraList = enumCameras()
+    if cameraCnt is None:
+        print("Can't find camera")
+        sys.exit(1)
+
+    # 采集线程持续取图，调节期间流保持满负荷
+    # acquisition threads keep the streams busy while tuning
+    cameras = [OptCamera(index, cameraList[index], mode=ACQ_MODE_THREAD) for index in range(cameraCnt)]
+    tuners = [TransportTuner(camera, args.target, args.interval, delayStep=args.step, interPacketTimeout=args.timeout,
+                             singleResend=args.resend, maxLost=args.max_lost) for camera in cameras]
+    if args.apply:
+        for tuner in tuners:
+            tuner.applyProfile(args.profile)
+    else:
+        for tuner in tuners:
+            tuner.start()
+        deadline = time.time() + args.seconds
+        while time.time() < deadline and not all(tuner.converged for tuner in tuners):
+            time.sleep(args.interval)
+        for tuner in tuners:
+            tuner.stop()
+            profile = tuner.saveProfile(args.profile)
+            print("camera [%d] %s converged: %s, profile %s" % (tuner.camera.index, tuner.serial, tuner.converged,
+                                                                profile))
+    for camera in cameras:
+        camera.stop_grabbing()
@@ -0,0 +1,523 @@
+#!/usr/bin/env python
+# coding: utf-8
+'''
+Created on 2026-10-17
+
+@author:
+
+取图吞吐与时延基准：按 相机数 x 像素格式 x 分辨率 x 取图方式 的组合逐个运行，每个组合在独立的子进程中，
+默认使用 SimSDK 仿真相机（OPTSDK_BACKEND=sim），不需要硬件。每个组合测量：
+    帧率（总帧率及每个相机）、每帧时延 p50/p99/p99.9（帧生成时间戳到使用者拿到图像，仅仿真后端）、
+    每帧拷贝/转码耗时、每帧整帧拷贝次数与整帧数组分配次数、每个相机的 CPU 占用（Linux 下按线程统计）。
+取图方式：
+    poll      每个相机一个使用者线程 grab_frame + 缓存池拷贝/转码，即 MultiCamera.run 去掉显示后的循环（get_image 去掉每帧日志）
+    thread    ACQ_MODE_THREAD，采集线程发布最新帧，使用者线程逐帧 latestSlot.getInfo
+    callback  ACQ_MODE_CALLBACK，SDK 回调入队、工作线程转码后调用 consumer
+结果写为 JSON，--baseline 与之前的结果比较，帧率下降、时延/CPU 上升超过 --threshold（%）或拷贝/分配次数增加时
+列出并以返回码 1 退出。
+acquisition throughput and latency benchmark over cameras x pixel formats x resolutions x modes, every
+combination in its own child process, on SimSDK simulated cameras by default (no hardware needed). Measured per
+combination: frames/s (total and per camera), per-frame latency p50/p99/p99.9 from the frame time stamp to the
+consumer holding the image (simulated backend only), copy/convert time per frame, full-frame copies and
+full-frame array allocations per frame, and CPU per camera (per thread on Linux). Results are written as JSON;
+--baseline compares against an earlier run and exits with 1 on regressions.
+
+usage: python benchmarks/bench_acquisition.py [--cameras 1 4 16] [--formats Mono8 BayerRG8]
+           [--resolutions 640x480 1920x1080] [--modes poll thread callback] [--fps 1000] [--seconds 2]
+           [--output result.json] [--baseline baseline.json] [--threshold 10]
+       python benchmarks/bench_acquisition.py --load result.json --baseline baseline.json
+'''
+
+import argparse
+import contextlib
+import datetime
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import threading
+import time
+
+import numpy
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from GcMonitor import *
+from OPTCamera import *
+from OPTFrame import OptFrame
+from SDKLoader import SDK_BACKEND_DLL, SDK_BACKEND_ENV, SDK_BACKEND_SIM, sdkBackend
+
+MODES = (ACQ_MODE_POLL, ACQ_MODE_THREAD, ACQ_MODE_CALLBACK)
+MAX_CAMERAS = 16
+
+# 越大越好的指标，其余越小越好；拷贝/分配次数是按绝对值比较的计数
+# metrics where higher is better, the rest are lower-is-better; copies/allocations are compared as counts
+_HIGHER_BETTER = ("fps",)
+_COUNT_METRICS = ("copiesPerFrame", "allocationsPerFrame")
+_COMPARED = ("fps", "latencyP50", "latencyP99", "latencyP999", "convertP50", "cpuPerFrame") + _COUNT_METRICS
+
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+_THREAD_CAMERA = re.compile(r"^(?:OptCamera|bench)-(\d+)")
+_THREAD_SIM = re.compile(r"^SimCamera-(\d+)-stream")
+
+
+class Recorder:
+    """
+    一个相机的使用者侧统计：测量窗口内的帧数与每帧时延（纳秒）。
+    """
+    def __init__(self, timed):
+        self.timed = timed
+        self.measuring = False
+        self.frames = 0
+        self.skipped = 0
+        self.latencies = []
+
+    def record(self, timeStamp):
+        if not self.measuring:
+            return
+        self.frames += 1
+        if self.timed:
+            self.latencies.append(time.perf_counter_ns() - timeStamp)
+
+
+class CopyCounter:
+    """
+    统计整帧（不小于 minBytes）的拷贝与数组分配次数，以及 OptFrame.copy_to 每次的耗时。
+    通过替换 OptFrame.copy_to 和 numpy.copyto/empty/zeros/empty_like 实现，copy_to 内部的 numpy.copyto 不重复计数。
+    """
+    def __init__(self, minBytes):
+        self.minBytes = minBytes
+        self.measuring = False
+        self.copies = 0
+        self.allocations = 0
+        self.convertTimes = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._saved = []
+
+    def install(self):
+        counter = self
+        copyTo = OptFrame.copy_to
+        copyto = numpy.copyto
+
+        def countedCopyTo(frame, out=None):
+            counter._local.inside = True
+            start = time.perf_counter_ns()
+            try:
+                return copyTo(frame, out)
+            finally:
+                elapsed = time.perf_counter_ns() - start
+                counter._local.inside = False
+                if counter.measuring:
+                    counter.convertTimes.append(elapsed)
+                    counter._count(copies=1)
+
+        def countedCopyto(dst, src, *args, **kwargs):
+            copyto(dst, src, *args, **kwargs)
+            if counter.measuring and not getattr(counter._local, "inside", False) \
+                    and getattr(dst, "nbytes", 0) >= counter.minBytes:
+                counter._count(copies=1)
+
+        def countedAlloc(alloc):
+            def allocate(*args, **kwargs):
+                array = alloc(*args, **kwargs)
+                if counter.measuring and array.nbytes >= counter.minBytes:
+                    counter._count(allocations=1)
+                return array
+            return allocate
+
+        self._patch(OptFrame, "copy_to", countedCopyTo)
+        self._patch(numpy, "copyto", countedCopyto)
+        for name in ("empty", "zeros", "empty_like"):
+            self._patch(numpy, name, countedAlloc(getattr(numpy, name)))
+
+    def uninstall(self):
+        while self._saved:
+            owner, name, value = self._saved.pop()
+            setattr(owner, name, value)
+
+    def _patch(self, owner, name, value):
+        self._saved.append((owner, name, getattr(owner, name)))
+        setattr(owner, name, value)
+
+    def _count(self, copies=0, allocations=0):
+        with self._lock:
+            self.copies += copies
+            self.allocations += allocations
+
+
+# 各线程累计 CPU 时间（秒），按线程名；读不到 /proc 时返回 None
+# accumulated CPU seconds per thread name, None without /proc
+def threadCpuTimes():
+    names = dict((thread.native_id, thread.name) for thread in threading.enumerate())
+    taskDir = "/proc/self/task"
+    if not os.path.isdir(taskDir):
+        return None
+    times = {}
+    for tid in os.listdir(taskDir):
+        try:
+            with open(os.path.join(taskDir, tid, "stat")) as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+        name = names.get(int(tid), "native-%s" % tid)
+        times[name] = times.get(name, 0.0) + (int(fields[11]) + int(fields[12])) / float(_CLOCK_TICKS)
+    return times
+
+
+# 按线程名把 CPU 时间归到相机、仿真器和其他
+# attribute thread CPU time to cameras, the simulator and the rest
+def splitCpu(start, end, cameras):
+    perCamera = [0.0] * cameras
+    simulator = 0.0
+    other = 0.0
+    for name, seconds in end.items():
+        used = seconds - start.get(name, 0.0)
+        match = _THREAD_CAMERA.match(name)
+        if match and int(match.group(1)) < cameras:
+            perCamera[int(match.group(1))] += used
+            continue
+        if _THREAD_SIM.match(name):
+            simulator += used
+        else:
+            other += used
+    return perCamera, simulator, other
+
+
+def percentiles(values, scale):
+    if not values:
+        return None
+    array = numpy.asarray(values, dtype=numpy.float64) / scale
+    p50, p99, p999 = numpy.percentile(array, (50.0, 99.0, 99.9))
+    return {"p50": float(p50), "p99": float(p99), "p999": float(p999), "max": float(array.max()), "mean": float(array.mean())}
+
+
+def pollLoop(camera, recorder, running):
+    while running.is_set():
+        optFrame = camera.grab_frame(1000)
+        if optFrame is None:
+            continue
+        with optFrame:
+            image = camera._convertToPool(optFrame)
+        if image is None:
+            continue
+        timing = camera.frameTiming
+        if timing is not None:
+            timing.consumed(image)
+        recorder.record(optFrame.timeStamp)
+        camera.release_image(image)
+
+
+def threadLoop(camera, recorder, running):
+    lastSeq = None
+    while running.is_set():
+        image, seq, blockId, timeStamp = camera.latestSlot.getInfo(lastSeq, 0.2)
+        if image is None:
+            continue
+        if lastSeq is not None and recorder.measuring:
+            recorder.skipped += seq - lastSeq - 1
+        lastSeq = seq
+        timing = camera.frameTiming
+        if timing is not None:
+            timing.consumed(image)
+        recorder.record(timeStamp)
+        camera.release_image(image)
+
+
+# 子进程中运行一个组合，返回结果字典
+# run one combination in the child process, returns the result dict
+def runCase(case):
+    simulated = sdkBackend() == SDK_BACKEND_SIM
+    cameraCnt = case["cameras"]
+    width, height = case["width"], case["height"]
+    if simulated:
+        import SimSDK
+        simLibrary = SimSDK.configure(cameras=cameraCnt, width=width, height=height, format=case["format"],
+                                      fps=case["fps"])
+
+    found, cameraList = enumCameras()
+    if found is None or found < cameraCnt:
+        raise RuntimeError("%s cameras found, %d needed" % (found, cameraCnt))
+
+    config = {"PixelFormat": case["format"], "Width": width, "Height": height,
+              "AcquisitionFrameRate": case["fps"], "ExposureTime": case["exposure"]}
+    cameras = []
+    for index in range(cameraCnt):
+        camera = OptCamera(index, cameraList[index], mode=ACQ_MODE_POLL)
+        nRet, timings = camera.apply_config(config)
+        if nRet != 0:
+            raise RuntimeError("camera [%d] apply_config fail" % index)
+        if case["timing"]:
+            camera.enable_timing()
+        cameras.append(camera)
+
+    recorders = [Recorder(simulated) for _ in cameras]
+    running = threading.Event()
+    running.set()
+    threads = []
+    for camera, recorder in zip(cameras, recorders):
+        if case["mode"] == ACQ_MODE_CALLBACK:
+            def consumer(image, blockId, timeStamp, camera=camera, recorder=recorder):
+                recorder.record(timeStamp)
+                camera.release_image(image)
+            if camera.start_callback(case["workers"], consumer=consumer) != 0:
+                raise RuntimeError("camera [%d] start_callback fail" % camera.index)
+            continue
+        if case["mode"] == ACQ_MODE_THREAD:
+            camera.start_acquisition()
+            target = threadLoop
+        else:
+            target = pollLoop
+        threads.append(threading.Thread(target=target, args=(camera, recorder, running),
+                                        name="bench-%d" % camera.index, daemon=True))
+    for thread in threads:
+        thread.start()
+
+    # 预热后开始计数：先冻结启动阶段的对象，与取图程序一致
+    # start counting after the warm up, with startup objects frozen as the grabbing programs do
+    freezeAfterStartup()
+    counter = CopyCounter(width * height)
+    counter.install()
+    gcMonitor = GcMonitor()
+    time.sleep(case["warmup"])
+
+    if simulated:
+        for simCamera in simLibrary.cameras[:cameraCnt]:
+            simCamera.stream.resetStats()
+    for camera in cameras:
+        if camera.frameTiming is not None:
+            camera.frameTiming.reset()
+    poolAllocated = [camera.framePool.allocated for camera in cameras]
+    cpuStart = threadCpuTimes()
+    processStart = time.process_time()
+    blocksStart = sys.getallocatedblocks()
+    gcMonitor.start()
+    for recorder in recorders:
+        recorder.measuring = True
+    counter.measuring = True
+    start = time.perf_counter()
+
+    time.sleep(case["seconds"])
+
+    counter.measuring = False
+    for recorder in recorders:
+        recorder.measuring = False
+    elapsed = time.perf_counter() - start
+    gcMonitor.stop()
+    blocksEnd = sys.getallocatedblocks()
+    processCpu = time.process_time() - processStart
+    cpuEnd = threadCpuTimes()
+    poolAllocated = [camera.framePool.allocated - allocated for camera, allocated in zip(cameras, poolAllocated)]
+    streams = None
+    if simulated:
+        streams = [{"received": simCamera.stream.imageReceived, "lost": simCamera.stream.lostPacketBlock,
+                    "overrun": simCamera.stream.overrideBlock}
+                   for simCamera in simLibrary.cameras[:cameraCnt]]
+
+    running.clear()
+    for thread in threads:
+        thread.join()
+    for camera in cameras:
+        camera.stop_grabbing()
+    counter.uninstall()
+
+    frames = sum(recorder.frames for recorder in recorders)
+    perFrame = 1.0 / frames if frames else 0.0
+    latency = percentiles([value for recorder in recorders for value in recorder.latencies], 1e6) \
+        if simulated else None
+    convert = percentiles(counter.convertTimes, 1e6)
+    if cpuStart is not None and cpuEnd is not None:
+        cpuPerCamera, simulatorCpu, otherCpu = splitCpu(cpuStart, cpuEnd, cameraCnt)
+    else:
+        # 没有按线程的 CPU 时间时按相机数平均分配进程 CPU 时间
+        # without per-thread CPU times the process CPU time is split evenly
+        cpuPerCamera, simulatorCpu, otherCpu = [processCpu / cameraCnt] * cameraCnt, None, None
+
+    return {
+        "frames": frames,
+        "seconds": elapsed,
+        "fps": frames / elapsed,
+        "fpsPerCamera": [recorder.frames / elapsed for recorder in recorders],
+        "latencyMs": latency,
+        "convertMs": convert,
+        "copiesPerFrame": counter.copies * perFrame,
+        "allocationsPerFrame": counter.allocations * perFrame,
+        "poolAllocations": poolAllocated,
+        "blocksPerFrame": (blocksEnd - blocksStart) * perFrame,
+        "gcCollections": gcMonitor.stats()["counts"],
+        "cpu": {
+            "percentPerCamera": [100.0 * seconds / elapsed for seconds in cpuPerCamera],
+            "msPerFrame": 1000.0 * sum(cpuPerCamera) * perFrame,
+            "processPercent": 100.0 * processCpu / elapsed,
+            "simulatorPercent": None if simulatorCpu is None else 100.0 * simulatorCpu / elapsed,
+            "otherPercent": None if otherCpu is None else 100.0 * otherCpu / elapsed,
+        },
+        "consumerSkipped": sum(recorder.skipped for recorder in recorders),
+        "callbackDropped": sum(camera.droppedFrames for camera in cameras),
+        "streams": streams,
+        "stages": [camera.timing_stats() for camera in cameras] if case["timing"] else None,
+    }
+
+
+# 在子进程中运行一个组合，取图代码的日志输出被丢弃，结果为最后一行 JSON
+# run one combination in a child process; the grabbing code's log output is dropped, the result is the last line
+def runChild(case, backend, timeout):
+    env = dict(os.environ)
+    env[SDK_BACKEND_ENV] = backend
+    command = [sys.executable, os.path.abspath(__file__), "--child", json.dumps(case)]
+    try:
+        result = subprocess.run(command, env=env, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return {"error": "timeout after %ds" % timeout}
+    lines = result.stdout.strip().splitlines()
+    if result.returncode != 0 or not lines:
+        return {"error": (result.stderr.strip().splitlines() or ["exit code %d" % result.returncode])[-1]}
+    return json.loads(lines[-1])
+
+
+def caseKey(case):
+    return "%s/%dcam/%s/%dx%d" % (case["mode"], case["cameras"], case["format"], case["width"], case["height"])
+
+
+def metrics(result):
+    values = {
+        "fps": result.get("fps"),
+        "copiesPerFrame": result.get("copiesPerFrame"),
+        "allocationsPerFrame": result.get("allocationsPerFrame"),
+        "cpuPerFrame": (result.get("cpu") or {}).get("msPerFrame"),
+        "convertP50": (result.get("convertMs") or {}).get("p50"),
+    }
+    latency = result.get("latencyMs") or {}
+    values["latencyP50"] = latency.get("p50")
+    values["latencyP99"] = latency.get("p99")
+    values["latencyP999"] = latency.get("p999")
+    return values
+
+
+# 与基线比较，返回回归列表：(组合, 指标, 基线值, 当前值, 变化%)
+# compare with a baseline, returns the regressions as (combination, metric, baseline, current, change %)
+def compareResults(baseline, current, threshold):
+    baselineResults = dict((caseKey(result["case"]), result) for result in baseline["results"])
+    regressions = []
+    for result in current["results"]:
+        key = caseKey(result["case"])
+        if key not in baselineResults or "error" in result or "error" in baselineResults[key]:
+            continue
+        before = metrics(baselineResults[key])
+        after = metrics(result)
+        for name in _COMPARED:
+            old, new = before[name], after[name]
+            if old is None or new is None:
+                continue
+            if name in _COUNT_METRICS:
+                # 计数类指标：每帧多出 0.05 次以上即视为回归
+                # counts: more than 0.05 extra per frame is a regression
+                if new - old > 0.05:
+                    regressions.append((key, name, old, new, None))
+                continue
+            if old <= 0:
+                continue
+            change = 100.0 * (new - old) / old
+            if (name in _HIGHER_BETTER and change < -threshold) or (name not in _HIGHER_BETTER and change > threshold):
+                regressions.append((key, name, old, new, change))
+    return regressions
+
+
+def printResult(result):
+    key = caseKey(result["case"])
+    if "error" in result:
+        print("%-34s %s" % (key, result["error"]))
+        return
+    latency = result["latencyMs"]
+    latencyText = "%6.2f %6.2f %7.2f" % (latency["p50"], latency["p99"], latency["p999"]) if latency else "%22s" % "n/a"
+    cpu = result["cpu"]["percentPerCamera"]
+    print("%-34s %8.1f %7.1f  %s  %5.2f %5.2f %6.2f  %5.1f" % (
+        key, result["fps"], result["fps"] / result["case"]["cameras"], latencyText,
+        result["convertMs"]["p50"] if result["convertMs"] else 0.0,
+        result["copiesPerFrame"], result["allocationsPerFrame"], sum(cpu) / len(cpu)))
+
+
+def parseResolution(text):
+    width, height = text.lower().split("x")
+    return int(width), int(height)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="acquisition throughput and latency benchmark")
+    parser.add_argument("--cameras", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--formats", nargs="+", default=["Mono8", "BayerRG8"],
+                        help="GenICam pixel format symbols")
+    parser.add_argument("--resolutions", nargs="+", default=["640x480", "1920x1080"])
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--fps", type=float, default=1000.0, help="frame rate asked from each camera")
+    parser.add_argument("--exposure", type=float, default=None,
+                        help="ExposureTime in us, by default short enough not to limit --fps")
+    parser.add_argument("--timing", action="store_true", help="record per-frame stage timing (FrameTiming)")
+    parser.add_argument("--workers", type=int, default=1, help="worker threads per camera in callback mode")
+    parser.add_argument("--seconds", type=float, default=2.0, help="measured time per combination")
+    parser.add_argument("--warmup", type=float, default=0.5)
+    parser.add_argument("--backend", choices=(SDK_BACKEND_SIM, SDK_BACKEND_DLL), default=SDK_BACKEND_SIM)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--load", help="compare results from this JSON file instead of running")
+    parser.add_argument("--baseline", help="JSON results of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=10.0, help="allowed change in percent")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        case = json.loads(args.child)
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            result = runCase(case)
+        print(json.dumps(result))
+        sys.exit(0)
+
+    if args.load:
+        with open(args.load) as f:
+            current = json.load(f)
+    else:
+        for cameras in args.cameras:
+            if not 1 <= cameras <= MAX_CAMERAS:
+                parser.error("--cameras must be between 1 and %d" % MAX_CAMERAS)
+        exposure = args.exposure if args.exposure is not None else max(10.0, 0.5e6 / args.fps)
+        current = {
+            "meta": {
+                "date": datetime.datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "numpy": numpy.__version__,
+                "backend": args.backend,
+                "cpuCount": os.cpu_count(),
+            },
+            "results": [],
+        }
+        print("%-34s %8s %7s  %6s %6s %7s  %5s %5s %6s  %5s" % (
+            "mode/cameras/format/size", "fps", "fps/cam", "p50", "p99", "p99.9", "conv", "copy", "alloc", "cpu%"))
+        timeout = int(args.seconds + args.warmup + 60)
+        for mode in args.modes:
+            for cameras in args.cameras:
+                for pixelFormat in args.formats:
+                    for resolution in args.resolutions:
+                        width, height = parseResolution(resolution)
+                        case = {"mode": mode, "cameras": cameras, "format": pixelFormat, "width": width,
+                                "height": height, "fps": args.fps, "exposure": exposure, "workers": args.workers,
+                                "timing": args.timing, "seconds": args.seconds, "warmup": args.warmup}
+                        result = runChild(case, args.backend, timeout)
+                        result["case"] = case
+                        current["results"].append(result)
+                        printResult(result)
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(current, f, indent=2)
+            print("results written to %s" % args.output)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compareResults(baseline, current, args.threshold)
+        for key, name, old, new, change in regressions:
+            changeText = "" if change is None else " (%+.1f%%)" % change
+            print("REGRESSION %-34s %-20s %10.3f -> %10.3f%s" % (key, name, old, new, changeText))
+        print("%d regressions against %s" % (len(regressions), args.baseline))
+        sys.exit(1 if regressions else 0)
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# coding: utf-8
+'''
+Created on 2026-10-16
+
+@author:
+
+对比 ImageConvert.dll、OpenCV、NumPy 三种后端把拜耳图像转码为 BGR24 的耗时，输入为随机生成的拜耳数据，不需要相机。
+compare the dll, OpenCV and NumPy backends converting Bayer images to BGR24, on synthetic data without a camera.
+
+usage: python benchmarks/bench_convert.py [--width 2448] [--height 2048] [--frames 100] [--format BayRG8 BayRG12]
+'''
+
+import argparse
+import os
+import sys
+import time
+
+import numpy
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from ImageConvert import *
+from OPTSDK import *
+from PixelConvert import *
+from PixelUnpack import PACKED_FORMATS
+
+
+def benchOne(pixelFormat, width, height, frames, backend):
+    pattern, bits = BAYER_FORMATS[pixelFormat]
+    if pixelFormat in PACKED_FORMATS:
+        occupyBits = (pixelFormat & GVSP_PIX_EFFECTIVE_PIXEL_SIZE_MASK) >> GVSP_PIX_EFFECTIVE_PIXEL_SIZE_SHIFT
+        mosaic = numpy.random.randint(0, 256, width * height * occupyBits // 8, dtype=numpy.uint8)
+    elif bits == 8:
+        mosaic = numpy.random.randint(0, 256, (height, width), dtype=numpy.uint8)
+    else:
+        mosaic = numpy.random.randint(0, 1 << bits, (height, width), dtype=numpy.uint16)
+
+    params = IMGCNV_SOpenParam()
+    params.width = width
+    params.height = height
+    params.paddingX = 0
+    params.paddingY = 0
+    params.dataSize = mosaic.nbytes
+    params.pixelForamt = pixelFormat
+    out = numpy.empty((height, width, 3), dtype=numpy.uint8)
+
+    # 预热一次
+    # warm up once
+    if convertToBGR24(mosaic.ctypes.data, params, out, backend) is None:
+        return None
+    start = time.perf_counter()
+    for _ in range(frames):
+        convertToBGR24(mosaic.ctypes.data, params, out, backend)
+    return (time.perf_counter() - start) / frames
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--width", type=int, default=2448)
+    parser.add_argument("--height", type=int, default=2048)
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument("--format", nargs="+", default=["BayRG8", "BayRG12"],
+                        help="pixel formats without the gvspPixel prefix")
+    args = parser.parse_args()
+
+    for name in args.format:
+        pixelFormat = getattr(EPixelType, "gvspPixel" + name)
+        print("---- %s %dx%d ----" % (name, args.width, args.height))
+        for backend in availableBackends(pixelFormat):
+            elapsed = benchOne(pixelFormat, args.width, args.height, args.frames, backend)
+            if elapsed is None:
+                print("%-8s convert fail" % backend)
+                continue
+            print("%-8s %7.2f ms/frame  %7.1f fps" % (backend, elapsed * 1000, 1.0 / elapsed))
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# coding: utf-8
+'''
+Created on 2026-10-16
+
+@author:
+
+测量每帧读取元数据（尺寸、像素格式、BlockId、时间戳、缓存地址）的 Python 侧开销：
+逐个通过 frame.contents.<fn>(frame) 调用，与使用每个流缓存一次的 FrameAccessors/FrameView 对比。
+帧的函数指针指向一个不做任何事的本地函数，不需要相机，测得的只是 ctypes 调用路径本身的耗时。
+measure the Python side cost of reading the per-frame metadata (size, pixel format, block id, time stamp,
+buffer address): one frame.contents.<fn>(frame) call per field against FrameAccessors/FrameView resolved
+once per stream. The frame function pointers target a native no-op, no camera is needed, so only the
+ctypes call path itself is timed.
+
+usage: python benchmarks/bench_frame.py [--frames 100000] [--repeat 5]
+'''
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from ImageConvert import *
+from OPTFrame import *
+from OPTSDK import *
+
+
+# 构造一个所有函数指针都指向本地空操作函数的帧（多出的参数被忽略，返回值无意义）
+# a frame whose function pointers all target a native no-op (the extra argument is ignored,
+# the results are meaningless)
+def fakeFrame():
+    noop = cast(pythonapi.Py_IsInitialized, c_void_p).value
+    contents = GENICAM_Frame()
+    for name, funcType in GENICAM_Frame._fields_:
+        if name != "reserved":
+            setattr(contents, name, funcType(noop))
+    return pointer(contents)
+
+
+# 原来的读法：每个字段都经过 frame.contents 和结构体字段查找
+# the previous way: every field goes through frame.contents and a struct field lookup
+def readLegacy(frame):
+    params = IMGCNV_SOpenParam()
+    params.dataSize = frame.contents.getImageSize(frame)
+    params.height = frame.contents.getImageHeight(frame)
+    params.width = frame.contents.getImageWidth(frame)
+    params.paddingX = frame.contents.getImagePaddingX(frame)
+    params.paddingY = frame.contents.getImagePaddingY(frame)
+    params.pixelForamt = frame.contents.getImagePixelFormat(frame)
+    blockId = frame.contents.getBlockId(frame)
+    timeStamp = frame.contents.getImageTimeStamp(frame)
+    imageBuff = frame.contents.getImage(frame)
+    return params, blockId, timeStamp, imageBuff
+
+
+# 取多轮中最快的一轮，减少调度抖动的影响
+# best of several rounds, to keep scheduling noise out
+def bench(func, frames, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(frames):
+            func()
+        elapsed = (time.perf_counter() - start) / frames
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--frames", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    frame = fakeFrame()
+    accessors = FrameAccessors(frame)
+    cases = [
+        ("frame.contents", lambda: readLegacy(frame)),
+        ("FrameView", lambda: FrameView(frame, accessors)),
+        ("FrameView+params", lambda: FrameView(frame, accessors).params()),
+        ("OptFrame", lambda: OptFrame(frame, accessors)),
+    ]
+    baseline = None
+    for name, func in cases:
+        elapsed = bench(func, args.frames, args.repeat)
+        if baseline is None:
+            baseline = elapsed
+        print("%-18s %7.2f us/frame  %5.2fx" % (name, elapsed * 1e6, baseline / elapsed))
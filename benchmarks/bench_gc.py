@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# coding: utf-8
+'''
+Created on 2026-10-16
+
+@author:
+
+对比每帧调用 gc.collect() 与启动后 gc.freeze() 两种方式下多相机的取图帧率。
+compare multi-camera frame rate with a per-frame gc.collect() against gc.freeze() after startup.
+
+usage: python benchmarks/bench_gc.py [--cameras 4] [--seconds 10]
+'''
+
+import argparse
+import gc
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from GcMonitor import *
+from OPTCamera import *
+
+
+# 与 get_image() 相同的拷贝路径（缓存池取缓存、copy_to、归还），但不逐帧打印，避免控制台输出影响帧率
+# the same copy path as get_image() (pool buffer, copy_to, release) without its per-frame print,
+# so console output does not skew the frame rate
+def grabImage(camera):
+    optFrame = camera.grab_frame()
+    if optFrame is None:
+        return None
+    with optFrame:
+        image = camera.framePool.acquire(optFrame.params.pixelForamt,
+                                         optFrame.params.width, optFrame.params.height)
+        if image is None:
+            return None
+        if optFrame.copy_to(image) is None:
+            camera.framePool.release(image)
+            return None
+    return image
+
+
+def grabLoop(camera, seconds, collect, frames):
+    deadline = time.perf_counter() + seconds
+    count = 0
+    while time.perf_counter() < deadline:
+        cvImage = grabImage(camera)
+        if cvImage is None:
+            break
+        camera.release_image(cvImage)
+        if collect:
+            gc.collect()
+        count += 1
+    frames[camera.index] = count
+
+
+def runOnce(cameras, seconds, collect):
+    frames = {}
+    threads = [threading.Thread(target=grabLoop, args=(camera, seconds, collect, frames)) for camera in cameras]
+    gcMonitor = GcMonitor()
+    gcMonitor.start()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    gcMonitor.stop()
+    return frames, gcMonitor.stats()
+
+
+def report(title, frames, stats, seconds):
+    total = sum(frames.values())
+    print("---- %s ----" % title)
+    for index in sorted(frames):
+        print("camera [%d] fps: %.1f" % (index, frames[index] / seconds))
+    print("total fps: %.1f" % (total / seconds))
+    print("gc collections: %s, gc time: %.1f ms, max pause: %.2f ms"
+          % (stats["counts"], sum(stats["totalTime"]) * 1000, stats["maxTime"] * 1000))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cameras", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    args = parser.parse_args()
+
+    cameraCnt, cameras_info = enumCameras()
+    if cameraCnt is None:
+        sys.exit(1)
+    cameras = [OptCamera(index, cameras_info[index]) for index in range(min(cameraCnt, args.cameras))]
+
+    frames, stats = runOnce(cameras, args.seconds, collect=True)
+    report("gc.collect() per frame", frames, stats, args.seconds)
+
+    freezeAfterStartup()
+    frames, stats = runOnce(cameras, args.seconds, collect=False)
+    report("gc.freeze() after startup", frames, stats, args.seconds)
+
+    for camera in cameras:
+        camera.stop_grabbing()
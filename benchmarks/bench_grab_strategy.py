@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# coding: utf-8
+'''
+Created on 2026-10-17
+
+@author:
+
+取流策略基准：一个相机以 --fps 出图，使用者每帧 grab_frame 后处理 --work 毫秒（默认比帧间隔慢），
+依次在 sequential/latest/upcoming 策略与 --buffers 给出的缓存个数、以及 GRAB_PRESETS 的各预设下
+（运行中用 set_grab_strategy 切换）测量：
+    使用者帧率、帧龄 p50/p99/max（帧时间戳到 grab_frame 返回；仿真后端为绝对值，真实相机按纳秒时间戳、
+    相对于最年轻的一帧）、丢帧率（相机产生而使用者没有拿到的帧，按 BlockId 的间隔统计）。
+默认使用 SimSDK 仿真相机，不需要硬件。
+grab strategy benchmark: one camera delivers --fps while the consumer spends --work ms on every frame it
+grabs (slower than the frame period by default). For sequential/latest/upcoming at each --buffers count and for
+every GRAB_PRESETS entry (switched at runtime with set_grab_strategy) it measures the consumer frame rate,
+the frame age p50/p99/max from the frame time stamp to grab_frame returning (absolute on the simulated
+backend; relative to the youngest frame and assuming ns stamps on real cameras), and the share of frames the
+camera produced that the consumer never saw, from BlockId gaps. Runs on SimSDK simulated cameras by default.
+
+usage: python benchmarks/bench_grab_strategy.py [--fps 100] [--work 12] [--buffers 2 8 32] [--seconds 3]
+           [--output result.json]
+'''
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+
+import numpy
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from OPTCamera import *
+from SDKLoader import SDK_BACKEND_DLL, SDK_BACKEND_ENV, SDK_BACKEND_SIM, sdkBackend
+
+STRATEGIES = (GRAB_SEQUENTIAL, GRAB_LATEST, GRAB_UPCOMING)
+
+
+# 在当前策略下取图 warmup + seconds 秒，只统计 warmup 之后的帧
+# grab for warmup + seconds under the current strategy, frames during the warmup are not counted
+def measure(camera, work, seconds, warmup, timeout):
+    ages = []
+    firstId = lastId = None
+    start = time.perf_counter()
+    measureFrom = start + warmup
+    end = measureFrom + seconds
+    while time.perf_counter() < end:
+        optFrame = camera.grab_frame(timeout)
+        now = time.perf_counter_ns()
+        if optFrame is None:
+            continue
+        with optFrame:
+            blockId = optFrame.blockId
+            timeStamp = optFrame.timeStamp
+        if time.perf_counter() >= measureFrom:
+            if firstId is None:
+                firstId = blockId
+            lastId = blockId
+            ages.append(now - timeStamp)
+        # 模拟使用者处理一帧
+        # the consumer working on the frame
+        time.sleep(work)
+    return ages, firstId, lastId
+
+
+def runCase(camera, name, strategy, bufferCount, args, relative):
+    if camera.set_grab_strategy(strategy, bufferCount) != 0:
+        raise RuntimeError("set_grab_strategy %s/%s fail" % (strategy, bufferCount))
+    ages, firstId, lastId = measure(camera, args.work / 1000.0, args.seconds, args.warmup,
+                                    int(max(1000, 4000 / args.fps)))
+    if not ages:
+        return {"case": name, "strategy": strategy, "buffers": bufferCount, "consumed": 0}
+    ages = numpy.array(ages, dtype=numpy.float64)
+    if relative:
+        ages -= ages.min()
+    produced = lastId - firstId + 1
+    return {
+        "case": name,
+        "strategy": strategy,
+        "buffers": bufferCount,
+        "consumed": len(ages),
+        "fps": len(ages) / args.seconds,
+        "ageP50": float(numpy.percentile(ages, 50)) / 1e6,
+        "ageP99": float(numpy.percentile(ages, 99)) / 1e6,
+        "ageMax": float(ages.max()) / 1e6,
+        "dropped": max(0, produced - len(ages)) / float(produced),
+    }
+
+
+def printResult(result):
+    if not result["consumed"]:
+        print("%-28s no frames" % result["case"])
+        return
+    print("%-28s %7.1f  %8.1f %8.1f %8.1f  %6.1f%%" % (
+        result["case"], result["fps"], result["ageP50"], result["ageP99"], result["ageMax"],
+        result["dropped"] * 100))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="frame age / drop trade-off of the SDK grab strategies")
+    parser.add_argument("--fps", type=float, default=100.0, help="frame rate asked from the camera")
+    parser.add_argument("--work", type=float, default=12.0, help="consumer time per frame in ms")
+    parser.add_argument("--buffers", type=int, nargs="+", default=[2, 8, 32], help="SDK buffer counts to try")
+    parser.add_argument("--strategies", nargs="+", choices=STRATEGIES, default=list(STRATEGIES))
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=1024)
+    parser.add_argument("--seconds", type=float, default=3.0, help="measured time per case")
+    parser.add_argument("--warmup", type=float, default=1.0, help="time per case before measuring")
+    parser.add_argument("--backend", choices=(SDK_BACKEND_SIM, SDK_BACKEND_DLL), default=SDK_BACKEND_SIM)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    args = parser.parse_args()
+
+    # 动态库在第一次调用时才加载，此时设置后端仍然有效
+    # the library is loaded on the first call, so choosing the backend here still takes effect
+    os.environ[SDK_BACKEND_ENV] = args.backend
+    simulated = sdkBackend() == SDK_BACKEND_SIM
+    if simulated:
+        import SimSDK
+        SimSDK.configure(cameras=1, width=args.width, height=args.height, fps=args.fps)
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        cameraCnt, cameraList = enumCameras()
+        if cameraCnt is None:
+            raise RuntimeError("no camera found")
+        camera = OptCamera(0, cameraList[0], mode=ACQ_MODE_POLL)
+        nRet, timings = camera.apply_config({"AcquisitionFrameRate": args.fps,
+                                             "ExposureTime": max(10.0, 0.5e6 / args.fps)})
+        if nRet != 0:
+            raise RuntimeError("apply_config fail")
+
+    cases = [("%s/%d" % (strategy, bufferCount), strategy, bufferCount)
+             for strategy in args.strategies for bufferCount in args.buffers]
+    cases += [("%s (%s/%d)" % (preset, strategy, bufferCount), strategy, bufferCount)
+              for preset, (bufferCount, strategy) in GRAB_PRESETS.items()]
+
+    print("camera %.0f fps (%.1f ms), consumer %.1f ms per frame" % (args.fps, 1000.0 / args.fps, args.work))
+    print("%-28s %7s  %8s %8s %8s  %7s" % ("strategy/buffers", "fps", "age p50", "age p99", "age max", "dropped"))
+    results = []
+    try:
+        for name, strategy, bufferCount in cases:
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                result = runCase(camera, name, strategy, bufferCount, args, not simulated)
+            results.append(result)
+            printResult(result)
+    finally:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            camera.stop_grabbing()
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"fps": args.fps, "work": args.work, "results": results}, f, indent=2)
+        print("results written to %s" % args.output)
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# coding: utf-8
+'''
+Created on 2026-10-16
+
+@author:
+
+测量各模块在新进程中的 import 耗时（每个工作进程启动时都要付出），以及 SDK 动态库第一次加载的耗时。
+子进程在临时目录中启动，同时验证 import 不依赖当前目录。
+measure the import time of each module in a fresh process, paid by every worker process on start, and the
+time of the first SDK library load. Children start in a temporary directory, which also checks that importing
+does not depend on the working directory.
+
+usage: python benchmarks/bench_import.py [--repeat 10] [--module OPTSDK ImageConvert PixelConvert OPTCamera]
+'''
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+REPO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+
+# 子进程中执行：输出 import 耗时（秒），以及动态库加载耗时（找不到库时为 -1）
+# run in the child: prints the import time in seconds and the library load time, -1 without the library
+_CHILD = '''
+import sys, time
+sys.path.insert(0, %r)
+start = time.perf_counter()
+import %s
+imported = time.perf_counter() - start
+loaded = -1.0
+if %r:
+    from OPTSDK import OPTSDKdll
+    if OPTSDKdll.available():
+        start = time.perf_counter()
+        OPTSDKdll.load()
+        loaded = time.perf_counter() - start
+print(imported, loaded)
+'''
+
+
+def benchOne(module, repeat, withLoad, cwd):
+    imports = []
+    loads = []
+    for _ in range(repeat):
+        code = _CHILD % (os.path.abspath(REPO_DIR), module, withLoad)
+        result = subprocess.run([sys.executable, "-c", code], cwd=cwd, capture_output=True, text=True)
+        if result.returncode != 0:
+            print("%-14s import fail:\n%s" % (module, result.stderr.strip()))
+            return None
+        imported, loaded = map(float, result.stdout.split())
+        imports.append(imported)
+        loads.append(loaded)
+    imports.sort()
+    loads.sort()
+    return imports[len(imports) // 2], loads[len(loads) // 2]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--module", nargs="+", default=["OPTSDK", "ImageConvert", "PixelConvert", "OPTCamera"])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cwd:
+        for i, module in enumerate(args.module):
+            result = benchOne(module, args.repeat, i == 0, cwd)
+            if result is None:
+                continue
+            imported, loaded = result
+            line = "%-14s import %7.2f ms" % (module, imported * 1000)
+            if i == 0:
+                line += "   OPTSDK load %s" % ("%7.2f ms" % (loaded * 1000) if loaded >= 0 else "n/a (library not found)")
+            print(line)
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# coding: utf-8
+'''
+Created on 2026-10-17
+
+@author:
+
+PixelUnpack 的正确性测试：用按格式定义逐位实现的参考打包函数生成已知的位模式，
+检查每个解包函数还原出完全相同的像素值（包括奇数宽度和带行填充的逐行解包）。
+correctness tests for PixelUnpack: reference packers written bit by bit from the format definitions
+produce known bit patterns, every unpacker must give back exactly the same pixels (odd widths and
+row-by-row unpacking with row padding included).
+'''
+
+import os
+import sys
+
+import numpy
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from PixelUnpack import *
+
+
+# GigE Vision 10Packed / 12Packed：2 个像素 3 字节，高位在 b0/b2，低位在 b1 的两个半字节
+# GigE Vision 10Packed / 12Packed, 2 pixels in 3 bytes: high bits in b0/b2, low bits in the nibbles of b1
+def packGigE(pixels, bits):
+    lowBits = bits - 8
+    lowMask = (1 << lowBits) - 1
+    packed = bytearray()
+    for p0, p1 in zip(pixels[0::2], pixels[1::2]):
+        packed += bytes((p0 >> lowBits, (p0 & lowMask) | (p1 & lowMask) << 4, p1 >> lowBits))
+    return packed
+
+
+# GenICam PFNC 10p / 12p：LSB 优先的连续位流
+# GenICam PFNC 10p / 12p, an LSB-first bit stream
+def packPfnc(pixels, bits):
+    packed = bytearray()
+    acc = 0
+    accBits = 0
+    for p in pixels:
+        acc |= p << accBits
+        accBits += bits
+        while accBits >= 8:
+            packed.append(acc & 0xFF)
+            acc >>= 8
+            accBits -= 8
+    if accBits:
+        packed.append(acc & 0xFF)
+    return packed
+
+
+# (解包函数, 参考打包函数, 有效位数, 每组像素数)
+# (unpacker, reference packer, significant bits, pixels per group)
+CASES = [
+    (unpack10Packed, packGigE, 10, 2),
+    (unpack12Packed, packGigE, 12, 2),
+    (unpack10p, packPfnc, 10, 4),
+    (unpack12p, packPfnc, 12, 2),
+]
+CASE_IDS = ["10Packed", "12Packed", "10p", "12p"]
+
+
+def pattern(count, bits, seed=0):
+    values = numpy.random.RandomState(seed).randint(0, 1 << bits, count)
+    # 全 0、全 1 和交替位放在最前面
+    # all zeros, all ones and alternating bits come first
+    fixed = [0, (1 << bits) - 1, int("01" * bits, 2) >> bits, int("10" * bits, 2) >> bits]
+    values[:min(count, len(fixed))] = fixed[:count]
+    return [int(value) for value in values]
+
+
+def toArray(packed):
+    return numpy.frombuffer(bytes(packed), dtype=numpy.uint8)
+
+
+@pytest.mark.parametrize("unpacker, packer, bits, group", CASES, ids=CASE_IDS)
+@pytest.mark.parametrize("width, height", [(8, 4), (640, 3), (5, 4), (7, 4), (1, 8)])
+def test_unpack_matches_reference(unpacker, packer, bits, group, width, height):
+    count = width * height
+    if count % group != 0:
+        pytest.skip("pixel count is not a whole number of groups")
+    pixels = pattern(count, bits, width)
+    out = numpy.zeros((height, width), dtype=numpy.uint16)
+    unpacker(toArray(packer(pixels, bits)), out)
+    assert out.reshape(-1).tolist() == pixels
+
+
+@pytest.mark.parametrize("unpacker, packer, bits, group", CASES, ids=CASE_IDS)
+def test_unpack_odd_width_across_rows(unpacker, packer, bits, group):
+    # 宽度为奇数时一组像素跨越行边界，打包数据是整幅图像连续的位流
+    # with an odd width a group straddles the row boundary, the packed data runs continuously over the image
+    width, height = 13, 4 * group
+    pixels = pattern(width * height, bits, 1)
+    out = numpy.zeros((height, width), dtype=numpy.uint16)
+    unpacker(toArray(packer(pixels, bits)), out)
+    assert out.reshape(-1).tolist() == pixels
+
+
+@pytest.mark.parametrize("unpacker, packer, bits, group", CASES, ids=CASE_IDS)
+def test_unpack_rows_with_padding(unpacker, packer, bits, group):
+    # 每行末尾有填充字节时逐行解包：行数据为源数组的切片，起始偏移不为 0，填充字节不得影响结果
+    # row padding, unpacked row by row: each row is a slice with a non-zero offset, the padding must not leak in
+    width, height, padding = 12, 5, 7
+    rows = [pattern(width, bits, 10 + row) for row in range(height)]
+    packed = bytearray()
+    for row in rows:
+        packed += packer(row, bits) + bytes([0xA5]) * padding
+    src = toArray(packed)
+    rowBytes = len(packer(rows[0], bits))
+    stride = rowBytes + padding
+    out = numpy.zeros((height, width), dtype=numpy.uint16)
+    for row in range(height):
+        unpacker(src[row * stride:row * stride + rowBytes], out[row])
+    assert out.tolist() == rows
+
+
+@pytest.mark.parametrize("pixelFormat", sorted(PACKED_FORMATS))
+def test_unpack_dispatch(pixelFormat):
+    unpacker, bits = PACKED_FORMATS[pixelFormat]
+    packer = packPfnc if unpacker in (unpack10p, unpack12p) else packGigE
+    pixels = pattern(16, bits, 2)
+    out = numpy.zeros(16, dtype=numpy.uint16)
+    unpack(pixelFormat, toArray(packer(pixels, bits)), out)
+    assert out.tolist() == pixels
+
+
+def test_unpack_rejects_bad_arguments():
+    src = numpy.zeros(30, dtype=numpy.uint8)
+    with pytest.raises(ValueError):
+        unpack12Packed(src, numpy.zeros(3, dtype=numpy.uint16))
+    with pytest.raises(ValueError):
+        unpack10p(src, numpy.zeros(6, dtype=numpy.uint16))
+    with pytest.raises(ValueError):
+        unpack12p(src[:2], numpy.zeros(2, dtype=numpy.uint16))
+    with pytest.raises(ValueError):
+        unpack12p(src, numpy.zeros(2, dtype=numpy.uint32))
+    with pytest.raises(ValueError):
+        unpack(EPixelType.gvspPixelMono8, src, numpy.zeros(2, dtype=numpy.uint16))